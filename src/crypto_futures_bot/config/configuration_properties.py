@@ -3,13 +3,30 @@ from __future__ import annotations
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from crypto_futures_bot.constants import (
+    DEFAULT_COMPOSITE_OPERATION_TIMEOUT_SECONDS,
     DEFAULT_CURRENCY_CODE,
     DEFAULT_FUTURES_EXCHANGE_TIMEOUT,
+    DEFAULT_FUTURES_MARKETS_REFRESH_INTERVAL_SECONDS,
+    DEFAULT_INDICATORS_CONVERGENCE_TOLERANCE,
     DEFAULT_JOB_INTERVAL_SECONDS,
     DEFAULT_MARKET_SIGNAL_RETENTION_DAYS,
+    DEFAULT_MARKET_STREAM_MAX_AGE_SECONDS,
+    DEFAULT_METRICS_HISTOGRAM_SIZE,
+    DEFAULT_METRICS_SUMMARY_INTERVAL_SECONDS,
+    DEFAULT_ORDER_FILL_TIMEOUT_SECONDS,
+    DEFAULT_SIGNALS_CANDLE_CLOSE_DELAY_SECONDS,
+    DEFAULT_SIGNALS_MAX_CONCURRENCY,
+    DEFAULT_SIGNALS_SYMBOL_TIMEOUT_SECONDS,
+    DEFAULT_SPOT_PRICES_MAX_AGE_MS,
     DEFAULT_SQLITE_BUSY_TIMEOUT,
+    DEFAULT_TECHNICAL_ANALYSIS_CACHE_MAX_SIZE,
+    DEFAULT_TECHNICAL_ANALYSIS_CACHE_TTL_SECONDS,
+    DEFAULT_TECHNICAL_ANALYSIS_MAX_CONCURRENCY,
+    DEFAULT_TICKER_MAX_AGE_MS,
+    MEXC_MARKET_STREAM_URL,
     MEXC_WEB_API_BASE_URL,
 )
+from crypto_futures_bot.domain.types import Timeframe
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.enums import FuturesExchangeEnum
 
 
@@ -29,11 +46,26 @@ class ConfigurationProperties(BaseSettings):
 
     futures_exchange: FuturesExchangeEnum = FuturesExchangeEnum.MEXC
     futures_exchange_timeout: int = DEFAULT_FUTURES_EXCHANGE_TIMEOUT
+    # Shared deadline of the independent exchange calls a composite operation fans out
+    composite_operation_timeout_seconds: float = DEFAULT_COMPOSITE_OPERATION_TIMEOUT_SECONDS
+    # Deadline for a market order to be confirmed as filled
+    order_fill_timeout_seconds: float = DEFAULT_ORDER_FILL_TIMEOUT_SECONDS
     futures_exchange_debug_mode: bool = False
     mexc_web_api_base_url: str = MEXC_WEB_API_BASE_URL
     mexc_web_auth_token: str | None = None
     mexc_api_key: str | None = None
     mexc_api_secret: str | None = None
+    # Staleness budget of the tickers for dashboards and hints, orders are always placed on fresh ones
+    ticker_max_age_ms: int = DEFAULT_TICKER_MAX_AGE_MS
+    # Staleness budget of the spot prices the held assets are valued with
+    spot_prices_max_age_ms: int = DEFAULT_SPOT_PRICES_MAX_AGE_MS
+    futures_markets_refresh_interval_seconds: int = DEFAULT_FUTURES_MARKETS_REFRESH_INTERVAL_SECONDS
+    # Local snapshot of the markets metadata, restored at startup and revalidated in the background
+    market_snapshot_path: str | None = None
+    # Streaming of tickers and candles over WebSocket, read before the REST API
+    market_stream_enabled: bool = False
+    mexc_market_stream_url: str = MEXC_MARKET_STREAM_URL
+    market_stream_max_age_seconds: float = DEFAULT_MARKET_STREAM_MAX_AGE_SECONDS
 
     currency_code: str = DEFAULT_CURRENCY_CODE
 
@@ -41,6 +73,24 @@ class ConfigurationProperties(BaseSettings):
     background_tasks_enabled: bool = True
     job_interval_seconds: int = DEFAULT_JOB_INTERVAL_SECONDS
     signals_run_via_cron_pattern: bool = True
+    signals_run_on_candle_close: bool = False
+    signals_candle_close_delay_seconds: int = DEFAULT_SIGNALS_CANDLE_CLOSE_DELAY_SECONDS
+    signals_intra_candle_check_enabled: bool = True
+    signals_max_concurrency: int = DEFAULT_SIGNALS_MAX_CONCURRENCY
+    signals_symbol_timeout_seconds: float = DEFAULT_SIGNALS_SYMBOL_TIMEOUT_SECONDS
+    signals_coalescing_window_seconds: float = 0.0
+    # Sized from the indicators convergence tolerance when it is not set
+    ohlcv_buffer_size: int | None = None
+    indicators_convergence_tolerance: float = DEFAULT_INDICATORS_CONVERGENCE_TOLERANCE
+    ohlcv_warm_up_validation_enabled: bool = False
+    ohlcv_base_timeframe: Timeframe | None = None
+    technical_analysis_max_concurrency: int = DEFAULT_TECHNICAL_ANALYSIS_MAX_CONCURRENCY
+    technical_analysis_cache_ttl_seconds: float = DEFAULT_TECHNICAL_ANALYSIS_CACHE_TTL_SECONDS
+    # Disabled when zero
+    technical_analysis_cache_max_size: int = DEFAULT_TECHNICAL_ANALYSIS_CACHE_MAX_SIZE
+    metrics_histogram_size: int = DEFAULT_METRICS_HISTOGRAM_SIZE
+    # Interval of the latency summary in the logs, disabled when zero
+    metrics_summary_interval_seconds: int = DEFAULT_METRICS_SUMMARY_INTERVAL_SECONDS
 
     market_signal_retention_days: int = DEFAULT_MARKET_SIGNAL_RETENTION_DAYS
 
@@ -4,8 +4,28 @@ DEFAULT_SQLITE_BUSY_TIMEOUT = 30  # 30 seconds
 TELEGRAM_REPLY_EXCEPTION_MESSAGE_MAX_LENGTH = 3_000
 DEFAULT_CURRENCY_CODE = "USDT"
 DEFAULT_FUTURES_EXCHANGE_TIMEOUT = 30_000  # 30 seconds
+DEFAULT_COMPOSITE_OPERATION_TIMEOUT_SECONDS = 30  # 30 seconds
+DEFAULT_ORDER_FILL_TIMEOUT_SECONDS = 30  # 30 seconds
+# Adaptive polling of the market orders until they are filled, doubling the delay every time
+ORDER_FILL_POLL_MIN_DELAY_SECONDS = 0.05
+ORDER_FILL_POLL_MAX_DELAY_SECONDS = 1.0
+DEFAULT_TICKER_MAX_AGE_MS = 3_000
+DEFAULT_SPOT_PRICES_MAX_AGE_MS = 60_000
+DEFAULT_FUTURES_MARKETS_REFRESH_INTERVAL_SECONDS = 60 * 60  # 1 hour
 STABLE_COINS = [DEFAULT_CURRENCY_CODE, "USDC"]
 DEFAULT_JOB_INTERVAL_SECONDS = 5  # 5 seconds
+DEFAULT_TIMEFRAME = "15m"
+DEFAULT_SIGNALS_MAX_CONCURRENCY = 8
+DEFAULT_SIGNALS_SYMBOL_TIMEOUT_SECONDS = 30  # 30 seconds
+DEFAULT_SIGNALS_CANDLE_CLOSE_DELAY_SECONDS = 3  # 3 seconds
+DEFAULT_INDICATORS_CONVERGENCE_TOLERANCE = 1e-4
+# Long history fetched when validating the warm-up, in multiples of the OHLCV buffer size
+OHLCV_WARM_UP_VALIDATION_MULTIPLIER = 4
+DEFAULT_TECHNICAL_ANALYSIS_MAX_CONCURRENCY = 8
+DEFAULT_TECHNICAL_ANALYSIS_CACHE_TTL_SECONDS = 60  # 1 minute
+DEFAULT_TECHNICAL_ANALYSIS_CACHE_MAX_SIZE = 256
+DEFAULT_METRICS_HISTOGRAM_SIZE = 1_024
+DEFAULT_METRICS_SUMMARY_INTERVAL_SECONDS = 300  # 5 minutes
 DEFAULT_IN_MEMORY_CACHE_TTL_IN_SECONDS = 86_400  # 1 day
 DEFAULT_ATR_SL_MULT = 2.5
 DEFAULT_ATR_TP_MULT = 3.8
@@ -40,10 +60,20 @@ MEXC_WEB_API_DEFAULT_HEADERS = {
     "x-language": "en-US",
 }
 MEXC_FUTURES_TAKER_FEES = 0.0004
+MEXC_FUTURES_MAINTENANCE_MARGIN_RATE = 0.01
+MEXC_MARKET_STREAM_URL = "wss://contract.mexc.com/edge"
+# XXX: MEXC drops the connection when no ping is received within a minute
+MEXC_MARKET_STREAM_PING_INTERVAL_SECONDS = 15
+MEXC_KLINE_INTERVALS = {"1m": "Min1", "5m": "Min5", "15m": "Min15", "1h": "Min60", "4h": "Hour4"}
+DEFAULT_MARKET_STREAM_MAX_AGE_SECONDS = 5.0
+MARKET_STREAM_CANDLES_HISTORY_SIZE = 16
+MARKET_STREAM_RECONNECT_MIN_DELAY_SECONDS = 1
+MARKET_STREAM_RECONNECT_MAX_DELAY_SECONDS = 30
 DEFAULT_MARKET_SIGNAL_RETENTION_DAYS = 5
 
 YES_NO_VALUES = ["Yes", "No"]
 SL_MULTIPLIERS = [2.5, 2.8, 3.0, 3.2]
+SIGNALS_TIMEFRAMES_VALUES = ["15m", "5m", "1h", "5m,15m", "15m,1h", "5m,15m,1h"]
 TP_MULTIPLIERS = [3.0, 3.5, 3.8, 4.0, 4.2, 4.5]
 
 DEFAULT_LONG_ENTRY_OVERSOLD_THRESHOLD = 0.35
@@ -1,4 +1,8 @@
-from typing import Literal
+from typing import Literal, Protocol
 
 Timeframe = Literal["4h", "1h", "15m", "5m", "3m", "1m"]
 MarketSignalType = Literal["buy", "sell"]
+
+
+class LatencyRecorder(Protocol):
+    def __call__(self, stage: str, elapsed_seconds: float, *, symbol: str | None = None) -> None: ...
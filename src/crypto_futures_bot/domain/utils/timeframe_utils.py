@@ -0,0 +1,86 @@
+from datetime import datetime
+from typing import Any
+
+from crypto_futures_bot.domain.types import Timeframe
+
+_TIMEFRAME_UNITS_IN_MILLISECONDS = {"m": 60 * 1000, "h": 60 * 60 * 1000, "d": 24 * 60 * 60 * 1000}
+
+
+def get_timeframe_in_milliseconds(timeframe: Timeframe) -> int:
+    """Get the duration of a single candle of the given timeframe.
+
+    Args:
+        timeframe (Timeframe): The timeframe (e.g., '15m', '1h').
+
+    Returns:
+        int: The candle duration in milliseconds.
+    """
+    unit = timeframe[-1]
+    if unit not in _TIMEFRAME_UNITS_IN_MILLISECONDS:
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+    return int(timeframe[:-1]) * _TIMEFRAME_UNITS_IN_MILLISECONDS[unit]
+
+
+def get_candle_open_timestamp(timeframe: Timeframe, timestamp: int) -> int:
+    """Get the open timestamp of the candle which contains the given timestamp.
+
+    Args:
+        timeframe (Timeframe): The timeframe (e.g., '15m', '1h').
+        timestamp (int): Timestamp in milliseconds.
+
+    Returns:
+        int: The candle open timestamp in milliseconds.
+    """
+    timeframe_in_millis = get_timeframe_in_milliseconds(timeframe)
+    return timestamp - (timestamp % timeframe_in_millis)
+
+
+def get_last_closed_candle_timestamp(timeframe: Timeframe, now: datetime) -> int:
+    """Get the open timestamp of the last closed candle at the given moment.
+
+    Args:
+        timeframe (Timeframe): The timeframe (e.g., '15m', '1h').
+        now (datetime): The current moment.
+
+    Returns:
+        int: The open timestamp in milliseconds of the last closed candle.
+    """
+    now_in_millis = int(now.timestamp() * 1000)
+    return get_candle_open_timestamp(timeframe, now_in_millis) - get_timeframe_in_milliseconds(timeframe)
+
+
+def resample_ohlcv(ohlcv: list[list[Any]], *, timeframe: Timeframe) -> list[list[Any]]:
+    """Aggregate the candles of a lower timeframe into candles of the given timeframe.
+
+    Args:
+        ohlcv (list[list[Any]]): Candles of the lower timeframe, sorted by timestamp.
+        timeframe (Timeframe): The target timeframe (e.g., '15m', '1h').
+
+    Returns:
+        list[list[Any]]: The resampled candles, whose timestamp is the open timestamp of the target candle.
+    """
+    ret: list[list[Any]] = []
+    for timestamp, open_price, high, low, close, volume, *_ in ohlcv:
+        candle_open_timestamp = get_candle_open_timestamp(timeframe, timestamp)
+        if ret and ret[-1][0] == candle_open_timestamp:
+            last_candle = ret[-1]
+            last_candle[2] = max(last_candle[2], high)
+            last_candle[3] = min(last_candle[3], low)
+            last_candle[4] = close
+            last_candle[5] += volume
+        else:
+            ret.append([candle_open_timestamp, open_price, high, low, close, volume])
+    return ret
+
+
+def is_resampleable(timeframe: Timeframe, *, base_timeframe: Timeframe) -> bool:
+    """Check whether the candles of the given timeframe can be built from the ones of the base timeframe.
+
+    Args:
+        timeframe (Timeframe): The target timeframe (e.g., '1h').
+        base_timeframe (Timeframe): The base timeframe (e.g., '5m').
+
+    Returns:
+        bool: True if the target timeframe is a multiple of the base timeframe.
+    """
+    return get_timeframe_in_milliseconds(timeframe) % get_timeframe_in_milliseconds(base_timeframe) == 0
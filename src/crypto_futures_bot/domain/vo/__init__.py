@@ -1,5 +1,6 @@
 from crypto_futures_bot.domain.vo.auto_trader_crypto_currency_item import AutoTraderCryptoCurrencyItem
 from crypto_futures_bot.domain.vo.candlestick_indicators import CandleStickIndicators
+from crypto_futures_bot.domain.vo.latency_summary import LatencySummary
 from crypto_futures_bot.domain.vo.market_signal_item import MarketSignalItem
 from crypto_futures_bot.domain.vo.open_position_result import OpenPositionResult
 from crypto_futures_bot.domain.vo.position_metrics import PositionMetrics
@@ -7,6 +8,8 @@ from crypto_futures_bot.domain.vo.push_notification_item import PushNotification
 from crypto_futures_bot.domain.vo.risk_management_item import RiskManagementItem
 from crypto_futures_bot.domain.vo.signal_parametrization_item import SignalParametrizationItem
 from crypto_futures_bot.domain.vo.signals_evaluation_result import SignalsEvaluationResult
+from crypto_futures_bot.domain.vo.signals_run_context import SignalsRunContext
+from crypto_futures_bot.domain.vo.task_run_stats import TaskRunStats
 from crypto_futures_bot.domain.vo.tracked_crypto_currency_item import TrackedCryptoCurrencyItem
 from crypto_futures_bot.domain.vo.trade_now_hints import PositionHints, TradeNowHints
 
@@ -23,4 +26,7 @@ __all__ = [
     "SignalParametrizationItem",
     "RiskManagementItem",
     "OpenPositionResult",
+    "SignalsRunContext",
+    "TaskRunStats",
+    "LatencySummary",
 ]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -45,14 +46,14 @@ class CandleStickIndicators:
             lowest_price=series["Low"],
             opening_price=series["Open"],
             closing_price=series["Close"],
-            ema50=series["ema50"],
-            macd_line=series["macd_line"],
-            macd_signal=series["macd_signal"],
-            macd_hist=series["macd_hist"],
-            stoch_rsi=series["stoch_rsi"],
-            stoch_rsi_k=series["stoch_rsi_k"],
-            stoch_rsi_d=series["stoch_rsi_d"],
-            rsi=series["rsi"],
-            atr=series["atr"],
-            relative_volume=series["relative_volume"],
+            ema50=series.get("ema50", math.nan),
+            macd_line=series.get("macd_line", math.nan),
+            macd_signal=series.get("macd_signal", math.nan),
+            macd_hist=series.get("macd_hist", math.nan),
+            stoch_rsi=series.get("stoch_rsi", math.nan),
+            stoch_rsi_k=series.get("stoch_rsi_k", math.nan),
+            stoch_rsi_d=series.get("stoch_rsi_d", math.nan),
+            rsi=series.get("rsi", math.nan),
+            atr=series.get("atr", math.nan),
+            relative_volume=series.get("relative_volume", math.nan),
         )
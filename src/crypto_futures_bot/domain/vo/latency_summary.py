@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, kw_only=True)
+class LatencySummary:
+    """
+    Latency percentiles of a stage, either for a single symbol or for all of them (symbol is None)
+    """
+
+    stage: str
+    symbol: str | None = None
+    count: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
@@ -1,11 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from crypto_futures_bot.constants import (
     DEFAULT_ATR_SL_MULT,
     DEFAULT_ATR_TP_MULT,
     DEFAULT_LONG_ENTRY_OVERSOLD_THRESHOLD,
     DEFAULT_SHORT_ENTRY_OVERBOUGHT_THRESHOLD,
+    DEFAULT_TIMEFRAME,
 )
+from crypto_futures_bot.domain.types import Timeframe
 
 
 @dataclass
@@ -16,3 +18,4 @@ class SignalParametrizationItem:
     atr_sl_mult: float = DEFAULT_ATR_SL_MULT
     atr_tp_mult: float = DEFAULT_ATR_TP_MULT
     double_confirm_trend: bool = False
+    timeframes: list[Timeframe] = field(default_factory=lambda: [DEFAULT_TIMEFRAME])
@@ -0,0 +1,32 @@
+from dataclasses import dataclass, field
+
+from crypto_futures_bot.domain.vo.auto_trader_crypto_currency_item import AutoTraderCryptoCurrencyItem
+from crypto_futures_bot.domain.vo.risk_management_item import RiskManagementItem
+from crypto_futures_bot.domain.vo.signal_parametrization_item import SignalParametrizationItem
+from crypto_futures_bot.domain.vo.tracked_crypto_currency_item import TrackedCryptoCurrencyItem
+
+
+@dataclass(kw_only=True, frozen=True)
+class SignalsRunContext:
+    """
+    Snapshot of the configuration tables, loaded once at the beginning of every signals run
+    """
+
+    tracked_crypto_currencies: list[TrackedCryptoCurrencyItem] = field(default_factory=list)
+    signal_parametrization_items: dict[str, SignalParametrizationItem] = field(default_factory=dict)
+    auto_trader_crypto_currencies: list[AutoTraderCryptoCurrencyItem] = field(default_factory=list)
+    risk_management: RiskManagementItem = field(default_factory=RiskManagementItem)
+    signals_chat_ids: list[int] = field(default_factory=list)
+
+    def get_signal_parametrization_item(self, crypto_currency: str) -> SignalParametrizationItem:
+        return self.signal_parametrization_items.get(
+            crypto_currency, SignalParametrizationItem(crypto_currency=crypto_currency)
+        )
+
+    @property
+    def num_tracked_crypto_currencies(self) -> int:
+        return len(self.tracked_crypto_currencies)
+
+    @property
+    def num_auto_trader_enabled_crypto_currencies(self) -> int:
+        return sum(1 for item in self.auto_trader_crypto_currencies if item.activated)
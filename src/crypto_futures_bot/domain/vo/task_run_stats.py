@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(kw_only=True)
+class TaskRunStats:
+    """
+    Timing statistics of the runs of a scheduled task
+    """
+
+    runs: int = 0
+    # Runs which took longer than the time until the next scheduled fire
+    overruns: int = 0
+    # Scheduled fires which did not lead to a run (overlapping, coalesced or missed)
+    skipped: int = 0
+    last_started_at: datetime | None = None
+    last_duration_seconds: float | None = None
+    # How late the last run started against its scheduled fire time
+    last_lateness_seconds: float | None = None
+    max_duration_seconds: float = 0.0
+    last_run_overran: bool = False
@@ -4,11 +4,20 @@ from crypto_futures_bot.infrastructure.adapters.futures_exchange.enums.futures_e
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.impl.mexc_futures_exchange import (
     MEXCFuturesExchangeService,
 )
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.impl.single_flight_futures_exchange import (
+    SingleFlightFuturesExchangeService,
+)
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.impl.streaming_futures_exchange import (
+    StreamingFuturesExchangeService,
+)
+from crypto_futures_bot.infrastructure.adapters.market_stream.market_data_store import MarketDataStore
+from crypto_futures_bot.infrastructure.adapters.market_stream.mexc_market_stream import MEXCMarketStreamService
 from crypto_futures_bot.infrastructure.adapters.remote.config.container import RemoteServicesContainer
 
 
 class AdaptersContainer(containers.DeclarativeContainer):
     configuration_properties = providers.Dependency()
+    record_latency = providers.Dependency()
 
     _remote_services_container = providers.Container(
         RemoteServicesContainer, configuration_properties=configuration_properties
@@ -17,7 +26,24 @@ class AdaptersContainer(containers.DeclarativeContainer):
         MEXCFuturesExchangeService,
         configuration_properties=configuration_properties,
         mexc_remote_service=_remote_services_container.mexc_remote_service,
+        record_latency=record_latency,
     )
-    futures_exchange_service = providers.Selector(
+    _futures_exchange_service = providers.Selector(
         configuration_properties.provided.futures_exchange, **{FuturesExchangeEnum.MEXC: _mexc_futures_exchange_service}
     )
+    _market_data_store = providers.Singleton(MarketDataStore)
+    _market_stream_service = providers.Singleton(
+        MEXCMarketStreamService, configuration_properties=configuration_properties, market_data_store=_market_data_store
+    )
+    # XXX: Price reads are served from the market stream first, when it is enabled
+    _streaming_futures_exchange_service = providers.Singleton(
+        StreamingFuturesExchangeService,
+        configuration_properties=configuration_properties,
+        futures_exchange_service=_futures_exchange_service,
+        market_data_store=_market_data_store,
+        market_stream_service=_market_stream_service,
+    )
+    # XXX: Identical reads in flight at the same moment share a single call to the exchange
+    futures_exchange_service = providers.Singleton(
+        SingleFlightFuturesExchangeService, futures_exchange_service=_streaming_futures_exchange_service
+    )
@@ -4,6 +4,7 @@ from typing import Any
 from crypto_futures_bot.domain.types import Timeframe
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo import (
     AccountInfo,
+    AccountSnapshot,
     CreateMarketPositionOrder,
     FuturesWallet,
     PortfolioBalance,
@@ -21,6 +22,10 @@ class AbstractFuturesExchangeService(ABC):
     async def post_init(self) -> None:
         """Post initialization method."""
 
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the resources of the futures exchange service, on shutdown."""
+
     @abstractmethod
     async def get_account_info(self) -> AccountInfo:
         """Get the account info from the futures exchange.
@@ -45,24 +50,32 @@ class AbstractFuturesExchangeService(ABC):
         """
 
     @abstractmethod
-    async def get_symbol_ticker(self, symbol: str) -> SymbolTicker:
+    async def get_symbol_ticker(self, symbol: str, *, max_age_ms: int | None = None) -> SymbolTicker:
         """Get the symbol ticker from the futures exchange.
 
         Args:
             symbol (str): The trading pair symbol (e.g., 'BTC/USDT:USDT').
+            max_age_ms (int | None, optional):
+                Maximum age of a previously fetched ticker to be served instead.
+                Defaults to None, which always fetches a fresh one.
 
         Returns:
             SymbolTicker: The symbol ticker.
         """
 
     @abstractmethod
-    async def get_symbol_tickers(self, *, symbols: list[str] | None = None) -> list[SymbolTicker]:
+    async def get_symbol_tickers(
+        self, *, symbols: list[str] | None = None, max_age_ms: int | None = None
+    ) -> list[SymbolTicker]:
         """Get the list of symbol tickers from the futures exchange.
 
         Args:
             symbols (list[str] | None, optional):
                 The list of trading pair symbols (e.g., 'BTC/USDT:USDT').
                 Defaults to None.
+            max_age_ms (int | None, optional):
+                Maximum age of previously fetched tickers to be served instead.
+                Defaults to None, which always fetches fresh ones.
 
         Returns:
             list[SymbolTicker]: The list of symbol tickers.
@@ -77,13 +90,16 @@ class AbstractFuturesExchangeService(ABC):
         """
 
     @abstractmethod
-    async def fetch_ohlcv(self, symbol: str, *, timeframe: Timeframe = "15m", limit: int = 251) -> list[list[Any]]:
+    async def fetch_ohlcv(
+        self, symbol: str, *, timeframe: Timeframe = "15m", limit: int = 251, since: int | None = None
+    ) -> list[list[Any]]:
         """Fetches OHLCV (Open, High, Low, Close, Volume) data for a given symbol and timeframe.
 
         Args:
             symbol (str): The trading pair symbol (e.g., 'BTC/USDT').
             timeframe (Timeframe, optional): The timeframe for the OHLCV data. Defaults to "15m".
             limit (int, optional): The maximum number of data points to fetch. Defaults to 251.
+            since (int | None, optional): Timestamp in milliseconds of the earliest candle to fetch. Defaults to None.
 
         Returns:
             list[list[Any]]: A list of OHLCV data points.
@@ -108,6 +124,15 @@ class AbstractFuturesExchangeService(ABC):
             list[Position]: The list of open positions.
         """
 
+    @abstractmethod
+    async def get_account_snapshot(self) -> AccountSnapshot:
+        """Get a consistent snapshot of the futures wallet, the open positions and their stop orders,
+        fetched at once from the futures exchange.
+
+        Returns:
+            AccountSnapshot: The account snapshot.
+        """
+
     @abstractmethod
     async def get_position_by_id(self, position_id: str) -> Position:
         """Get the position by id from the futures exchange.
@@ -126,7 +151,8 @@ class AbstractFuturesExchangeService(ABC):
         Args:
             position (CreateMarketPositionOrder): The position to create.
         Returns:
-            Position: The created position.
+            Position: The created position, built from the fill of the order. Its liquidation price
+                may be an estimate, the exchange one is served by the following position reads.
         """
 
     @abstractmethod
@@ -1,17 +1,29 @@
 import asyncio
+import itertools
+import json
 import logging
+import math
+import os
+import time
+from dataclasses import asdict
 from typing import Any, override
 
 import backoff
 import ccxt.async_support as ccxt
 
 from crypto_futures_bot.config.configuration_properties import ConfigurationProperties
-from crypto_futures_bot.constants import MEXC_FUTURES_TAKER_FEES
+from crypto_futures_bot.constants import (
+    MEXC_FUTURES_MAINTENANCE_MARGIN_RATE,
+    MEXC_FUTURES_TAKER_FEES,
+    ORDER_FILL_POLL_MAX_DELAY_SECONDS,
+    ORDER_FILL_POLL_MIN_DELAY_SECONDS,
+)
 from crypto_futures_bot.domain.enums import PositionOpenTypeEnum, PositionTypeEnum
-from crypto_futures_bot.domain.types import Timeframe
+from crypto_futures_bot.domain.types import LatencyRecorder, Timeframe
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.base import AbstractFuturesExchangeService
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo import (
     AccountInfo,
+    AccountSnapshot,
     CreateMarketPositionOrder,
     PortfolioBalance,
     Position,
@@ -32,11 +44,15 @@ logger = logging.getLogger(__name__)
 
 class MEXCFuturesExchangeService(AbstractFuturesExchangeService):
     def __init__(
-        self, configuration_properties: ConfigurationProperties, mexc_remote_service: MEXCRemoteService
+        self,
+        configuration_properties: ConfigurationProperties,
+        mexc_remote_service: MEXCRemoteService,
+        record_latency: LatencyRecorder,
     ) -> None:
         super().__init__()
         self._configuration_properties = configuration_properties
         self._mexc_remote_service = mexc_remote_service
+        self._record_latency = record_latency
         if (
             self._configuration_properties.mexc_api_key is None
             or self._configuration_properties.mexc_api_secret is None
@@ -54,9 +70,19 @@ class MEXCFuturesExchangeService(AbstractFuturesExchangeService):
         }
         self._spot_client = ccxt.mexc({**commons_options, "options": {"defaultType": "spot"}})
         self._futures_client = ccxt.mexc({**commons_options, "options": {"defaultType": "swap"}})
-        self._futures_markets_cache: dict[str, dict[str, Any]] | None = None
+        # Pre-parsed market configs by crypto currency, swapped in at once when they are refreshed
+        self._symbol_market_configs: dict[str, SymbolMarketConfig] | None = None
+        self._symbol_market_configs_loaded_at = 0.0
+        self._symbol_market_configs_refresh_task: asyncio.Task[None] | None = None
+        self._markets_revalidation_task: asyncio.Task[None] | None = None
+        # Latest fetched tickers, along with the moment they were fetched
+        self._tickers_cache: dict[str, tuple[float, SymbolTicker]] = {}
+        # Latest spot prices of the held assets, along with the moment they were fetched
+        self._spot_prices_cache: dict[str, tuple[float, float]] = {}
+        self._account_snapshot_versions = itertools.count(1)
+        # Background reconciliations of the opened positions, referenced until they are done
+        self._position_reconciliation_tasks: set[asyncio.Task[None]] = set()
 
-    @override
     @backoff.on_exception(
         backoff.constant,
         exception=ccxt.BaseError,
@@ -68,10 +94,27 @@ class MEXCFuturesExchangeService(AbstractFuturesExchangeService):
             f"[Retry {details['tries']}] " + f"Waiting {details['wait']:.2f}s due to {str(details['exception'])}"
         ),
     )
-    async def post_init(self) -> None:
+    async def _load_markets(self) -> None:
         await self._spot_client.load_markets()
         await self._futures_client.load_markets()
 
+    @override
+    async def post_init(self) -> None:
+        # XXX: Markets are restored from the snapshot at once, while they are revalidated in the background
+        if await self._restore_market_snapshot():
+            self._markets_revalidation_task = asyncio.create_task(self._revalidate_markets())
+        else:
+            await self._load_markets()
+            await self._save_market_snapshot()
+
+    @override
+    async def close(self) -> None:
+        for task in [self._markets_revalidation_task, self._symbol_market_configs_refresh_task]:
+            if task is not None:
+                task.cancel()
+        await self._spot_client.close()
+        await self._futures_client.close()
+
     @override
     async def get_account_info(self) -> AccountInfo:
         return AccountInfo(currency_code=self._configuration_properties.currency_code)
@@ -79,8 +122,10 @@ class MEXCFuturesExchangeService(AbstractFuturesExchangeService):
     @override
     async def get_portfolio_balance(self) -> PortfolioBalance:
         account_info = await self.get_account_info()
-        spot_balance = await self._get_spot_total_balance(account_info)
-        swap_balance = await self._get_futures_total_balance(account_info)
+        async with asyncio.timeout(self._configuration_properties.composite_operation_timeout_seconds):
+            spot_balance, swap_balance = await asyncio.gather(
+                self._get_spot_total_balance(account_info), self._get_futures_total_balance(account_info)
+            )
         return PortfolioBalance(
             spot_balance=round(spot_balance, ndigits=2),
             futures_balance=round(swap_balance, ndigits=2),
@@ -91,6 +136,9 @@ class MEXCFuturesExchangeService(AbstractFuturesExchangeService):
     async def get_futures_wallet(self) -> FuturesWallet:
         account_info = await self.get_account_info()
         raw_data = await self._get_futures_wallet_fiat_currency_raw_balances(account_info)
+        return self._map_raw_futures_wallet(raw_data)
+
+    def _map_raw_futures_wallet(self, raw_data: dict[str, Any]) -> FuturesWallet:
         ret = FuturesWallet(
             currency=raw_data["currency"],
             # Total Net Worth (Cash + PnL)
@@ -118,8 +166,8 @@ class MEXCFuturesExchangeService(AbstractFuturesExchangeService):
         ),
     )
     async def get_crypto_currencies(self) -> list[str]:
-        futures_markets = await self._load_futures_markets()
-        return sorted(list(futures_markets.keys()))
+        symbol_market_configs = await self._get_symbol_market_configs()
+        return sorted(list(symbol_market_configs.keys()))
 
     @override
     @backoff.on_exception(
@@ -133,9 +181,13 @@ class MEXCFuturesExchangeService(AbstractFuturesExchangeService):
             f"[Retry {details['tries']}] " + f"Waiting {details['wait']:.2f}s due to {str(details['exception'])}"
         ),
     )
-    async def get_symbol_ticker(self, symbol: str) -> SymbolTicker:
+    async def get_symbol_ticker(self, symbol: str, *, max_age_ms: int | None = None) -> SymbolTicker:
+        if max_age_ms is not None and (ret := self._get_cached_ticker(symbol, max_age_ms=max_age_ms)) is not None:
+            return ret
         raw_ticker = await self._futures_client.fetch_ticker(symbol)
-        return self._convert_raw_ticker_to_symbol_ticker(raw_ticker)
+        ret = self._convert_raw_ticker_to_symbol_ticker(raw_ticker)
+        self._tickers_cache[ret.symbol] = (time.monotonic(), ret)
+        return ret
 
     @override
     @backoff.on_exception(
@@ -149,9 +201,32 @@ class MEXCFuturesExchangeService(AbstractFuturesExchangeService):
             f"[Retry {details['tries']}] " + f"Waiting {details['wait']:.2f}s due to {str(details['exception'])}"
         ),
     )
-    async def get_symbol_tickers(self, *, symbols: list[str] | None = None) -> list[SymbolTicker]:
-        raw_tickers = await self._futures_client.fetch_tickers(symbols=symbols)
+    async def get_symbol_tickers(
+        self, *, symbols: list[str] | None = None, max_age_ms: int | None = None
+    ) -> list[SymbolTicker]:
+        if max_age_ms is not None and symbols is not None:
+            cached_tickers = [self._get_cached_ticker(symbol, max_age_ms=max_age_ms) for symbol in symbols]
+            if all(cached_ticker is not None for cached_ticker in cached_tickers):
+                return cached_tickers
+            # XXX: Only the requested symbols are refreshed, in a single call
+            await self._refresh_tickers_cache(symbols)
+            return [self._tickers_cache[symbol][1] for symbol in symbols if symbol in self._tickers_cache]
+        return await self._refresh_tickers_cache(symbols)
+
+    def _get_cached_ticker(self, symbol: str, *, max_age_ms: int) -> SymbolTicker | None:
+        fetched_at, symbol_ticker = self._tickers_cache.get(symbol, (None, None))
+        if fetched_at is None or (time.monotonic() - fetched_at) * 1000 > max_age_ms:
+            return None
+        return symbol_ticker
+
+    async def _refresh_tickers_cache(self, symbols: list[str] | None) -> list[SymbolTicker]:
+        raw_tickers = await self._futures_client.fetch_tickers(
+            symbols=list(dict.fromkeys(symbols)) if symbols is not None else None
+        )
+        fetched_at = time.monotonic()
         ret = [self._convert_raw_ticker_to_symbol_ticker(raw_ticker) for raw_ticker in raw_tickers.values()]
+        for symbol_ticker in ret:
+            self._tickers_cache[symbol_ticker.symbol] = (fetched_at, symbol_ticker)
         return ret
 
     def _convert_raw_ticker_to_symbol_ticker(self, raw_ticker: dict[str, Any]) -> SymbolTicker:
@@ -184,17 +259,11 @@ class MEXCFuturesExchangeService(AbstractFuturesExchangeService):
 
     @override
     async def get_symbol_market_config(self, crypto_currency: str) -> SymbolMarketConfig:
-        futures_markets = await self._load_futures_markets()
-        raw_future_market = futures_markets.get(crypto_currency)
-        if not raw_future_market:
+        symbol_market_configs = await self._get_symbol_market_configs()
+        ret = symbol_market_configs.get(crypto_currency)
+        if not ret:
             raise ValueError(f"Future market not found for {crypto_currency}")
-        return SymbolMarketConfig(
-            symbol=raw_future_market["symbol"],
-            price_precision=int(raw_future_market["info"]["priceScale"]),
-            amount_precision=int(raw_future_market["info"]["amountScale"]),
-            contract_size=float(raw_future_market["info"]["contractSize"]),
-            max_leverage=int(raw_future_market["info"]["maxLeverage"]),
-        )
+        return ret
 
     @override
     @backoff.on_exception(
@@ -209,13 +278,45 @@ class MEXCFuturesExchangeService(AbstractFuturesExchangeService):
         ),
     )
     async def get_open_positions(self) -> list[Position]:
-        raw_open_positions = await self._futures_client.fetch_positions()
-        raw_stop_orders = await self._get_raw_stop_orders()
-        ret = [
-            await self._map_raw_position(raw_position, raw_stop_orders=raw_stop_orders)
-            for raw_position in raw_open_positions
-        ]
-        return ret
+        async with asyncio.timeout(self._configuration_properties.composite_operation_timeout_seconds):
+            raw_open_positions, raw_stop_orders = await asyncio.gather(
+                self._futures_client.fetch_positions(), self._get_raw_stop_orders()
+            )
+        return await self._map_raw_positions(
+            raw_open_positions, stop_orders_by_position_id=self._index_raw_stop_orders(raw_stop_orders)
+        )
+
+    @override
+    @backoff.on_exception(
+        backoff.constant,
+        exception=ccxt.BaseError,
+        interval=2,
+        max_tries=5,
+        jitter=backoff.full_jitter,
+        giveup=lambda e: isinstance(e, ccxt.BadRequest) or isinstance(e, ccxt.AuthenticationError),
+        on_backoff=lambda details: logger.warning(
+            f"[Retry {details['tries']}] " + f"Waiting {details['wait']:.2f}s due to {str(details['exception'])}"
+        ),
+    )
+    async def get_account_snapshot(self) -> AccountSnapshot:
+        account_info = await self.get_account_info()
+        async with asyncio.timeout(self._configuration_properties.composite_operation_timeout_seconds):
+            raw_open_positions, raw_stop_orders, raw_futures_wallet = await asyncio.gather(
+                self._futures_client.fetch_positions(),
+                self._get_raw_stop_orders(),
+                self._get_futures_wallet_fiat_currency_raw_balances(account_info),
+            )
+        stop_orders_by_position_id = self._index_raw_stop_orders(raw_stop_orders)
+        positions = await self._map_raw_positions(
+            raw_open_positions, stop_orders_by_position_id=stop_orders_by_position_id
+        )
+        return AccountSnapshot(
+            version=next(self._account_snapshot_versions),
+            timestamp=int(time.time() * 1000),
+            futures_wallet=self._map_raw_futures_wallet(raw_futures_wallet),
+            positions=positions,
+            stop_orders_by_position_id=stop_orders_by_position_id,
+        )
 
     @override
     @backoff.on_exception(
@@ -235,9 +336,12 @@ class MEXCFuturesExchangeService(AbstractFuturesExchangeService):
     @override
     async def create_market_position_order(self, position: CreateMarketPositionOrder) -> Position:
         mexc_symbol = position.symbol.split(":")[0].replace("/", "_")
-        symbol_ticker = await self.get_symbol_ticker(symbol=position.symbol)
         crypto_currency = mexc_symbol.split("_")[0]
-        symbol_market_config = await self.get_symbol_market_config(crypto_currency=crypto_currency)
+        symbol_ticker, symbol_market_config = await asyncio.gather(
+            # XXX: Orders are always placed on a fresh ticker
+            self.get_symbol_ticker(symbol=position.symbol),
+            self.get_symbol_market_config(crypto_currency=crypto_currency),
+        )
         raw_vol = int(
             position.initial_margin
             * position.leverage
@@ -263,24 +367,114 @@ class MEXCFuturesExchangeService(AbstractFuturesExchangeService):
             )
         )
         logger.info(f"Market position order created successfully, order_id: {place_order_response.order_id}")
-        position_id = await self._get_position_id_by_order_id(place_order_response.order_id, position=position)
-        # Fetch and return the newly created position
-        open_positions = await self.get_open_positions()
-        opened_position = next((pos for pos in open_positions if pos.position_id == position_id), None)
-        if not opened_position:
-            raise ValueError(f"Created position not found for position id: {position_id}")
+        filled_order = await self._get_filled_order(place_order_response.order_id, position=position)
+        # XXX: The position is built from the fill, instead of reloading every position and stop order,
+        # while it is reconciled against the exchange in the background
+        opened_position = self._map_filled_order_to_position(
+            filled_order, position=position, symbol_ticker=symbol_ticker, symbol_market_config=symbol_market_config
+        )
+        reconciliation_task = asyncio.create_task(
+            self._reconcile_opened_position(opened_position, symbol_market_config=symbol_market_config)
+        )
+        self._position_reconciliation_tasks.add(reconciliation_task)
+        reconciliation_task.add_done_callback(self._position_reconciliation_tasks.discard)
         return opened_position
 
-    async def _get_position_id_by_order_id(self, order_id: str, *, position: Position) -> str:
-        fetched_order = await self._futures_client.fetch_order(order_id, symbol=position.symbol)
-        while fetched_order.get("status", "pending") not in ["closed", "canceled"]:
-            await asyncio.sleep(delay=2.0)
-            fetched_order = await self._futures_client.fetch_order(order_id, symbol=position.symbol)
-        if last_order_status := fetched_order.get("status") != "closed":
+    def _map_filled_order_to_position(
+        self,
+        filled_order: dict[str, Any],
+        *,
+        position: CreateMarketPositionOrder,
+        symbol_ticker: SymbolTicker,
+        symbol_market_config: SymbolMarketConfig,
+    ) -> Position:
+        is_long = position.position_type == PositionTypeEnum.LONG
+        entry_price = float(filled_order.get("average") or symbol_ticker.mark_price)
+        contracts = float(filled_order.get("filled") or filled_order.get("amount") or 0.0)
+        leverage = int(filled_order["info"].get("leverage") or position.leverage)
+        direction = 1 if is_long else -1
+        return Position(
+            position_id=str(filled_order["info"]["positionId"]),
+            symbol=position.symbol,
+            initial_margin=round(
+                contracts * symbol_market_config.contract_size * entry_price / leverage,
+                ndigits=symbol_market_config.price_precision,
+            ),
+            leverage=leverage,
+            # XXX: Estimated from the isolated margin, the exchange one is served by the following position reads
+            liquidation_price=round(
+                entry_price * (1 - direction * (1 / leverage - MEXC_FUTURES_MAINTENANCE_MARGIN_RATE)),
+                ndigits=symbol_market_config.price_precision,
+            ),
+            open_type=position.open_type,
+            position_type=position.position_type,
+            entry_price=entry_price,
+            contracts=contracts,
+            contract_size=symbol_market_config.contract_size,
+            fee=round(
+                float((filled_order.get("fee") or {}).get("cost") or 0.0), ndigits=symbol_market_config.price_precision
+            ),
+            stop_loss_price=position.stop_loss_price,
+            take_profit_price=position.take_profit_price,
+        )
+
+    async def _reconcile_opened_position(
+        self, opened_position: Position, *, symbol_market_config: SymbolMarketConfig
+    ) -> None:
+        # XXX: Fire-and-forget task, so nothing can be raised from here
+        try:
+            open_positions = await self.get_open_positions()
+        except Exception as e:
+            logger.warning(f"Opened position {opened_position.position_id} could not be reconciled: {str(e)}")
+            return
+        reconciled_position = next(
+            (position for position in open_positions if position.position_id == opened_position.position_id), None
+        )
+        if reconciled_position is None:
+            logger.warning(f"Opened position {opened_position.position_id} not found when reconciling it")
+            return
+        price_tolerance = 10 ** (-symbol_market_config.price_precision)
+        amount_tolerance = 10 ** (-symbol_market_config.amount_precision)
+        if not math.isclose(
+            reconciled_position.entry_price, opened_position.entry_price, abs_tol=price_tolerance
+        ) or not math.isclose(reconciled_position.contracts, opened_position.contracts, abs_tol=amount_tolerance):
+            logger.warning(
+                f"Opened position {opened_position.position_id} differs from the exchange one: "
+                + f"entry price {opened_position.entry_price} vs {reconciled_position.entry_price}, "
+                + f"contracts {opened_position.contracts} vs {reconciled_position.contracts}"
+            )
+        logger.info(
+            f"Opened position {opened_position.position_id} reconciled, liquidation price "
+            + f"{reconciled_position.liquidation_price} (estimated {opened_position.liquidation_price})"
+        )
+
+    async def _get_filled_order(self, order_id: str, *, position: CreateMarketPositionOrder) -> dict[str, Any]:
+        started_at = time.perf_counter()
+        order_fill_timeout_seconds = self._configuration_properties.order_fill_timeout_seconds
+        try:
+            async with asyncio.timeout(order_fill_timeout_seconds):
+                fetched_order = await self._wait_for_order_fill(order_id, symbol=position.symbol)
+        except TimeoutError as e:
+            raise ValueError(
+                f"Recent order created for {position.symbol} :: {position.position_type}, "
+                + f"not filled within {order_fill_timeout_seconds} seconds"
+            ) from e
+        self._record_latency("order_fill", time.perf_counter() - started_at, symbol=position.symbol)
+        if (last_order_status := fetched_order.get("status")) != "closed":
             raise ValueError(
                 f"Recent order created for {position.symbol} :: {position.position_type}, status is {last_order_status}"
-            )  # noqa: 501
-        return fetched_order["info"]["positionId"]
+            )
+        return fetched_order
+
+    async def _wait_for_order_fill(self, order_id: str, *, symbol: str) -> dict[str, Any]:
+        # XXX: Market orders fill in milliseconds, so the order is polled often at first and less and less later on
+        delay = ORDER_FILL_POLL_MIN_DELAY_SECONDS
+        fetched_order = await self._futures_client.fetch_order(order_id, symbol=symbol)
+        while fetched_order.get("status", "pending") not in ["closed", "canceled"]:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, ORDER_FILL_POLL_MAX_DELAY_SECONDS)
+            fetched_order = await self._futures_client.fetch_order(order_id, symbol=symbol)
+        return fetched_order
 
     @override
     def get_taker_fee(self) -> float:
@@ -297,18 +491,131 @@ class MEXCFuturesExchangeService(AbstractFuturesExchangeService):
             f"[Retry {details['tries']}] " + f"Waiting {details['wait']:.2f}s due to {str(details['exception'])}"
         ),
     )
-    async def _load_futures_markets(self) -> dict[str, dict[str, Any]]:
-        if not self._futures_markets_cache:
-            account_info = await self.get_account_info()
-            markets = await self._futures_client.fetch_swap_markets()
-            self._futures_markets_cache = {
-                market["base"]: market
-                for market in markets
-                if market.get("quote") == account_info.currency_code
-                and market.get("active", False)
-                and market.get("swap", False)
+    async def _load_symbol_market_configs(self, *, reload: bool = True) -> dict[str, SymbolMarketConfig]:
+        account_info = await self.get_account_info()
+        # XXX: The client markets are reloaded as well, so the index and the client never disagree on a symbol
+        markets = (await self._futures_client.load_markets(reload=reload)).values()
+        return {
+            market["base"]: SymbolMarketConfig(
+                symbol=market["symbol"],
+                price_precision=int(market["info"]["priceScale"]),
+                amount_precision=int(market["info"]["amountScale"]),
+                contract_size=float(market["info"]["contractSize"]),
+                max_leverage=int(market["info"]["maxLeverage"]),
+            )
+            for market in markets
+            if market.get("quote") == account_info.currency_code
+            and market.get("active", False)
+            and market.get("swap", False)
+        }
+
+    async def _restore_market_snapshot(self) -> bool:
+        market_snapshot_path = self._configuration_properties.market_snapshot_path
+        if not market_snapshot_path or not os.path.exists(market_snapshot_path):
+            return False
+        try:
+            market_snapshot = await asyncio.to_thread(self._read_market_snapshot, market_snapshot_path)
+            self._spot_client.set_markets(market_snapshot["spot"]["markets"], market_snapshot["spot"]["currencies"])
+            self._futures_client.set_markets(
+                market_snapshot["futures"]["markets"], market_snapshot["futures"]["currencies"]
+            )
+            self._symbol_market_configs = {
+                crypto_currency: SymbolMarketConfig(**raw_symbol_market_config)
+                for crypto_currency, raw_symbol_market_config in market_snapshot["symbol_market_configs"].items()
             }
-        return self._futures_markets_cache
+            self._symbol_market_configs_loaded_at = time.monotonic()
+            logger.info(f"Markets restored from the snapshot saved at {market_snapshot['saved_at']}")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Market snapshot {market_snapshot_path} could not be restored: {str(e)}")
+            return False
+        return True
+
+    async def _revalidate_markets(self) -> None:
+        try:
+            await self._spot_client.load_markets(reload=True)
+            # XXX: The futures markets are reloaded along with the market config index
+            revalidated = await self._refresh_symbol_market_configs()
+        except Exception as e:
+            logger.warning(f"Markets could not be revalidated, keeping the snapshot ones: {str(e)}")
+            return
+        if revalidated:
+            await self._save_market_snapshot()
+            logger.info("Markets revalidated against the exchange")
+
+    async def _save_market_snapshot(self) -> None:
+        market_snapshot_path = self._configuration_properties.market_snapshot_path
+        if not market_snapshot_path:
+            return
+        symbol_market_configs = await self._get_symbol_market_configs()
+        market_snapshot = {
+            "saved_at": int(time.time() * 1000),
+            "spot": {"markets": list(self._spot_client.markets.values()), "currencies": self._spot_client.currencies},
+            "futures": {
+                "markets": list(self._futures_client.markets.values()),
+                "currencies": self._futures_client.currencies,
+            },
+            "symbol_market_configs": {
+                crypto_currency: asdict(symbol_market_config)
+                for crypto_currency, symbol_market_config in symbol_market_configs.items()
+            },
+        }
+        try:
+            await asyncio.to_thread(self._write_market_snapshot, market_snapshot_path, market_snapshot)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Market snapshot {market_snapshot_path} could not be saved: {str(e)}")
+
+    def _read_market_snapshot(self, market_snapshot_path: str) -> dict[str, Any]:
+        with open(market_snapshot_path) as fd:
+            return json.load(fd)
+
+    def _write_market_snapshot(self, market_snapshot_path: str, market_snapshot: dict[str, Any]) -> None:
+        if directory := os.path.dirname(market_snapshot_path):
+            os.makedirs(directory, exist_ok=True)
+        # XXX: Written aside and moved, so a crash never leaves a truncated snapshot behind
+        temporary_path = f"{market_snapshot_path}.tmp"
+        with open(temporary_path, "w") as fd:
+            json.dump(market_snapshot, fd)
+        os.replace(temporary_path, market_snapshot_path)
+
+    async def _get_symbol_market_configs(self) -> dict[str, SymbolMarketConfig]:
+        """
+        Market configs are loaded once, after that they are served as they are,
+        while they are refreshed in the background when they are older than the refresh interval
+        """
+        if not self._symbol_market_configs:
+            # The first time, the client markets already loaded are parsed as they are
+            await self._refresh_symbol_market_configs(reload=False)
+        elif (
+            time.monotonic() - self._symbol_market_configs_loaded_at
+            > self._configuration_properties.futures_markets_refresh_interval_seconds
+            and (self._symbol_market_configs_refresh_task is None or self._symbol_market_configs_refresh_task.done())
+        ):
+            self._symbol_market_configs_refresh_task = asyncio.create_task(self._refresh_symbol_market_configs())
+        return self._symbol_market_configs
+
+    async def _refresh_symbol_market_configs(self, *, reload: bool = True) -> bool:
+        try:
+            symbol_market_configs = await self._load_symbol_market_configs(reload=reload)
+        except ccxt.BaseError as e:
+            if not self._symbol_market_configs:
+                raise
+            logger.warning(f"Futures markets could not be refreshed, keeping the current ones: {str(e)}")
+            return False
+        if self._symbol_market_configs is not None:
+            listed = symbol_market_configs.keys() - self._symbol_market_configs.keys()
+            delisted = self._symbol_market_configs.keys() - symbol_market_configs.keys()
+            if listed or delisted:
+                logger.info(f"Futures markets refreshed, listed: {sorted(listed)}, delisted: {sorted(delisted)}")
+        self._symbol_market_configs = symbol_market_configs
+        self._symbol_market_configs_loaded_at = time.monotonic()
+        self._evict_delisted_tickers()
+        return True
+
+    def _evict_delisted_tickers(self) -> None:
+        # Tickers of the symbols no longer listed are dropped, so they are never requested again
+        for symbol in list(self._tickers_cache):
+            if symbol.split("/")[0] not in self._symbol_market_configs:
+                del self._tickers_cache[symbol]
 
     @backoff.on_exception(
         backoff.constant,
@@ -323,12 +630,15 @@ class MEXCFuturesExchangeService(AbstractFuturesExchangeService):
     )
     async def _get_spot_total_balance(self, account_info: AccountInfo) -> float:
         spot_balances = await self._spot_client.fetch_balance()
-        spot_prices = await self._get_spot_prices()
         spot_totals = spot_balances.get("total", {})
         ret = spot_totals.pop(account_info.currency_code.upper(), 0.0)
-        for currency, amount in spot_totals.items():
-            if amount > 0:
-                ret += amount * spot_prices[f"{currency}/{account_info.currency_code}"]
+        # Only the held assets are valued, instead of downloading every spot ticker
+        held_amounts = {
+            f"{currency}/{account_info.currency_code}": amount for currency, amount in spot_totals.items() if amount > 0
+        }
+        spot_prices = await self._get_spot_prices(list(held_amounts))
+        for symbol, amount in held_amounts.items():
+            ret += amount * spot_prices[symbol]
         return ret
 
     async def _get_futures_total_balance(self, account_info: AccountInfo) -> float:
@@ -349,9 +659,20 @@ class MEXCFuturesExchangeService(AbstractFuturesExchangeService):
             f"[Retry {details['tries']}] " + f"Waiting {details['wait']:.2f}s due to {str(details['exception'])}"
         ),
     )
-    async def _get_spot_prices(self) -> dict[str, float]:
-        spot_tickers = await self._spot_client.fetch_tickers()
-        return {symbol: ticker["last"] for symbol, ticker in spot_tickers.items()}
+    async def _get_spot_prices(self, symbols: list[str]) -> dict[str, float]:
+        max_age_ms = self._configuration_properties.spot_prices_max_age_ms
+        ret: dict[str, float] = {}
+        for symbol in symbols:
+            fetched_at, price = self._spot_prices_cache.get(symbol, (None, None))
+            if fetched_at is not None and (time.monotonic() - fetched_at) * 1000 <= max_age_ms:
+                ret[symbol] = price
+        if missing_symbols := [symbol for symbol in symbols if symbol not in ret]:
+            spot_tickers = await self._spot_client.fetch_tickers(missing_symbols)
+            fetched_at = time.monotonic()
+            for symbol, ticker in spot_tickers.items():
+                self._spot_prices_cache[symbol] = (fetched_at, ticker["last"])
+                ret[symbol] = ticker["last"]
+        return ret
 
     @backoff.on_exception(
         backoff.constant,
@@ -376,19 +697,39 @@ class MEXCFuturesExchangeService(AbstractFuturesExchangeService):
         )
         return account_currency_balance
 
-    async def _map_raw_position(
-        self, raw_position: dict[str, Any], *, raw_stop_orders: list[dict[str, Any]]
+    async def _map_raw_positions(
+        self, raw_positions: list[dict[str, Any]], *, stop_orders_by_position_id: dict[str, dict[str, Any]]
+    ) -> list[Position]:
+        # Market configs are resolved once for all the positions
+        symbol_market_configs = {
+            crypto_currency: await self.get_symbol_market_config(crypto_currency=crypto_currency)
+            for crypto_currency in {raw_position["symbol"].split("/")[0] for raw_position in raw_positions}
+        }
+        return [
+            self._map_raw_position(
+                raw_position,
+                symbol_market_config=symbol_market_configs[raw_position["symbol"].split("/")[0]],
+                stop_order=stop_orders_by_position_id.get(str(raw_position["info"]["positionId"])),
+            )
+            for raw_position in raw_positions
+        ]
+
+    def _index_raw_stop_orders(self, raw_stop_orders: dict[str, Any]) -> dict[str, dict[str, Any]]:
+        ret: dict[str, dict[str, Any]] = {}
+        for stop_order in raw_stop_orders.get("data", []):
+            # The first stop order of every position wins, as when they were scanned
+            if (position_id := stop_order.get("positionId")) is not None:
+                ret.setdefault(position_id, stop_order)
+        return ret
+
+    def _map_raw_position(
+        self,
+        raw_position: dict[str, Any],
+        *,
+        symbol_market_config: SymbolMarketConfig,
+        stop_order: dict[str, Any] | None,
     ) -> Position:
-        symbol_market_config = await self.get_symbol_market_config(crypto_currency=raw_position["symbol"].split("/")[0])
         position_id = str(raw_position["info"]["positionId"])
-        stop_order = next(
-            (
-                stop_order
-                for stop_order in raw_stop_orders.get("data", [])
-                if stop_order.get("positionId") == position_id
-            ),
-            None,
-        )
         current_position = Position(
             position_id=position_id,
             symbol=raw_position["symbol"],
@@ -413,7 +754,7 @@ class MEXCFuturesExchangeService(AbstractFuturesExchangeService):
         )
         return current_position
 
-    async def _get_raw_stop_orders(self) -> list[dict[str, Any]]:
+    async def _get_raw_stop_orders(self) -> dict[str, Any]:
         raw_stop_orders = await self._futures_client.request(
             "stoporder/open_orders", api=["contract", "private"], method="GET"
         )
@@ -0,0 +1,136 @@
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, override
+
+from crypto_futures_bot.domain.types import Timeframe
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.base import AbstractFuturesExchangeService
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo import (
+    AccountInfo,
+    AccountSnapshot,
+    CreateMarketPositionOrder,
+    FuturesWallet,
+    PortfolioBalance,
+    Position,
+    SymbolMarketConfig,
+    SymbolTicker,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlightFuturesExchangeService(AbstractFuturesExchangeService):
+    """
+    Wrapper of any futures exchange service, where identical reads in flight at the same moment
+    share a single underlying call and its result. Writes are always delegated as they are.
+    """
+
+    def __init__(self, futures_exchange_service: AbstractFuturesExchangeService) -> None:
+        super().__init__()
+        self._futures_exchange_service = futures_exchange_service
+        self._in_flight_calls: dict[tuple[Hashable, ...], asyncio.Task[Any]] = {}
+        # Number of calls which joined an identical call in flight, by method name
+        self._saved_calls: defaultdict[str, int] = defaultdict(int)
+
+    def get_saved_calls(self) -> dict[str, int]:
+        return dict(self._saved_calls)
+
+    @override
+    async def post_init(self) -> None:
+        await self._futures_exchange_service.post_init()
+
+    @override
+    async def close(self) -> None:
+        await self._futures_exchange_service.close()
+
+    @override
+    async def get_account_info(self) -> AccountInfo:
+        return await self._futures_exchange_service.get_account_info()
+
+    @override
+    async def get_portfolio_balance(self) -> PortfolioBalance:
+        return await self._single_flight("get_portfolio_balance", self._futures_exchange_service.get_portfolio_balance)
+
+    @override
+    async def get_futures_wallet(self) -> FuturesWallet:
+        return await self._single_flight("get_futures_wallet", self._futures_exchange_service.get_futures_wallet)
+
+    @override
+    async def get_symbol_ticker(self, symbol: str, *, max_age_ms: int | None = None) -> SymbolTicker:
+        return await self._single_flight(
+            "get_symbol_ticker",
+            lambda: self._futures_exchange_service.get_symbol_ticker(symbol, max_age_ms=max_age_ms),
+            symbol,
+            max_age_ms,
+        )
+
+    @override
+    async def get_symbol_tickers(
+        self, *, symbols: list[str] | None = None, max_age_ms: int | None = None
+    ) -> list[SymbolTicker]:
+        return await self._single_flight(
+            "get_symbol_tickers",
+            lambda: self._futures_exchange_service.get_symbol_tickers(symbols=symbols, max_age_ms=max_age_ms),
+            tuple(symbols) if symbols is not None else None,
+            max_age_ms,
+        )
+
+    @override
+    async def get_crypto_currencies(self) -> list[str]:
+        return await self._single_flight("get_crypto_currencies", self._futures_exchange_service.get_crypto_currencies)
+
+    @override
+    async def fetch_ohlcv(
+        self, symbol: str, *, timeframe: Timeframe = "15m", limit: int = 251, since: int | None = None
+    ) -> list[list[Any]]:
+        return await self._single_flight(
+            "fetch_ohlcv",
+            lambda: self._futures_exchange_service.fetch_ohlcv(symbol, timeframe=timeframe, limit=limit, since=since),
+            symbol,
+            timeframe,
+            limit,
+            since,
+        )
+
+    @override
+    async def get_symbol_market_config(self, crypto_currency: str) -> SymbolMarketConfig:
+        # XXX: Market configs are served from a pre-parsed index, so there is nothing to share
+        return await self._futures_exchange_service.get_symbol_market_config(crypto_currency)
+
+    @override
+    async def get_open_positions(self) -> list[Position]:
+        return await self._single_flight("get_open_positions", self._futures_exchange_service.get_open_positions)
+
+    @override
+    async def get_account_snapshot(self) -> AccountSnapshot:
+        return await self._single_flight("get_account_snapshot", self._futures_exchange_service.get_account_snapshot)
+
+    @override
+    async def get_position_by_id(self, position_id: str) -> Position:
+        return await self._single_flight(
+            "get_position_by_id", lambda: self._futures_exchange_service.get_position_by_id(position_id), position_id
+        )
+
+    @override
+    async def create_market_position_order(self, position: CreateMarketPositionOrder) -> Position:
+        return await self._futures_exchange_service.create_market_position_order(position)
+
+    @override
+    def get_taker_fee(self) -> float:
+        return self._futures_exchange_service.get_taker_fee()
+
+    async def _single_flight(self, method_name: str, call: Callable[[], Awaitable[Any]], *args: Hashable) -> Any:
+        key = (method_name, *args)
+        task = self._in_flight_calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._in_flight_calls[key] = task
+            task.add_done_callback(lambda _: self._in_flight_calls.pop(key, None))
+        else:
+            self._saved_calls[method_name] += 1
+            logger.debug(f"{method_name}{args} joined an identical call in flight")
+        # XXX: Shielded, so a cancelled caller (e.g. timeout) does not cancel the call shared with the rest
+        ret = await asyncio.shield(task)
+        # Lists are copied, so callers do not see each other's changes
+        return list(ret) if isinstance(ret, list) else ret
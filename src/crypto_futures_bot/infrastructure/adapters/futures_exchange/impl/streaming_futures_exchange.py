@@ -0,0 +1,142 @@
+from typing import Any, override
+
+from crypto_futures_bot.config.configuration_properties import ConfigurationProperties
+from crypto_futures_bot.domain.types import Timeframe
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.base import AbstractFuturesExchangeService
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo import (
+    AccountInfo,
+    AccountSnapshot,
+    CreateMarketPositionOrder,
+    FuturesWallet,
+    PortfolioBalance,
+    Position,
+    SymbolMarketConfig,
+    SymbolTicker,
+)
+from crypto_futures_bot.infrastructure.adapters.market_stream.market_data_store import MarketDataStore
+from crypto_futures_bot.infrastructure.adapters.market_stream.mexc_market_stream import MEXCMarketStreamService
+
+
+class StreamingFuturesExchangeService(AbstractFuturesExchangeService):
+    """
+    Wrapper of any futures exchange service, where the price reads are served from the market stream
+    whenever it holds fresh data, falling back to the wrapped service otherwise.
+    Symbols are subscribed the first time they are read, so the following reads come from memory.
+    Everything is delegated as it is when the market stream is disabled.
+    """
+
+    def __init__(
+        self,
+        configuration_properties: ConfigurationProperties,
+        futures_exchange_service: AbstractFuturesExchangeService,
+        market_data_store: MarketDataStore,
+        market_stream_service: MEXCMarketStreamService,
+    ) -> None:
+        super().__init__()
+        self._configuration_properties = configuration_properties
+        self._futures_exchange_service = futures_exchange_service
+        self._market_data_store = market_data_store
+        self._market_stream_service = market_stream_service
+
+    @override
+    async def post_init(self) -> None:
+        await self._futures_exchange_service.post_init()
+        if self._configuration_properties.market_stream_enabled:
+            self._market_stream_service.start()
+
+    @override
+    async def close(self) -> None:
+        await self._market_stream_service.stop()
+        await self._futures_exchange_service.close()
+
+    @override
+    async def get_account_info(self) -> AccountInfo:
+        return await self._futures_exchange_service.get_account_info()
+
+    @override
+    async def get_portfolio_balance(self) -> PortfolioBalance:
+        return await self._futures_exchange_service.get_portfolio_balance()
+
+    @override
+    async def get_futures_wallet(self) -> FuturesWallet:
+        return await self._futures_exchange_service.get_futures_wallet()
+
+    @override
+    async def get_symbol_ticker(self, symbol: str, *, max_age_ms: int | None = None) -> SymbolTicker:
+        if self._configuration_properties.market_stream_enabled:
+            # XXX: No max age demands a fresh quote, so the streamed ticker is only served when one is given
+            if max_age_ms is not None:
+                symbol_ticker = self._market_data_store.get_ticker(
+                    symbol, max_age_seconds=self._get_streamed_ticker_max_age_seconds(max_age_ms)
+                )
+                if symbol_ticker is not None:
+                    return symbol_ticker
+            await self._market_stream_service.subscribe_ticker(symbol)
+        return await self._futures_exchange_service.get_symbol_ticker(symbol, max_age_ms=max_age_ms)
+
+    @override
+    async def get_symbol_tickers(
+        self, *, symbols: list[str] | None = None, max_age_ms: int | None = None
+    ) -> list[SymbolTicker]:
+        # XXX: The whole market is not streamed, so only the tickers of the given symbols can be served from memory
+        if self._configuration_properties.market_stream_enabled and symbols is not None:
+            if max_age_ms is not None:
+                symbol_tickers = [
+                    self._market_data_store.get_ticker(
+                        symbol, max_age_seconds=self._get_streamed_ticker_max_age_seconds(max_age_ms)
+                    )
+                    for symbol in symbols
+                ]
+                if all(symbol_ticker is not None for symbol_ticker in symbol_tickers):
+                    return symbol_tickers
+            for symbol in symbols:
+                await self._market_stream_service.subscribe_ticker(symbol)
+        return await self._futures_exchange_service.get_symbol_tickers(symbols=symbols, max_age_ms=max_age_ms)
+
+    @override
+    async def get_crypto_currencies(self) -> list[str]:
+        return await self._futures_exchange_service.get_crypto_currencies()
+
+    @override
+    async def fetch_ohlcv(
+        self, symbol: str, *, timeframe: Timeframe = "15m", limit: int = 251, since: int | None = None
+    ) -> list[list[Any]]:
+        if self._configuration_properties.market_stream_enabled:
+            ohlcv = self._market_data_store.get_ohlcv(
+                symbol,
+                timeframe=timeframe,
+                limit=limit,
+                since=since,
+                max_age_seconds=self._configuration_properties.market_stream_max_age_seconds,
+            )
+            if ohlcv is not None:
+                return ohlcv
+            await self._market_stream_service.subscribe_kline(symbol, timeframe=timeframe)
+        return await self._futures_exchange_service.fetch_ohlcv(symbol, timeframe=timeframe, limit=limit, since=since)
+
+    @override
+    async def get_symbol_market_config(self, crypto_currency: str) -> SymbolMarketConfig:
+        return await self._futures_exchange_service.get_symbol_market_config(crypto_currency)
+
+    @override
+    async def get_open_positions(self) -> list[Position]:
+        return await self._futures_exchange_service.get_open_positions()
+
+    @override
+    async def get_account_snapshot(self) -> AccountSnapshot:
+        return await self._futures_exchange_service.get_account_snapshot()
+
+    @override
+    async def get_position_by_id(self, position_id: str) -> Position:
+        return await self._futures_exchange_service.get_position_by_id(position_id)
+
+    @override
+    async def create_market_position_order(self, position: CreateMarketPositionOrder) -> Position:
+        return await self._futures_exchange_service.create_market_position_order(position)
+
+    @override
+    def get_taker_fee(self) -> float:
+        return self._futures_exchange_service.get_taker_fee()
+
+    def _get_streamed_ticker_max_age_seconds(self, max_age_ms: int) -> float:
+        return min(self._configuration_properties.market_stream_max_age_seconds, max_age_ms / 1000)
@@ -1,4 +1,5 @@
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo.account_info import AccountInfo
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo.account_snapshot import AccountSnapshot
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo.create_market_position_order import (
     CreateMarketPositionOrder,
 )
@@ -10,6 +11,7 @@ from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo.symbol_ticke
 
 __all__ = [
     "AccountInfo",
+    "AccountSnapshot",
     "PortfolioBalance",
     "Position",
     "SymbolMarketConfig",
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import Any
+
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo.futures_wallet import FuturesWallet
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo.position import Position
+
+
+@dataclass(frozen=True, kw_only=True)
+class AccountSnapshot:
+    # Monotonic counter, so a newer snapshot always has a greater version
+    version: int
+    # Timestamp in milliseconds of the moment it was taken
+    timestamp: int
+    futures_wallet: FuturesWallet
+    positions: list[Position]
+    # Raw open stop orders, by position id
+    stop_orders_by_position_id: dict[str, dict[str, Any]]
+
+    def get_position(self, position_id: str) -> Position | None:
+        return next((position for position in self.positions if position.position_id == position_id), None)
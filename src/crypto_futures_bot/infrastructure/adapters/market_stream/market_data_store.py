@@ -0,0 +1,76 @@
+import time
+from collections import deque
+from typing import Any
+
+from crypto_futures_bot.constants import MARKET_STREAM_CANDLES_HISTORY_SIZE
+from crypto_futures_bot.domain.types import Timeframe
+from crypto_futures_bot.domain.utils.timeframe_utils import get_timeframe_in_milliseconds
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo import SymbolTicker
+
+
+class MarketDataStore:
+    """
+    Latest tickers and candles pushed by the market stream, along with the moment they were received.
+    Reads only return data received within the given max age, so a stalled stream falls back to the REST API.
+    """
+
+    def __init__(self, *, history_size: int = MARKET_STREAM_CANDLES_HISTORY_SIZE) -> None:
+        self._history_size = history_size
+        self._tickers: dict[str, tuple[float, SymbolTicker]] = {}
+        self._candles: dict[tuple[str, Timeframe], deque[list[Any]]] = {}
+        self._candles_received_at: dict[tuple[str, Timeframe], float] = {}
+
+    def update_ticker(self, symbol_ticker: SymbolTicker) -> None:
+        self._tickers[symbol_ticker.symbol] = (time.monotonic(), symbol_ticker)
+
+    def get_ticker(self, symbol: str, *, max_age_seconds: float) -> SymbolTicker | None:
+        received_at, symbol_ticker = self._tickers.get(symbol, (None, None))
+        if received_at is None or time.monotonic() - received_at > max_age_seconds:
+            return None
+        return symbol_ticker
+
+    def update_candle(self, symbol: str, *, timeframe: Timeframe, candle: list[Any]) -> None:
+        key = (symbol, timeframe)
+        candles = self._candles.setdefault(key, deque(maxlen=self._history_size))
+        if not candles or candle[0] > candles[-1][0] + get_timeframe_in_milliseconds(timeframe):
+            # XXX: Candles were missed, so the history starts again from this one
+            candles.clear()
+            candles.append(candle)
+        elif candle[0] == candles[-1][0]:
+            # Restatement of the forming candle
+            candles[-1] = candle
+        elif candle[0] > candles[-1][0]:
+            candles.append(candle)
+        self._candles_received_at[key] = time.monotonic()
+
+    def get_ohlcv(
+        self, symbol: str, *, timeframe: Timeframe, limit: int, since: int | None = None, max_age_seconds: float
+    ) -> list[list[Any]] | None:
+        """
+        Get the streamed candles, only when they fully cover the requested range.
+
+        Args:
+            symbol (str): The symbol.
+            timeframe (Timeframe): The timeframe.
+            limit (int): Maximum number of candles.
+            since (int | None, optional): Open timestamp of the first candle. Defaults to None, the latest ones.
+            max_age_seconds (float): Maximum age of the last received candle.
+
+        Returns:
+            list[list[Any]] | None: The candles, or None if they have to be fetched from the REST API.
+        """
+        key = (symbol, timeframe)
+        candles = self._candles.get(key)
+        received_at = self._candles_received_at.get(key)
+        if not candles or received_at is None or time.monotonic() - received_at > max_age_seconds:
+            return None
+        if since is None:
+            return [list(candle) for candle in candles][-limit:] if len(candles) >= limit else None
+        if candles[0][0] > since:
+            return None
+        return [list(candle) for candle in candles if candle[0] >= since][:limit]
+
+    def clear(self) -> None:
+        self._tickers.clear()
+        self._candles.clear()
+        self._candles_received_at.clear()
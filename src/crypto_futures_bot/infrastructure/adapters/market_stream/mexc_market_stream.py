@@ -0,0 +1,157 @@
+import asyncio
+import json
+import logging
+from contextlib import suppress
+from typing import Any
+
+import aiohttp
+
+from crypto_futures_bot.config.configuration_properties import ConfigurationProperties
+from crypto_futures_bot.constants import (
+    MARKET_STREAM_RECONNECT_MAX_DELAY_SECONDS,
+    MARKET_STREAM_RECONNECT_MIN_DELAY_SECONDS,
+    MEXC_KLINE_INTERVALS,
+    MEXC_MARKET_STREAM_PING_INTERVAL_SECONDS,
+)
+from crypto_futures_bot.domain.types import Timeframe
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo import SymbolTicker
+from crypto_futures_bot.infrastructure.adapters.market_stream.market_data_store import MarketDataStore
+
+logger = logging.getLogger(__name__)
+
+
+class MEXCMarketStreamService:
+    """
+    Subscribes to the MEXC futures ticker and kline channels over WebSocket, keeping the market data store
+    up to date. The connection is re-established automatically, re-sending every subscription,
+    while the store is cleared in the meantime, so no stale data is served.
+    """
+
+    def __init__(self, configuration_properties: ConfigurationProperties, market_data_store: MarketDataStore) -> None:
+        self._configuration_properties = configuration_properties
+        self._market_data_store = market_data_store
+        self._ticker_subscriptions: set[str] = set()
+        self._kline_subscriptions: set[tuple[str, Timeframe]] = set()
+        # Pushed data is stored under the symbol it was subscribed with
+        self._symbols_by_mexc_symbol: dict[str, str] = {}
+        self._websocket: aiohttp.ClientWebSocketResponse | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._kline_timeframes = {interval: timeframe for timeframe, interval in MEXC_KLINE_INTERVALS.items()}
+
+    @property
+    def is_connected(self) -> bool:
+        return self._websocket is not None and not self._websocket.closed
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def subscribe_ticker(self, symbol: str) -> None:
+        if symbol not in self._ticker_subscriptions:
+            self._ticker_subscriptions.add(symbol)
+            self._symbols_by_mexc_symbol[self._to_mexc_symbol(symbol)] = symbol
+            await self._send_if_connected(self._get_ticker_subscription(symbol))
+
+    async def subscribe_kline(self, symbol: str, *, timeframe: Timeframe) -> None:
+        if timeframe in MEXC_KLINE_INTERVALS and (symbol, timeframe) not in self._kline_subscriptions:
+            self._kline_subscriptions.add((symbol, timeframe))
+            self._symbols_by_mexc_symbol[self._to_mexc_symbol(symbol)] = symbol
+            await self._send_if_connected(self._get_kline_subscription(symbol, timeframe=timeframe))
+
+    async def _run(self) -> None:
+        reconnect_delay = MARKET_STREAM_RECONNECT_MIN_DELAY_SECONDS
+        while True:
+            try:
+                async with aiohttp.ClientSession() as session:
+                    async with session.ws_connect(self._configuration_properties.mexc_market_stream_url) as websocket:
+                        logger.info("Market stream connected")
+                        reconnect_delay = MARKET_STREAM_RECONNECT_MIN_DELAY_SECONDS
+                        await self._consume(websocket)
+            except (aiohttp.ClientError, OSError, TimeoutError) as e:
+                logger.warning(f"Market stream connection error: {str(e)}")
+            except Exception as e:
+                # XXX: Anything unexpected reconnects as well, instead of stopping the stream for good
+                logger.error(f"Market stream unexpected error: {str(e)}", exc_info=True)
+            finally:
+                self._websocket = None
+                self._market_data_store.clear()
+            logger.info(f"Market stream disconnected, reconnecting in {reconnect_delay} seconds...")
+            await asyncio.sleep(reconnect_delay)
+            reconnect_delay = min(reconnect_delay * 2, MARKET_STREAM_RECONNECT_MAX_DELAY_SECONDS)
+
+    async def _consume(self, websocket: aiohttp.ClientWebSocketResponse) -> None:
+        self._websocket = websocket
+        for symbol in list(self._ticker_subscriptions):
+            await websocket.send_json(self._get_ticker_subscription(symbol))
+        for symbol, timeframe in list(self._kline_subscriptions):
+            await websocket.send_json(self._get_kline_subscription(symbol, timeframe=timeframe))
+        keep_alive_task = asyncio.create_task(self._keep_alive(websocket))
+        try:
+            async for message in websocket:
+                if message.type == aiohttp.WSMsgType.TEXT:
+                    try:
+                        self._handle_message(json.loads(message.data))
+                    except Exception as e:
+                        # Malformed messages are skipped, the following ones are still consumed
+                        logger.warning(f"Market stream malformed message skipped ({str(e)}): {message.data[:256]}")
+                elif message.type == aiohttp.WSMsgType.ERROR:  # pragma: no cover
+                    break
+        finally:
+            keep_alive_task.cancel()
+
+    async def _keep_alive(self, websocket: aiohttp.ClientWebSocketResponse) -> None:
+        while not websocket.closed:
+            await asyncio.sleep(MEXC_MARKET_STREAM_PING_INTERVAL_SECONDS)
+            await websocket.send_json({"method": "ping"})
+
+    def _handle_message(self, message: dict[str, Any]) -> None:
+        channel, data = message.get("channel"), message.get("data")
+        if channel == "push.ticker":
+            self._market_data_store.update_ticker(
+                SymbolTicker(
+                    timestamp=int(data["timestamp"]),
+                    symbol=self._to_unified_symbol(data["symbol"]),
+                    close=float(data["lastPrice"]),
+                    bid=float(data["bid1"]) if data.get("bid1") is not None else None,
+                    ask=float(data["ask1"]) if data.get("ask1") is not None else None,
+                    mark_price=float(data["fairPrice"]) if data.get("fairPrice") is not None else None,
+                )
+            )
+        elif channel == "push.kline" and data.get("interval") in self._kline_timeframes:
+            self._market_data_store.update_candle(
+                self._to_unified_symbol(data["symbol"]),
+                timeframe=self._kline_timeframes[data["interval"]],
+                # XXX: Kline open time is pushed in seconds
+                candle=[int(data["t"]) * 1000, data["o"], data["h"], data["l"], data["c"], data["q"]],
+            )
+        elif channel == "rs.error":
+            logger.warning(f"Market stream error: {data}")
+
+    async def _send_if_connected(self, payload: dict[str, Any]) -> None:
+        if self.is_connected:
+            await self._websocket.send_json(payload)
+
+    def _get_ticker_subscription(self, symbol: str) -> dict[str, Any]:
+        return {"method": "sub.ticker", "param": {"symbol": self._to_mexc_symbol(symbol)}}
+
+    def _get_kline_subscription(self, symbol: str, *, timeframe: Timeframe) -> dict[str, Any]:
+        return {
+            "method": "sub.kline",
+            "param": {"symbol": self._to_mexc_symbol(symbol), "interval": MEXC_KLINE_INTERVALS[timeframe]},
+        }
+
+    def _to_mexc_symbol(self, symbol: str) -> str:
+        return symbol.split(":")[0].replace("/", "_")
+
+    def _to_unified_symbol(self, mexc_symbol: str) -> str:
+        if mexc_symbol in self._symbols_by_mexc_symbol:
+            return self._symbols_by_mexc_symbol[mexc_symbol]
+        base_asset, quote_asset = mexc_symbol.split("_")
+        return f"{base_asset}/{quote_asset}:{quote_asset}"
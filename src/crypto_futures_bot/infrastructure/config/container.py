@@ -4,6 +4,7 @@ from pyee.asyncio import AsyncIOEventEmitter
 from crypto_futures_bot.infrastructure.adapters.config.container import AdaptersContainer
 from crypto_futures_bot.infrastructure.database.config.container import DatabaseContainer
 from crypto_futures_bot.infrastructure.services.config.container import ServicesContainer
+from crypto_futures_bot.infrastructure.services.metrics_service import MetricsService
 from crypto_futures_bot.infrastructure.tasks.config.container import TasksContainer
 
 
@@ -13,10 +14,17 @@ class InfrastructureContainer(containers.DeclarativeContainer):
     messages_formatter = providers.Dependency()
 
     event_emitter = providers.Singleton(AsyncIOEventEmitter)
+    # XXX: Shared by the adapters and the services, so every latency ends up in the same histograms
+    metrics_service = providers.Singleton(MetricsService, configuration_properties=configuration_properties)
 
     database_container = providers.Container(DatabaseContainer, configuration_properties=configuration_properties)
 
-    adapters_container = providers.Container(AdaptersContainer, configuration_properties=configuration_properties)
+    adapters_container = providers.Container(
+        AdaptersContainer,
+        configuration_properties=configuration_properties,
+        # XXX: The adapters only record latencies, so they are given the recorder and not the whole service
+        record_latency=metrics_service.provided.record,
+    )
 
     services_container = providers.Container(
         ServicesContainer,
@@ -26,6 +34,7 @@ class InfrastructureContainer(containers.DeclarativeContainer):
         event_emitter=event_emitter,
         telegram_service=telegram_service,
         messages_formatter=messages_formatter,
+        metrics_service=metrics_service,
     )
     tasks_container = providers.Container(
         TasksContainer,
@@ -33,10 +42,10 @@ class InfrastructureContainer(containers.DeclarativeContainer):
         event_emitter=event_emitter,
         telegram_service=telegram_service,
         push_notification_service=services_container.push_notification_service,
-        tracked_crypto_currency_service=services_container.tracked_crypto_currency_service,
         futures_exchange_service=adapters_container.futures_exchange_service,
         trade_now_service=services_container.trade_now_service,
         crypto_technical_analysis_service=services_container.crypto_technical_analysis_service,
         market_signal_service=services_container.market_signal_service,
-        signal_parametrization_service=services_container.signal_parametrization_service,
+        signals_run_context_service=services_container.signals_run_context_service,
+        metrics_service=metrics_service,
     )
@@ -0,0 +1,48 @@
+"""Add market signal unique constraint
+
+Revision ID: 5f3c8e1d9a27
+Revises: ad10cee819e2
+Create Date: 2026-01-24 10:41:07.512394
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5f3c8e1d9a27"
+down_revision: str | Sequence[str] | None = "ad10cee819e2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: remove duplicated market signals and add the unique constraint."""
+    # Keep the first stored market signal of every (crypto_currency, timeframe, position_type, timestamp)
+    op.execute(
+        """
+        DELETE FROM market_signal
+        WHERE EXISTS (
+            SELECT 1 FROM market_signal other
+            WHERE other.crypto_currency = market_signal.crypto_currency
+            AND other.timeframe = market_signal.timeframe
+            AND other.position_type = market_signal.position_type
+            AND other.timestamp = market_signal.timestamp
+            AND (
+                other.created_at < market_signal.created_at
+                OR (other.created_at = market_signal.created_at AND other.id < market_signal.id)
+            )
+        )
+        """
+    )
+    with op.batch_alter_table("market_signal") as batch_op:
+        batch_op.create_unique_constraint(
+            "uq_market_signal", ["crypto_currency", "timeframe", "position_type", "timestamp"]
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop the unique constraint."""
+    with op.batch_alter_table("market_signal") as batch_op:
+        batch_op.drop_constraint("uq_market_signal", type_="unique")
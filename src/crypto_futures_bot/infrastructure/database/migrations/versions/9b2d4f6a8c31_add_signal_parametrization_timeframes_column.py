@@ -0,0 +1,29 @@
+"""Add signal parametrization timeframes column
+
+Revision ID: 9b2d4f6a8c31
+Revises: 5f3c8e1d9a27
+Create Date: 2026-01-31 09:12:44.103287
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b2d4f6a8c31"
+down_revision: str | Sequence[str] | None = "5f3c8e1d9a27"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("signal_parametrization", sa.Column("timeframes", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("signal_parametrization") as batch_op:
+        batch_op.drop_column("timeframes")
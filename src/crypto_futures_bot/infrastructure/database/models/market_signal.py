@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import UUID, BigInteger, Column, Enum, Float, String
+from sqlalchemy import UUID, BigInteger, Column, Enum, Float, String, UniqueConstraint
 
 from crypto_futures_bot.domain.enums import MarketActionTypeEnum, PositionTypeEnum
 from crypto_futures_bot.domain.types import Timeframe
@@ -9,6 +9,9 @@ from crypto_futures_bot.infrastructure.database.models.base import Persistable
 
 class MarketSignal(Persistable):
     __tablename__ = "market_signal"
+    __table_args__ = (
+        UniqueConstraint("crypto_currency", "timeframe", "position_type", "timestamp", name="uq_market_signal"),
+    )
 
     id: UUID = Column(UUID(as_uuid=True), primary_key=True, nullable=False, default=uuid4)
     timestamp: int = Column(BigInteger, nullable=False)
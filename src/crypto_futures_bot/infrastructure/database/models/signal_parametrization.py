@@ -17,3 +17,5 @@ class SignalParametrization(Persistable):
     long_entry_oversold_threshold: float = Column(Float, nullable=False)
     short_entry_overbought_threshold: float = Column(Float, nullable=False)
     double_confirm_trend: bool = Column(Boolean, nullable=True, default=True)
+    # Comma-separated list of timeframes
+    timeframes: str = Column(String, nullable=True)
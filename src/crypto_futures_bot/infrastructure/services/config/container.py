@@ -6,10 +6,12 @@ from crypto_futures_bot.infrastructure.services.auto_trader_crypto_currency_serv
 from crypto_futures_bot.infrastructure.services.auto_trader_event_handler_service import AutoTraderEventHandlerService
 from crypto_futures_bot.infrastructure.services.crypto_technical_analysis_service import CryptoTechnicalAnalysisService
 from crypto_futures_bot.infrastructure.services.market_signal_service import MarketSignalService
+from crypto_futures_bot.infrastructure.services.ohlcv_buffer_service import OHLCVBufferService
 from crypto_futures_bot.infrastructure.services.orders_analytics_service import OrdersAnalyticsService
 from crypto_futures_bot.infrastructure.services.push_notification_service import PushNotificationService
 from crypto_futures_bot.infrastructure.services.risk_management_service import RiskManagementService
 from crypto_futures_bot.infrastructure.services.signal_parametrization_service import SignalParametrizationService
+from crypto_futures_bot.infrastructure.services.signals_run_context_service import SignalsRunContextService
 from crypto_futures_bot.infrastructure.services.tracked_crypto_currency_service import TrackedCryptoCurrencyService
 from crypto_futures_bot.infrastructure.services.trade_now_service import TradeNowService
 
@@ -21,6 +23,7 @@ class ServicesContainer(containers.DeclarativeContainer):
     messages_formatter = providers.Dependency()
     database_sessionmaker = providers.Dependency()
     futures_exchange_service = providers.Dependency()
+    metrics_service = providers.Dependency()
 
     tracked_crypto_currency_service = providers.Singleton(
         TrackedCryptoCurrencyService, futures_exchange_service=futures_exchange_service
@@ -28,10 +31,18 @@ class ServicesContainer(containers.DeclarativeContainer):
     auto_trader_crypto_currency_service = providers.Singleton(
         AutoTraderCryptoCurrencyService, tracked_crypto_currency_service=tracked_crypto_currency_service
     )
+    ohlcv_buffer_service = providers.Singleton(
+        OHLCVBufferService,
+        configuration_properties=configuration_properties,
+        futures_exchange_service=futures_exchange_service,
+    )
     crypto_technical_analysis_service = providers.Singleton(
         CryptoTechnicalAnalysisService,
+        configuration_properties=configuration_properties,
         tracked_crypto_currency_service=tracked_crypto_currency_service,
         futures_exchange_service=futures_exchange_service,
+        ohlcv_buffer_service=ohlcv_buffer_service,
+        metrics_service=metrics_service,
     )
     push_notification_service = providers.Singleton(
         PushNotificationService, configuration_properties=configuration_properties
@@ -45,8 +56,17 @@ class ServicesContainer(containers.DeclarativeContainer):
     )
     signal_parametrization_service = providers.Singleton(SignalParametrizationService)
     risk_management_service = providers.Singleton(RiskManagementService)
+    signals_run_context_service = providers.Singleton(
+        SignalsRunContextService,
+        tracked_crypto_currency_service=tracked_crypto_currency_service,
+        signal_parametrization_service=signal_parametrization_service,
+        auto_trader_crypto_currency_service=auto_trader_crypto_currency_service,
+        risk_management_service=risk_management_service,
+        push_notification_service=push_notification_service,
+    )
     trade_now_service = providers.Singleton(
         TradeNowService,
+        configuration_properties=configuration_properties,
         futures_exchange_service=futures_exchange_service,
         crypto_technical_analysis_service=crypto_technical_analysis_service,
         orders_analytics_service=orders_analytics_service,
@@ -1,17 +1,30 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from datetime import UTC, datetime
 from typing import Any
 
 import backoff
+import numpy as np
 import pandas as pd
 import pydash
-from ta.momentum import RSIIndicator, StochRSIIndicator
-from ta.trend import MACD, EMAIndicator
-from ta.volatility import AverageTrueRange
 
+from crypto_futures_bot.config.configuration_properties import ConfigurationProperties
 from crypto_futures_bot.domain.enums.candlestick_enum import CandleStickEnum
 from crypto_futures_bot.domain.types import Timeframe
+from crypto_futures_bot.domain.utils.timeframe_utils import get_last_closed_candle_timestamp
 from crypto_futures_bot.domain.vo.candlestick_indicators import CandleStickIndicators
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.base import AbstractFuturesExchangeService
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo.symbol_ticker import SymbolTicker
+from crypto_futures_bot.infrastructure.services.indicators import (
+    INDICATOR_COLUMNS,
+    OHLCV_COLUMNS,
+    IncrementalIndicators,
+)
+from crypto_futures_bot.infrastructure.services.indicators.registry import calculate_indicators
+from crypto_futures_bot.infrastructure.services.metrics_service import MetricsService
+from crypto_futures_bot.infrastructure.services.ohlcv_buffer_service import OHLCVBufferService
 from crypto_futures_bot.infrastructure.services.tracked_crypto_currency_service import TrackedCryptoCurrencyService
 from crypto_futures_bot.interfaces.telegram.services.utils import backoff_on_backoff_handler
 
@@ -19,17 +32,33 @@ from crypto_futures_bot.interfaces.telegram.services.utils import backoff_on_bac
 class CryptoTechnicalAnalysisService:
     def __init__(
         self,
+        configuration_properties: ConfigurationProperties,
         tracked_crypto_currency_service: TrackedCryptoCurrencyService,
         futures_exchange_service: AbstractFuturesExchangeService,
+        ohlcv_buffer_service: OHLCVBufferService,
+        metrics_service: MetricsService,
     ) -> None:
+        self._configuration_properties = configuration_properties
         self._futures_exchange_service = futures_exchange_service
+        self._ohlcv_buffer_service = ohlcv_buffer_service
+        self._metrics_service = metrics_service
+        self._incremental_indicators: dict[tuple[str, Timeframe], IncrementalIndicators] = {}
+        # XXX: Indicators are calculated in worker threads, so the streaming state is guarded per (symbol, timeframe)
+        self._incremental_indicators_locks: dict[tuple[str, Timeframe], threading.Lock] = {}
+        # Live technical analysis by (symbol, timeframe, open timestamp of the last closed candle),
+        # along with the monotonic time when it was calculated. Least recently used entries go first
+        self._technical_analysis_cache: OrderedDict[tuple[str, Timeframe, int], tuple[float, pd.DataFrame]] = (
+            OrderedDict()
+        )
         self._tracked_crypto_currency_service = tracked_crypto_currency_service
 
     async def get_tracked_crypto_currency_prices(self) -> list[SymbolTicker]:
         tracked_crypto_currencies = await self._tracked_crypto_currency_service.find_all()
         account_info = await self._futures_exchange_service.get_account_info()
         symbols = [crypto_currency.to_symbol(account_info) for crypto_currency in tracked_crypto_currencies]
-        tickers = await self._futures_exchange_service.get_symbol_tickers(symbols=symbols)
+        tickers = await self._futures_exchange_service.get_symbol_tickers(
+            symbols=symbols, max_age_ms=self._configuration_properties.ticker_max_age_ms
+        )
         ret = pydash.order_by(tickers, ["base_asset", "quote_asset"], ["asc", "asc"])
         return ret
 
@@ -56,14 +85,134 @@ class CryptoTechnicalAnalysisService:
         on_backoff=backoff_on_backoff_handler,
     )
     async def get_technical_analysis(
-        self, symbol: str, *, timeframe: Timeframe = "15m", ohlcv: list[list[Any]] | None = None
+        self,
+        symbol: str,
+        *,
+        timeframe: Timeframe = "15m",
+        ohlcv: list[list[Any]] | None = None,
+        indicators: list[str] | None = None,
     ) -> pd.DataFrame:
+        """
+        Get the technical analysis of the symbol, either live or over the given OHLCV history.
+        Over a history, only the `indicators` columns (and their dependencies) are calculated, all of them by default.
+        The live path streams every indicator in constant time per candle, so `indicators` does not apply to it.
+        """
         if ohlcv is None:
-            ohlcv = await self._futures_exchange_service.fetch_ohlcv(symbol=symbol, timeframe=timeframe)
-        df = pd.DataFrame(ohlcv, columns=["timestamp", "Open", "High", "Low", "Close", "Volume"])
+            # Live path: only the latest candles are needed, calculated incrementally
+            df = self._get_cached_technical_analysis(symbol, timeframe=timeframe)
+            if df is None:
+                with self._metrics_service.span("ohlcv_fetch", symbol=symbol):
+                    ohlcv = await self._ohlcv_buffer_service.get_ohlcv(symbol, timeframe=timeframe)
+                with self._metrics_service.span("indicators", symbol=symbol):
+                    df = await asyncio.to_thread(
+                        self._get_live_technical_analysis, symbol, timeframe=timeframe, ohlcv=ohlcv
+                    )
+                self._cache_technical_analysis(symbol, timeframe=timeframe, technical_analysis_df=df)
+        else:
+            df = await asyncio.to_thread(self._get_historical_technical_analysis, ohlcv, indicators=indicators)
+        return df
+
+    async def get_technical_analysis_many(
+        self, timeframes_by_symbol: dict[str, list[Timeframe]], *, timeout: float | None = None
+    ) -> dict[str, dict[Timeframe, pd.DataFrame] | Exception]:
+        """
+        Get the live technical analysis of many symbols at once, over the given timeframes of each symbol.
+        Symbols are analysed concurrently, bounded by `technical_analysis_max_concurrency`,
+        while the indicators are calculated in worker threads, so the event loop is never blocked.
+        Each symbol is given its own `timeout`, and a symbol which fails is mapped to its exception,
+        so it never aborts the rest of them.
+        """
+        semaphore = asyncio.Semaphore(self._configuration_properties.technical_analysis_max_concurrency)
+        results = await asyncio.gather(
+            *[
+                self._bounded_get_technical_analysis_by_timeframe(
+                    symbol, timeframes=timeframes, timeout=timeout, semaphore=semaphore
+                )
+                for symbol, timeframes in timeframes_by_symbol.items()
+            ],
+            return_exceptions=True,
+        )
+        return dict(zip(timeframes_by_symbol, results, strict=True))
+
+    async def get_technical_analysis_by_timeframe(
+        self, symbol: str, *, timeframes: list[Timeframe]
+    ) -> dict[Timeframe, pd.DataFrame]:
+        cached_technical_analysis = {
+            timeframe: self._get_cached_technical_analysis(symbol, timeframe=timeframe) for timeframe in timeframes
+        }
+        ret = {timeframe: df for timeframe, df in cached_technical_analysis.items() if df is not None}
+        if missing_timeframes := [timeframe for timeframe in timeframes if timeframe not in ret]:
+            with self._metrics_service.span("ohlcv_fetch", symbol=symbol):
+                ohlcv_by_timeframe = await self._ohlcv_buffer_service.get_ohlcv_by_timeframe(
+                    symbol, timeframes=missing_timeframes
+                )
+            with self._metrics_service.span("indicators", symbol=symbol):
+                for timeframe, ohlcv in ohlcv_by_timeframe.items():
+                    ret[timeframe] = await asyncio.to_thread(
+                        self._get_live_technical_analysis, symbol, timeframe=timeframe, ohlcv=ohlcv
+                    )
+                    self._cache_technical_analysis(symbol, timeframe=timeframe, technical_analysis_df=ret[timeframe])
+        return {timeframe: ret[timeframe] for timeframe in timeframes}
+
+    async def _bounded_get_technical_analysis_by_timeframe(
+        self, symbol: str, *, timeframes: list[Timeframe], timeout: float | None, semaphore: asyncio.Semaphore
+    ) -> dict[Timeframe, pd.DataFrame]:
+        async with semaphore, asyncio.timeout(timeout):
+            return await self.get_technical_analysis_by_timeframe(symbol=symbol, timeframes=timeframes)
+
+    def _get_cached_technical_analysis(self, symbol: str, *, timeframe: Timeframe) -> pd.DataFrame | None:
+        key = (symbol, timeframe, get_last_closed_candle_timestamp(timeframe, datetime.now(UTC)))
+        ret: pd.DataFrame | None = None
+        if key in self._technical_analysis_cache:
+            calculated_at, df = self._technical_analysis_cache[key]
+            if time.monotonic() - calculated_at < self._configuration_properties.technical_analysis_cache_ttl_seconds:
+                self._technical_analysis_cache.move_to_end(key)
+                ret = df
+            else:
+                del self._technical_analysis_cache[key]
+        return ret
+
+    def _cache_technical_analysis(
+        self, symbol: str, *, timeframe: Timeframe, technical_analysis_df: pd.DataFrame
+    ) -> None:
+        """
+        Cache the technical analysis, so every consumer within the same candle shares it.
+        It is only cached when its LAST candle is the last closed one,
+        otherwise the exchange has not published the closed candle yet.
+        """
+        last_closed_candle_timestamp = get_last_closed_candle_timestamp(timeframe, datetime.now(UTC))
+        if (
+            self._configuration_properties.technical_analysis_cache_max_size <= 0
+            or len(technical_analysis_df) < abs(CandleStickEnum.LAST.value)
+            or int(technical_analysis_df.index[CandleStickEnum.LAST.value].timestamp() * 1000)
+            != last_closed_candle_timestamp
+        ):
+            return
+        key = (symbol, timeframe, last_closed_candle_timestamp)
+        self._technical_analysis_cache[key] = (time.monotonic(), technical_analysis_df)
+        self._technical_analysis_cache.move_to_end(key)
+        while len(self._technical_analysis_cache) > self._configuration_properties.technical_analysis_cache_max_size:
+            self._technical_analysis_cache.popitem(last=False)
+
+    def _get_live_technical_analysis(
+        self, symbol: str, *, timeframe: Timeframe, ohlcv: list[list[Any]]
+    ) -> pd.DataFrame:
+        df = pd.DataFrame(
+            self._calculate_incremental_indicators(symbol, timeframe=timeframe, ohlcv=ohlcv),
+            columns=OHLCV_COLUMNS + INDICATOR_COLUMNS,
+        )
+        df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
+        return self._clean_technical_analysis(df)
+
+    def _get_historical_technical_analysis(
+        self, ohlcv: list[list[Any]], *, indicators: list[str] | None = None
+    ) -> pd.DataFrame:
+        df = pd.DataFrame(ohlcv, columns=OHLCV_COLUMNS)
         df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
+        df = self._calculate_indicators(df, indicators=indicators)
+        return self._clean_technical_analysis(df)
 
-        df = self._calculate_indicators(df)
+    def _clean_technical_analysis(self, df: pd.DataFrame) -> pd.DataFrame:
         # Drop NaN values and reset the index.
         # This cleans the data from the shorter lookback periods of the simple indicators.
         df.dropna(inplace=True)
@@ -71,28 +220,52 @@ class CryptoTechnicalAnalysisService:
         df.set_index("timestamp", inplace=True)
         return df
 
-    def _calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _calculate_incremental_indicators(
+        self, symbol: str, *, timeframe: Timeframe, ohlcv: list[list[Any]]
+    ) -> list[dict[str, Any]]:
+        if not ohlcv:
+            return []
+        key = (symbol, timeframe)
+        with self._incremental_indicators_locks.setdefault(key, threading.Lock()):
+            return self._calculate_incremental_indicators_unlocked(key, ohlcv=ohlcv)
+
+    def _calculate_incremental_indicators_unlocked(
+        self, key: tuple[str, Timeframe], *, ohlcv: list[list[Any]]
+    ) -> list[dict[str, Any]]:
+        *closed_ohlcv, forming_candle = ohlcv
+        incremental_indicators = self._incremental_indicators.get(key)
+        if (
+            incremental_indicators is None
+            or not closed_ohlcv
+            or not closed_ohlcv[0][0] <= incremental_indicators.last_timestamp <= closed_ohlcv[-1][0]
+        ):
+            # XXX: Not seeded yet, or the buffer has been re-seeded far away from the committed state
+            incremental_indicators = IncrementalIndicators()
+            self._incremental_indicators[key] = incremental_indicators
+            new_closed_ohlcv = closed_ohlcv
+        else:
+            new_closed_ohlcv = self._get_new_closed_candles(closed_ohlcv, incremental_indicators)
+        for candle in new_closed_ohlcv:
+            incremental_indicators.commit(candle)
+        return incremental_indicators.get_rows() + [incremental_indicators.preview(forming_candle)]
+
+    def _get_new_closed_candles(
+        self, closed_ohlcv: list[list[Any]], incremental_indicators: IncrementalIndicators
+    ) -> list[list[Any]]:
+        start = len(closed_ohlcv)
+        while start > 0 and closed_ohlcv[start - 1][0] > incremental_indicators.last_timestamp:
+            start -= 1
+        return closed_ohlcv[start:]
+
+    def _calculate_indicators(self, df: pd.DataFrame, *, indicators: list[str] | None = None) -> pd.DataFrame:
         df = df.copy()
-        # EMAs
-        df["ema50"] = EMAIndicator(df["Close"], window=50).ema_indicator()  # MACD
-        macd = MACD(df["Close"])
-        df["macd_line"] = macd.macd()
-        df["macd_signal"] = macd.macd_signal()
-        df["macd_hist"] = macd.macd_diff()
-
-        # Stochastic RSI
-        stoch_rsi = StochRSIIndicator(df["Close"])
-        df["stoch_rsi"] = stoch_rsi.stochrsi()
-        df["stoch_rsi_k"] = stoch_rsi.stochrsi_k()
-        df["stoch_rsi_d"] = stoch_rsi.stochrsi_d()
-
-        # Relative Strength Index (RSI)
-        df["rsi"] = RSIIndicator(df["Close"]).rsi()
-
-        # Average True Range (ATR)
-        df["atr"] = AverageTrueRange(df["High"], df["Low"], df["Close"]).average_true_range()
-
-        # Relative Volume (RVOL)
-        df["volume_sma"] = df["Volume"].rolling(window=20).mean()
-        df["relative_volume"] = df["Volume"] / df["volume_sma"]
+        indicators = calculate_indicators(
+            high=df["High"].to_numpy(dtype=np.float64),
+            low=df["Low"].to_numpy(dtype=np.float64),
+            close=df["Close"].to_numpy(dtype=np.float64),
+            volume=df["Volume"].to_numpy(dtype=np.float64),
+            columns=indicators,
+        )
+        for column, values in indicators.items():
+            df[column] = values
         return df
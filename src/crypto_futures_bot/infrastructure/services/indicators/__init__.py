@@ -0,0 +1,20 @@
+from crypto_futures_bot.infrastructure.services.indicators.constants import INDICATOR_COLUMNS, OHLCV_COLUMNS
+from crypto_futures_bot.infrastructure.services.indicators.incremental_indicators import IncrementalIndicators
+from crypto_futures_bot.infrastructure.services.indicators.signals import (
+    STRATEGY_INDICATOR_COLUMNS,
+    evaluate_entry_signals,
+    get_entry_signals,
+    stack_candlestick_indicators,
+    stack_signal_parametrization_items,
+)
+
+__all__ = [
+    "IncrementalIndicators",
+    "INDICATOR_COLUMNS",
+    "OHLCV_COLUMNS",
+    "STRATEGY_INDICATOR_COLUMNS",
+    "evaluate_entry_signals",
+    "get_entry_signals",
+    "stack_candlestick_indicators",
+    "stack_signal_parametrization_items",
+]
@@ -0,0 +1,26 @@
+# Same windows as the defaults of the `ta` indicators
+EMA_WINDOW = 50
+MACD_FAST_WINDOW = 12
+MACD_SLOW_WINDOW = 26
+MACD_SIGNAL_WINDOW = 9
+RSI_WINDOW = 14
+STOCH_RSI_WINDOW = 14
+STOCH_RSI_SMOOTH_K_WINDOW = 3
+STOCH_RSI_SMOOTH_D_WINDOW = 3
+ATR_WINDOW = 14
+VOLUME_SMA_WINDOW = 20
+
+OHLCV_COLUMNS = ["timestamp", "Open", "High", "Low", "Close", "Volume"]
+INDICATOR_COLUMNS = [
+    "ema50",
+    "macd_line",
+    "macd_signal",
+    "macd_hist",
+    "stoch_rsi",
+    "stoch_rsi_k",
+    "stoch_rsi_d",
+    "rsi",
+    "atr",
+    "volume_sma",
+    "relative_volume",
+]
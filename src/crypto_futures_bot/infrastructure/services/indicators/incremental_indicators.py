@@ -0,0 +1,180 @@
+import math
+from collections import deque
+from copy import deepcopy
+from typing import Any
+
+from crypto_futures_bot.domain.enums.candlestick_enum import CandleStickEnum
+from crypto_futures_bot.infrastructure.services.indicators.constants import (
+    ATR_WINDOW,
+    EMA_WINDOW,
+    INDICATOR_COLUMNS,
+    MACD_FAST_WINDOW,
+    MACD_SIGNAL_WINDOW,
+    MACD_SLOW_WINDOW,
+    OHLCV_COLUMNS,
+    RSI_WINDOW,
+    STOCH_RSI_SMOOTH_D_WINDOW,
+    STOCH_RSI_SMOOTH_K_WINDOW,
+    STOCH_RSI_WINDOW,
+    VOLUME_SMA_WINDOW,
+)
+
+
+class _ExponentialMovingAverage:
+    """
+    Equivalent to `Series.ewm(alpha=alpha, min_periods=min_periods, adjust=False).mean()`
+    """
+
+    def __init__(self, *, alpha: float, min_periods: int) -> None:
+        self._alpha = alpha
+        self._min_periods = min_periods
+        self._value = math.nan
+        self._count = 0
+
+    @staticmethod
+    def from_span(span: int) -> "_ExponentialMovingAverage":
+        return _ExponentialMovingAverage(alpha=2 / (span + 1), min_periods=span)
+
+    def update(self, value: float) -> float:
+        if not math.isnan(value):
+            self._value = value if self._count == 0 else self._alpha * value + (1 - self._alpha) * self._value
+            self._count += 1
+        return self._value if self._count >= self._min_periods else math.nan
+
+
+class _RollingWindow:
+    """
+    Equivalent to `Series.rolling(window)`, so any NaN within the window makes the aggregation NaN
+    """
+
+    def __init__(self, window: int) -> None:
+        self._values: deque[float] = deque(maxlen=window)
+
+    def update(self, value: float) -> None:
+        self._values.append(value)
+
+    def _is_ready(self) -> bool:
+        return len(self._values) == self._values.maxlen and not any(math.isnan(value) for value in self._values)
+
+    def mean(self) -> float:
+        return sum(self._values) / len(self._values) if self._is_ready() else math.nan
+
+    def min(self) -> float:
+        return min(self._values) if self._is_ready() else math.nan
+
+    def max(self) -> float:
+        return max(self._values) if self._is_ready() else math.nan
+
+
+class _AverageTrueRange:
+    """
+    Equivalent to `ta.volatility.AverageTrueRange`: zeros during the warm-up,
+    the mean of the first true ranges and Wilder's smoothing afterwards
+    """
+
+    def __init__(self, window: int) -> None:
+        self._window = window
+        self._count = 0
+        self._true_range_sum = 0.0
+        self._value = 0.0
+
+    def update(self, true_range: float) -> float:
+        self._count += 1
+        if self._count < self._window:
+            self._true_range_sum += true_range
+        elif self._count == self._window:
+            self._value = (self._true_range_sum + true_range) / self._window
+        else:
+            self._value = (self._value * (self._window - 1) + true_range) / self._window
+        return self._value
+
+
+class _IndicatorsState:
+    def __init__(self) -> None:
+        self.last_timestamp: int | None = None
+        self.previous_close = math.nan
+        self.ema = _ExponentialMovingAverage.from_span(EMA_WINDOW)
+        self.macd_fast_ema = _ExponentialMovingAverage.from_span(MACD_FAST_WINDOW)
+        self.macd_slow_ema = _ExponentialMovingAverage.from_span(MACD_SLOW_WINDOW)
+        self.macd_signal_ema = _ExponentialMovingAverage.from_span(MACD_SIGNAL_WINDOW)
+        self.rsi_up_ema = _ExponentialMovingAverage(alpha=1 / RSI_WINDOW, min_periods=RSI_WINDOW)
+        self.rsi_down_ema = _ExponentialMovingAverage(alpha=1 / RSI_WINDOW, min_periods=RSI_WINDOW)
+        self.rsi_window = _RollingWindow(STOCH_RSI_WINDOW)
+        self.stoch_rsi_k_window = _RollingWindow(STOCH_RSI_SMOOTH_K_WINDOW)
+        self.stoch_rsi_d_window = _RollingWindow(STOCH_RSI_SMOOTH_D_WINDOW)
+        self.atr = _AverageTrueRange(ATR_WINDOW)
+        self.volume_window = _RollingWindow(VOLUME_SMA_WINDOW)
+
+    def update(self, candle: list[Any]) -> dict[str, Any]:
+        timestamp, open_price, high, low, close, volume = candle[:6]
+        self.last_timestamp = timestamp
+        # EMAs
+        ema50 = self.ema.update(close)
+        # MACD
+        macd_line = self.macd_fast_ema.update(close) - self.macd_slow_ema.update(close)
+        macd_signal = self.macd_signal_ema.update(macd_line)
+        macd_hist = macd_line - macd_signal
+        # Relative Strength Index (RSI)
+        diff = close - self.previous_close if not math.isnan(self.previous_close) else 0.0
+        up_ema = self.rsi_up_ema.update(max(diff, 0.0))
+        down_ema = self.rsi_down_ema.update(max(-diff, 0.0))
+        if math.isnan(down_ema):
+            rsi = math.nan
+        elif down_ema == 0:
+            rsi = 100.0
+        else:
+            rsi = 100 - (100 / (1 + up_ema / down_ema))
+        # Stochastic RSI
+        self.rsi_window.update(rsi)
+        lowest_rsi, highest_rsi = self.rsi_window.min(), self.rsi_window.max()
+        stoch_rsi = (rsi - lowest_rsi) / (highest_rsi - lowest_rsi) if highest_rsi != lowest_rsi else math.nan
+        self.stoch_rsi_k_window.update(stoch_rsi)
+        stoch_rsi_k = self.stoch_rsi_k_window.mean()
+        self.stoch_rsi_d_window.update(stoch_rsi_k)
+        stoch_rsi_d = self.stoch_rsi_d_window.mean()
+        # Average True Range (ATR)
+        true_range = high - low
+        if not math.isnan(self.previous_close):
+            true_range = max(true_range, abs(high - self.previous_close), abs(low - self.previous_close))
+        atr = self.atr.update(true_range)
+        # Relative Volume (RVOL)
+        self.volume_window.update(volume)
+        volume_sma = self.volume_window.mean()
+        relative_volume = volume / volume_sma if volume_sma else math.nan
+
+        self.previous_close = close
+        return dict(
+            zip(
+                OHLCV_COLUMNS + INDICATOR_COLUMNS,
+                [timestamp, open_price, high, low, close, volume, ema50, macd_line, macd_signal, macd_hist]
+                + [stoch_rsi, stoch_rsi_k, stoch_rsi_d, rsi, atr, volume_sma, relative_volume],
+                strict=True,
+            )
+        )
+
+
+class IncrementalIndicators:
+    """
+    Streaming version of the technical indicators of a single (symbol, timeframe).
+    Every closed candle is committed in constant time, while the forming candle
+    is evaluated provisionally, without altering the committed state.
+    """
+
+    def __init__(self, *, history_size: int = len(CandleStickEnum) - 1) -> None:
+        self._state = _IndicatorsState()
+        self._rows: deque[dict[str, Any]] = deque(maxlen=history_size)
+
+    @property
+    def last_timestamp(self) -> int | None:
+        return self._state.last_timestamp
+
+    def commit(self, candle: list[Any]) -> dict[str, Any]:
+        row = self._state.update(candle)
+        self._rows.append(row)
+        return row
+
+    def preview(self, candle: list[Any]) -> dict[str, Any]:
+        return deepcopy(self._state).update(candle)
+
+    def get_rows(self) -> list[dict[str, Any]]:
+        return list(self._rows)
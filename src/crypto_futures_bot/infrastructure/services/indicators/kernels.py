@@ -0,0 +1,157 @@
+"""
+Vectorized NumPy kernels of the technical indicators, numerically equivalent to the `ta` library.
+Every kernel takes and returns contiguous float64 arrays, avoiding the pandas Series overhead.
+"""
+
+import math
+from collections.abc import Callable
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from crypto_futures_bot.infrastructure.services.indicators.constants import (
+    ATR_WINDOW,
+    EMA_WINDOW,
+    MACD_FAST_WINDOW,
+    MACD_SIGNAL_WINDOW,
+    MACD_SLOW_WINDOW,
+    RSI_WINDOW,
+    STOCH_RSI_SMOOTH_D_WINDOW,
+    STOCH_RSI_SMOOTH_K_WINDOW,
+    STOCH_RSI_WINDOW,
+    VOLUME_SMA_WINDOW,
+)
+
+# XXX: Upper bound of the growth of the rescaled terms within a block, far away from the float64 overflow
+_MAX_BLOCK_GROWTH_EXPONENT = 300.0
+
+
+def ewm(values: np.ndarray, *, alpha: float, min_periods: int = 0, initial: float | None = None) -> np.ndarray:
+    """Exponentially weighted mean, equivalent to `Series.ewm(alpha=alpha, adjust=False).mean()`.
+
+    The recursion y[t] = alpha * x[t] + (1 - alpha) * y[t - 1] is solved in closed form block by block,
+    so there is no Python loop per element. Leading NaN values are skipped.
+
+    Args:
+        values (np.ndarray): The input values.
+        alpha (float): The smoothing factor.
+        min_periods (int, optional): Minimum number of observations to have a value. Defaults to 0.
+        initial (float | None, optional): Value of y[-1] prior to the first observation. Defaults to None,
+            which means the first observation is used as is.
+
+    Returns:
+        np.ndarray: The exponentially weighted mean.
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    ret = np.full(values.shape, np.nan)
+    valid_indexes = np.flatnonzero(~np.isnan(values))
+    if valid_indexes.size == 0:
+        return ret
+    start = int(valid_indexes[0])
+    decay = 1.0 - alpha
+    block_size = max(1, int(_MAX_BLOCK_GROWTH_EXPONENT / -math.log(decay))) if decay > 0 else 1
+    previous = values[start] if initial is None else initial
+    block_start = start if initial is not None else start + 1
+    ret[start] = previous
+    for offset in range(block_start, len(values), block_size):
+        block = values[offset : offset + block_size]
+        exponents = np.arange(1, len(block) + 1, dtype=np.float64)
+        decay_powers = decay**exponents
+        ret[offset : offset + len(block)] = decay_powers * (previous + np.cumsum(alpha * block / decay_powers))
+        previous = ret[offset + len(block) - 1]
+    if min_periods > 1:
+        ret[: start + min_periods - 1] = np.nan
+    return ret
+
+
+def ema(values: np.ndarray, window: int = EMA_WINDOW) -> np.ndarray:
+    """Exponential moving average, equivalent to `ta.trend.EMAIndicator`."""
+    return ewm(values, alpha=2.0 / (window + 1), min_periods=window)
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling mean, equivalent to `Series.rolling(window).mean()`."""
+    return _rolling(values, window, np.mean)
+
+
+def rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling minimum, equivalent to `Series.rolling(window).min()`."""
+    return _rolling(values, window, np.min)
+
+
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling maximum, equivalent to `Series.rolling(window).max()`."""
+    return _rolling(values, window, np.max)
+
+
+def macd(
+    close: np.ndarray,
+    *,
+    window_fast: int = MACD_FAST_WINDOW,
+    window_slow: int = MACD_SLOW_WINDOW,
+    window_sign: int = MACD_SIGNAL_WINDOW,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal and histogram, equivalent to `ta.trend.MACD`."""
+    macd_line = ema(close, window_fast) - ema(close, window_slow)
+    macd_signal = ema(macd_line, window_sign)
+    return macd_line, macd_signal, macd_line - macd_signal
+
+
+def rsi(close: np.ndarray, window: int = RSI_WINDOW) -> np.ndarray:
+    """Wilder's Relative Strength Index, equivalent to `ta.momentum.RSIIndicator`."""
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    diff = np.zeros_like(close)
+    diff[1:] = np.diff(close)
+    up_ema = ewm(np.where(diff > 0, diff, 0.0), alpha=1.0 / window, min_periods=window)
+    down_ema = ewm(np.where(diff < 0, -diff, 0.0), alpha=1.0 / window, min_periods=window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(down_ema == 0, 100.0, 100.0 - (100.0 / (1.0 + up_ema / down_ema)))
+
+
+def stoch_rsi(
+    close: np.ndarray,
+    *,
+    window: int = STOCH_RSI_WINDOW,
+    smooth1: int = STOCH_RSI_SMOOTH_K_WINDOW,
+    smooth2: int = STOCH_RSI_SMOOTH_D_WINDOW,
+    rsi_values: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Stochastic RSI and its %K and %D, equivalent to `ta.momentum.StochRSIIndicator`."""
+    rsi_values = rsi(close, window) if rsi_values is None else rsi_values
+    lowest_rsi, highest_rsi = rolling_min(rsi_values, window), rolling_max(rsi_values, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stoch_rsi_values = (rsi_values - lowest_rsi) / (highest_rsi - lowest_rsi)
+    stoch_rsi_k = rolling_mean(stoch_rsi_values, smooth1)
+    stoch_rsi_d = rolling_mean(stoch_rsi_k, smooth2)
+    return stoch_rsi_values, stoch_rsi_k, stoch_rsi_d
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, window: int = ATR_WINDOW) -> np.ndarray:
+    """Average True Range, equivalent to `ta.volatility.AverageTrueRange` (zeros during the warm-up)."""
+    high = np.ascontiguousarray(high, dtype=np.float64)
+    low = np.ascontiguousarray(low, dtype=np.float64)
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    true_range = high - low
+    true_range[1:] = np.maximum.reduce([true_range[1:], np.abs(high[1:] - close[:-1]), np.abs(low[1:] - close[:-1])])
+    ret = np.zeros_like(close)
+    if len(close) >= window:
+        # The first value is the plain mean of the first true ranges
+        ret[window - 1] = true_range[:window].mean()
+        ret[window:] = ewm(true_range[window:], alpha=1.0 / window, initial=ret[window - 1])
+    return ret
+
+
+def relative_volume(volume: np.ndarray, window: int = VOLUME_SMA_WINDOW) -> tuple[np.ndarray, np.ndarray]:
+    """Volume simple moving average and the relative volume against it."""
+    volume = np.ascontiguousarray(volume, dtype=np.float64)
+    volume_sma = rolling_mean(volume, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return volume_sma, volume / volume_sma
+
+
+def _rolling(values: np.ndarray, window: int, aggregation: Callable[..., np.ndarray]) -> np.ndarray:
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    ret = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        ret[window - 1 :] = aggregation(sliding_window_view(values, window), axis=1)
+    return ret
@@ -0,0 +1,124 @@
+"""
+Declarative registry of the technical indicators, along with the columns each one depends on.
+Only the indicators which are asked for, and their dependencies, are calculated.
+"""
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+
+import numpy as np
+
+from crypto_futures_bot.infrastructure.services.indicators.constants import INDICATOR_COLUMNS, OHLCV_COLUMNS
+from crypto_futures_bot.infrastructure.services.indicators.kernels import (
+    atr,
+    ema,
+    macd,
+    relative_volume,
+    rsi,
+    stoch_rsi,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class IndicatorDefinition:
+    name: str
+    # Columns calculated at once by the indicator
+    columns: tuple[str, ...]
+    # OHLCV or indicator columns the indicator is calculated from
+    inputs: tuple[str, ...]
+    calculate: Callable[[Mapping[str, np.ndarray]], tuple[np.ndarray, ...]]
+
+
+INDICATOR_DEFINITIONS = [
+    IndicatorDefinition(
+        name="ema50", columns=("ema50",), inputs=("Close",), calculate=lambda values: (ema(values["Close"]),)
+    ),
+    IndicatorDefinition(
+        name="macd",
+        columns=("macd_line", "macd_signal", "macd_hist"),
+        inputs=("Close",),
+        calculate=lambda values: macd(values["Close"]),
+    ),
+    IndicatorDefinition(
+        name="rsi", columns=("rsi",), inputs=("Close",), calculate=lambda values: (rsi(values["Close"]),)
+    ),
+    IndicatorDefinition(
+        name="stoch_rsi",
+        columns=("stoch_rsi", "stoch_rsi_k", "stoch_rsi_d"),
+        inputs=("Close", "rsi"),
+        calculate=lambda values: stoch_rsi(values["Close"], rsi_values=values["rsi"]),
+    ),
+    IndicatorDefinition(
+        name="atr",
+        columns=("atr",),
+        inputs=("High", "Low", "Close"),
+        calculate=lambda values: (atr(values["High"], values["Low"], values["Close"]),),
+    ),
+    IndicatorDefinition(
+        name="relative_volume",
+        columns=("volume_sma", "relative_volume"),
+        inputs=("Volume",),
+        calculate=lambda values: relative_volume(values["Volume"]),
+    ),
+]
+_INDICATOR_DEFINITION_BY_COLUMN = {
+    column: indicator_definition
+    for indicator_definition in INDICATOR_DEFINITIONS
+    for column in indicator_definition.columns
+}
+
+
+def resolve_indicator_definitions(columns: Iterable[str] | None = None) -> list[IndicatorDefinition]:
+    """Indicators to calculate for the given columns, sorted so every dependency goes first.
+
+    Args:
+        columns (Iterable[str] | None, optional): Indicator columns asked for. Defaults to None (all of them).
+
+    Raises:
+        ValueError: If any column is not a known indicator column.
+
+    Returns:
+        list[IndicatorDefinition]: The indicators to calculate.
+    """
+    ret: list[IndicatorDefinition] = []
+
+    def _visit(column: str) -> None:
+        if column in OHLCV_COLUMNS:
+            return
+        if column not in _INDICATOR_DEFINITION_BY_COLUMN:
+            raise ValueError(f"Unknown indicator column: {column}")
+        indicator_definition = _INDICATOR_DEFINITION_BY_COLUMN[column]
+        if indicator_definition not in ret:
+            for input_column in indicator_definition.inputs:
+                _visit(input_column)
+            ret.append(indicator_definition)
+
+    for column in INDICATOR_COLUMNS if columns is None else columns:
+        _visit(column)
+    return ret
+
+
+def calculate_indicators(
+    *, high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray, columns: Iterable[str] | None = None
+) -> dict[str, np.ndarray]:
+    """Calculate the indicators used by the bot.
+
+    Args:
+        high (np.ndarray): Highest prices.
+        low (np.ndarray): Lowest prices.
+        close (np.ndarray): Closing prices.
+        volume (np.ndarray): Volumes.
+        columns (Iterable[str] | None, optional): Indicator columns asked for. Defaults to None (all of them).
+
+    Returns:
+        dict[str, np.ndarray]: Indicator values by column name, including the ones the requested columns depend on.
+    """
+    values: dict[str, np.ndarray] = {
+        "High": np.ascontiguousarray(high, dtype=np.float64),
+        "Low": np.ascontiguousarray(low, dtype=np.float64),
+        "Close": np.ascontiguousarray(close, dtype=np.float64),
+        "Volume": np.ascontiguousarray(volume, dtype=np.float64),
+    }
+    for indicator_definition in resolve_indicator_definitions(columns):
+        values.update(zip(indicator_definition.columns, indicator_definition.calculate(values), strict=True))
+    return {column: values[column] for column in INDICATOR_COLUMNS if column in values}
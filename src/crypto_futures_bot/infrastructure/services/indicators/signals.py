@@ -0,0 +1,109 @@
+"""
+Vectorized evaluation of the entry signals, shared by the live signals task and the backtester.
+Every element of the arrays is a (PREV, LAST) pair of candles: either one per tracked symbol,
+or one per candle of a single symbol history.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+from crypto_futures_bot.domain.vo import SignalParametrizationItem
+from crypto_futures_bot.domain.vo.candlestick_indicators import CandleStickIndicators
+
+# Attributes of `CandleStickIndicators` the entry rules depend on, along with the technical analysis columns
+SIGNAL_FIELDS = {
+    "closing_price": "Close",
+    "ema50": "ema50",
+    "stoch_rsi_k": "stoch_rsi_k",
+    "stoch_rsi_d": "stoch_rsi_d",
+    "macd_hist": "macd_hist",
+}
+# Indicator columns the strategy reads: the entry rules, along with the ATR the SL/TP are calculated from
+STRATEGY_INDICATOR_COLUMNS = [column for column in SIGNAL_FIELDS.values() if column != "Close"] + ["atr"]
+
+
+def evaluate_entry_signals(
+    prev_candles: Mapping[str, np.ndarray],
+    last_candles: Mapping[str, np.ndarray],
+    *,
+    long_entry_oversold_threshold: np.ndarray | float,
+    short_entry_overbought_threshold: np.ndarray | float,
+    double_confirm_trend: np.ndarray | bool,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Evaluate the long and short entry rules in a single vectorized pass.
+
+    Args:
+        prev_candles (Mapping[str, np.ndarray]): Values of the PREV candles, by `SIGNAL_FIELDS` name.
+        last_candles (Mapping[str, np.ndarray]): Values of the LAST candles, by `SIGNAL_FIELDS` name.
+        long_entry_oversold_threshold (np.ndarray | float): Long entry oversold threshold, per element or shared.
+        short_entry_overbought_threshold (np.ndarray | float): Short entry overbought threshold, per element or shared.
+        double_confirm_trend (np.ndarray | bool): Whether the PREV candle must confirm the trend as well.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Long entry and short entry boolean masks.
+    """
+    prev_close, prev_ema50 = prev_candles["closing_price"], prev_candles["ema50"]
+    prev_stoch_rsi_k, prev_stoch_rsi_d = prev_candles["stoch_rsi_k"], prev_candles["stoch_rsi_d"]
+    last_close, last_ema50 = last_candles["closing_price"], last_candles["ema50"]
+    last_stoch_rsi_k, last_stoch_rsi_d = last_candles["stoch_rsi_k"], last_candles["stoch_rsi_d"]
+    last_macd_hist = last_candles["macd_hist"]
+    double_confirm_trend = np.asarray(double_confirm_trend, dtype=bool)
+    # TREND: Price is above the baseline (Safety)
+    long_trend_ok = (~double_confirm_trend | (prev_close > prev_ema50)) & (last_close > last_ema50)
+    # TRIGGER: Stoch Cross Up
+    long_stoch_cross = (prev_stoch_rsi_k <= prev_stoch_rsi_d) & (last_stoch_rsi_k > last_stoch_rsi_d)
+    # FILTER: Must be Oversold (Buying the dip)
+    long_stoch_condition = prev_stoch_rsi_k < long_entry_oversold_threshold
+    # MOMENTUM: Histogram must be positive (Recovery started)
+    long_entry = long_trend_ok & long_stoch_cross & long_stoch_condition & (last_macd_hist > 0)
+
+    short_trend_ok = (~double_confirm_trend | (prev_close < prev_ema50)) & (last_close < last_ema50)
+    short_stoch_cross = (prev_stoch_rsi_k >= prev_stoch_rsi_d) & (last_stoch_rsi_k < last_stoch_rsi_d)
+    short_stoch_condition = prev_stoch_rsi_k > short_entry_overbought_threshold
+    short_entry = short_trend_ok & short_stoch_cross & short_stoch_condition & (last_macd_hist < 0)
+    return long_entry, short_entry
+
+
+def stack_candlestick_indicators(candles: list[CandleStickIndicators]) -> dict[str, np.ndarray]:
+    """Stack the signal fields of several candles into arrays, one element per candle."""
+    return {
+        field: np.fromiter((getattr(candle, field) for candle in candles), dtype=np.float64, count=len(candles))
+        for field in SIGNAL_FIELDS
+    }
+
+
+def stack_signal_parametrization_items(items: list[SignalParametrizationItem]) -> dict[str, np.ndarray]:
+    """Stack the entry thresholds of several signal parametrizations into arrays, one element per item."""
+    return {
+        "long_entry_oversold_threshold": np.array([item.long_entry_oversold_threshold for item in items]),
+        "short_entry_overbought_threshold": np.array([item.short_entry_overbought_threshold for item in items]),
+        "double_confirm_trend": np.array([item.double_confirm_trend for item in items], dtype=bool),
+    }
+
+
+def get_entry_signals(
+    technical_analysis_df: pd.DataFrame, *, signal_parametrization_item: SignalParametrizationItem
+) -> tuple[np.ndarray, np.ndarray]:
+    """Evaluate the entry rules on every candle of a technical analysis, taking the previous one as PREV.
+
+    Args:
+        technical_analysis_df (pd.DataFrame): Technical analysis of a single symbol.
+        signal_parametrization_item (SignalParametrizationItem): The signal parametrization.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Long entry and short entry boolean masks, aligned with the candles.
+    """
+    values = {
+        field: technical_analysis_df[column].to_numpy(dtype=np.float64) for field, column in SIGNAL_FIELDS.items()
+    }
+    long_entry, short_entry = evaluate_entry_signals(
+        {field: field_values[:-1] for field, field_values in values.items()},
+        {field: field_values[1:] for field, field_values in values.items()},
+        long_entry_oversold_threshold=signal_parametrization_item.long_entry_oversold_threshold,
+        short_entry_overbought_threshold=signal_parametrization_item.short_entry_overbought_threshold,
+        double_confirm_trend=signal_parametrization_item.double_confirm_trend,
+    )
+    # The first candle has no PREV candle to be compared with
+    return np.concatenate([[False], long_entry]), np.concatenate([[False], short_entry])
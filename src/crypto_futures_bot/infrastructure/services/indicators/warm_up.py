@@ -0,0 +1,96 @@
+"""
+Minimum history the indicators need to converge, so the candles fetched from the exchange are sized from it.
+The recursive indicators (EMA, Wilder's smoothing) start from an arbitrary seed, whose influence decays
+geometrically with every candle; the windowed ones only need their window to be filled.
+"""
+
+import math
+from typing import Any
+
+import numpy as np
+
+from crypto_futures_bot.domain.enums.candlestick_enum import CandleStickEnum
+from crypto_futures_bot.infrastructure.services.indicators.constants import (
+    ATR_WINDOW,
+    EMA_WINDOW,
+    INDICATOR_COLUMNS,
+    MACD_SIGNAL_WINDOW,
+    MACD_SLOW_WINDOW,
+    OHLCV_COLUMNS,
+    RSI_WINDOW,
+    STOCH_RSI_SMOOTH_D_WINDOW,
+    STOCH_RSI_SMOOTH_K_WINDOW,
+    STOCH_RSI_WINDOW,
+    VOLUME_SMA_WINDOW,
+)
+from crypto_futures_bot.infrastructure.services.indicators.registry import calculate_indicators
+
+
+def get_convergence_candles(*, alpha: float, tolerance: float) -> int:
+    """Number of candles until the seed of an exponential smoothing weighs less than the tolerance.
+
+    Args:
+        alpha (float): The smoothing factor.
+        tolerance (float): Remaining weight of the seed, relative to the initial error.
+
+    Returns:
+        int: The number of candles.
+    """
+    return math.ceil(math.log(tolerance) / math.log(1.0 - alpha))
+
+
+def get_warm_up_candles(*, tolerance: float) -> dict[str, int]:
+    """Minimum history, per indicator, to converge to the given tolerance.
+
+    Chained smoothings (e.g. MACD signal over the MACD line) add up their convergence candles,
+    which is an upper bound of the convergence of the whole chain.
+    """
+    ema_candles = get_convergence_candles(alpha=2.0 / (EMA_WINDOW + 1), tolerance=tolerance)
+    macd_line_candles = get_convergence_candles(alpha=2.0 / (MACD_SLOW_WINDOW + 1), tolerance=tolerance)
+    macd_signal_candles = get_convergence_candles(alpha=2.0 / (MACD_SIGNAL_WINDOW + 1), tolerance=tolerance)
+    # The first close has no previous close to be compared with
+    rsi_candles = get_convergence_candles(alpha=1.0 / RSI_WINDOW, tolerance=tolerance) + 1
+    # Every rolling window needs its first values to be filled
+    stoch_rsi_candles = rsi_candles + STOCH_RSI_WINDOW + STOCH_RSI_SMOOTH_K_WINDOW + STOCH_RSI_SMOOTH_D_WINDOW - 3
+    return {
+        "ema50": ema_candles,
+        "macd": macd_line_candles + macd_signal_candles,
+        "rsi": rsi_candles,
+        "stoch_rsi": stoch_rsi_candles,
+        "atr": ATR_WINDOW + get_convergence_candles(alpha=1.0 / ATR_WINDOW, tolerance=tolerance),
+        "relative_volume": VOLUME_SMA_WINDOW,
+    }
+
+
+def get_ohlcv_warm_up_size(*, tolerance: float) -> int:
+    """Number of candles to fetch, so every candle of `CandleStickEnum` has converged indicators."""
+    return max(get_warm_up_candles(tolerance=tolerance).values()) + len(CandleStickEnum)
+
+
+def validate_warm_up(ohlcv: list[list[Any]], *, warm_up_size: int) -> dict[str, float]:
+    """Compare the indicators calculated over the last `warm_up_size` candles against the whole history.
+
+    Args:
+        ohlcv (list[list[Any]]): A long history of candles, sorted by timestamp.
+        warm_up_size (int): Number of candles of the truncated history.
+
+    Returns:
+        dict[str, float]: Maximum error per indicator over the candles of `CandleStickEnum`,
+            relative to the long history value (absolute for values below 1).
+    """
+    values = np.asarray([candle[: len(OHLCV_COLUMNS)] for candle in ohlcv], dtype=np.float64)
+    high, low, close, volume = values[:, 2], values[:, 3], values[:, 4], values[:, 5]
+    expected = calculate_indicators(high=high, low=low, close=close, volume=volume)
+    actual = calculate_indicators(
+        high=high[-warm_up_size:], low=low[-warm_up_size:], close=close[-warm_up_size:], volume=volume[-warm_up_size:]
+    )
+    rows = len(CandleStickEnum)
+    ret: dict[str, float] = {}
+    for column in INDICATOR_COLUMNS:
+        expected_values, actual_values = expected[column][-rows:], actual[column][-rows:]
+        with np.errstate(invalid="ignore"):
+            errors = np.abs(actual_values - expected_values) / np.maximum(1.0, np.abs(expected_values))
+        # A NaN on either side only matches a NaN on the other one
+        mismatched_nans = np.isnan(actual_values) != np.isnan(expected_values)
+        ret[column] = math.inf if mismatched_nans.any() else float(np.nanmax(errors, initial=0.0))
+    return ret
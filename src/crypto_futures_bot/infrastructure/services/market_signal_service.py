@@ -5,7 +5,8 @@ from datetime import UTC, datetime, timedelta
 from typing import override
 
 from pyee.asyncio import AsyncIOEventEmitter
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from crypto_futures_bot.config.configuration_properties import ConfigurationProperties
@@ -27,6 +28,8 @@ from crypto_futures_bot.interfaces.telegram.services.telegram_service import Tel
 
 logger = logging.getLogger(__name__)
 
+MarketSignalKey = tuple[str, Timeframe, PositionTypeEnum, int]
+
 
 class MarketSignalService(AbstractEventHandlerService):
     def __init__(
@@ -41,6 +44,9 @@ class MarketSignalService(AbstractEventHandlerService):
         self._configuration_properties = configuration_properties
         self._trade_now_service = trade_now_service
         self._lock = asyncio.Lock()
+        # XXX: Index of the stored market signals (created_at by key), bounded by the retention window
+        self._market_signal_index: dict[MarketSignalKey, datetime] | None = None
+        self._market_signal_index_lock = asyncio.Lock()
 
     @override
     def configure(self) -> None:
@@ -89,7 +95,6 @@ class MarketSignalService(AbstractEventHandlerService):
             ret = self._convert_model_to_vo(last_market_signal)
         return ret
 
-    @transactional(read_only=True)
     async def exists_market_signal_by_timestamp(
         self,
         timestamp: int,
@@ -99,16 +104,11 @@ class MarketSignalService(AbstractEventHandlerService):
         *,
         session: AsyncSession | None = None,
     ) -> bool:
-        query = (
-            select(func.count(MarketSignal.id))
-            .where(MarketSignal.timestamp == timestamp)
-            .where(MarketSignal.crypto_currency == crypto_currency.currency)
-            .where(MarketSignal.position_type == position_type)
-            .where(MarketSignal.timeframe == timeframe)
-        )
-        query_result = await session.execute(query)
-        count = query_result.scalar()
-        return count > 0
+        market_signal_index = await self._get_market_signal_index(session=session)
+        return (crypto_currency.currency, timeframe, position_type, timestamp) in market_signal_index
+
+    async def warm_up(self) -> None:
+        await self._get_market_signal_index()
 
     async def _handle_signals_evaluation_result(self, signals_evaluation_result: SignalsEvaluationResult) -> None:
         async with self._lock:
@@ -116,6 +116,8 @@ class MarketSignalService(AbstractEventHandlerService):
                 await self._internal_handle_signals_evaluation_result(signals_evaluation_result)
             except Exception as e:  # pragma: no cover
                 logger.error(str(e), exc_info=True)
+                # XXX: The transaction has been rolled back, so the index could hold signals never stored
+                self._market_signal_index = None
                 await self._notify_fatal_error_via_telegram(e)
 
     @transactional()
@@ -125,8 +127,9 @@ class MarketSignalService(AbstractEventHandlerService):
         market_signal_items = []
         try:
             await self._apply_market_signal_retention_policy(signals_evaluation_result, session=session)
+            # XXX: Hints are calculated over the very same timeframe the signal was raised on
             trade_now_hints = await self._trade_now_service.get_trade_now_hints(
-                signals_evaluation_result.crypto_currency
+                signals_evaluation_result.crypto_currency, timeframe=signals_evaluation_result.timeframe
             )
             signals_field_names = [field.name for field in fields(signals_evaluation_result) if field.type is bool]
             for signals_field_name in signals_field_names:
@@ -154,16 +157,16 @@ class MarketSignalService(AbstractEventHandlerService):
         session: AsyncSession,
     ) -> MarketSignalItem | None:
         timestamp = int(signals.timestamp.timestamp() * 1000)
+        position_type = PositionTypeEnum.LONG if is_long else PositionTypeEnum.SHORT
         exists = await self.exists_market_signal_by_timestamp(
             timestamp=timestamp,
             crypto_currency=signals.crypto_currency,
-            position_type=PositionTypeEnum.LONG if is_long else PositionTypeEnum.SHORT,
+            position_type=position_type,
             timeframe=signals.timeframe,
             session=session,
         )
         ret: MarketSignalItem | None = None
         if not exists:
-            position_type = PositionTypeEnum.LONG if is_long else PositionTypeEnum.SHORT
             action_type = MarketActionTypeEnum.ENTRY if is_entry else MarketActionTypeEnum.EXIT
             position_hints = trade_now_hints.long if is_long else trade_now_hints.short
             market_signal = MarketSignal(
@@ -179,17 +182,26 @@ class MarketSignalService(AbstractEventHandlerService):
                 stop_loss_price=position_hints.stop_loss_price if is_entry else None,
                 take_profit_price=position_hints.take_profit_price if is_entry else None,
             )
-            session.add(market_signal)
-            await session.flush()
-            ret = self._convert_model_to_vo(market_signal)
+            try:
+                # The unique constraint is the final guard against signals stored by any other process
+                async with session.begin_nested():
+                    session.add(market_signal)
+                    await session.flush()
+                ret = self._convert_model_to_vo(market_signal)
+            except IntegrityError:
+                logger.warning(
+                    f"Market signal {signals.crypto_currency.currency} {signals.timeframe} "
+                    f"{position_type} at {timestamp} was already stored"
+                )
+            self._market_signal_index[self._get_market_signal_key(market_signal)] = (
+                market_signal.created_at if ret else datetime.now(tz=UTC)
+            )
         return ret
 
     async def _apply_market_signal_retention_policy(
         self, signals: SignalsEvaluationResult, *, session: AsyncSession
     ) -> None:
-        expiration_date = datetime.now(tz=UTC) - timedelta(
-            days=self._configuration_properties.market_signal_retention_days
-        )
+        expiration_date = self._get_market_signal_expiration_date()
         query = (
             delete(MarketSignal)
             .where(MarketSignal.crypto_currency == signals.crypto_currency.currency)
@@ -197,6 +209,47 @@ class MarketSignalService(AbstractEventHandlerService):
             .where(MarketSignal.created_at < expiration_date)
         )
         await session.execute(query)
+        market_signal_index = await self._get_market_signal_index(session=session)
+        expired_keys = [
+            key
+            for key, created_at in market_signal_index.items()
+            if key[:2] == (signals.crypto_currency.currency, signals.timeframe) and created_at < expiration_date
+        ]
+        for key in expired_keys:
+            del market_signal_index[key]
+
+    async def _get_market_signal_index(self, *, session: AsyncSession | None = None) -> dict[MarketSignalKey, datetime]:
+        if self._market_signal_index is None:
+            async with self._market_signal_index_lock:
+                if self._market_signal_index is None:
+                    self._market_signal_index = await self._load_market_signal_index(session=session)
+                    logger.info(f"Market signal index warmed up with {len(self._market_signal_index)} signals")
+        return self._market_signal_index
+
+    @transactional(read_only=True)
+    async def _load_market_signal_index(
+        self, *, session: AsyncSession | None = None
+    ) -> dict[MarketSignalKey, datetime]:
+        query = select(MarketSignal).where(MarketSignal.created_at >= self._get_market_signal_expiration_date())
+        query_result = await session.execute(query)
+        # XXX: Some database backends (e.g. SQLite) give the datetimes back without time zone
+        return {
+            self._get_market_signal_key(market_signal): market_signal.created_at.replace(tzinfo=UTC)
+            if market_signal.created_at.tzinfo is None
+            else market_signal.created_at
+            for market_signal in query_result.scalars().all()
+        }
+
+    def _get_market_signal_expiration_date(self) -> datetime:
+        return datetime.now(tz=UTC) - timedelta(days=self._configuration_properties.market_signal_retention_days)
+
+    def _get_market_signal_key(self, market_signal: MarketSignal) -> MarketSignalKey:
+        return (
+            market_signal.crypto_currency,
+            market_signal.timeframe,
+            market_signal.position_type,
+            market_signal.timestamp,
+        )
 
     def _convert_model_to_vo(self, market_signal: MarketSignal) -> MarketSignalItem:
         return MarketSignalItem(
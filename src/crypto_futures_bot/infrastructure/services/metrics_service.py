@@ -0,0 +1,68 @@
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import numpy as np
+
+from crypto_futures_bot.config.configuration_properties import ConfigurationProperties
+from crypto_futures_bot.domain.vo import LatencySummary
+
+
+class MetricsService:
+    """
+    In-process latency histograms, per stage and per (stage, symbol).
+    Only the latest samples are kept, so the percentiles reflect the recent behaviour.
+    """
+
+    def __init__(self, configuration_properties: ConfigurationProperties) -> None:
+        self._configuration_properties = configuration_properties
+        self._samples: dict[tuple[str, str | None], deque[float]] = {}
+
+    @contextmanager
+    def span(self, stage: str, *, symbol: str | None = None) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started_at, symbol=symbol)
+
+    def record(self, stage: str, elapsed_seconds: float, *, symbol: str | None = None) -> None:
+        keys = [(stage, None)] if symbol is None else [(stage, None), (stage, symbol)]
+        for key in keys:
+            if key not in self._samples:
+                self._samples[key] = deque(maxlen=self._configuration_properties.metrics_histogram_size)
+            self._samples[key].append(elapsed_seconds)
+
+    def get_latency_summaries(self, *, by_symbol: bool = False) -> list[LatencySummary]:
+        ret: list[LatencySummary] = []
+        for (stage, symbol), samples in sorted(self._samples.items(), key=lambda item: (item[0][0], item[0][1] or "")):
+            if (symbol is not None) != by_symbol or not samples:
+                continue
+            p50, p95, p99 = np.percentile(np.fromiter(samples, dtype=np.float64), [50, 95, 99]) * 1000
+            ret.append(
+                LatencySummary(
+                    stage=stage,
+                    symbol=symbol,
+                    count=len(samples),
+                    p50_ms=float(p50),
+                    p95_ms=float(p95),
+                    p99_ms=float(p99),
+                    max_ms=max(samples) * 1000,
+                )
+            )
+        return ret
+
+    def render_latency_summaries(self) -> str:
+        lines = []
+        for latency_summary in self.get_latency_summaries() + self.get_latency_summaries(by_symbol=True):
+            name = latency_summary.stage + (f"[{latency_summary.symbol}]" if latency_summary.symbol else "")
+            lines.append(
+                f"{name}: count={latency_summary.count}, p50={latency_summary.p50_ms:.1f} ms, "
+                f"p95={latency_summary.p95_ms:.1f} ms, p99={latency_summary.p99_ms:.1f} ms, "
+                f"max={latency_summary.max_ms:.1f} ms"
+            )
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        self._samples.clear()
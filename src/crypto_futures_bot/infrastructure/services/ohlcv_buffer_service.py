@@ -0,0 +1,169 @@
+import asyncio
+import logging
+from collections import defaultdict, deque
+from datetime import UTC, datetime
+from typing import Any
+
+from crypto_futures_bot.config.configuration_properties import ConfigurationProperties
+from crypto_futures_bot.constants import OHLCV_WARM_UP_VALIDATION_MULTIPLIER
+from crypto_futures_bot.domain.types import Timeframe
+from crypto_futures_bot.domain.utils.timeframe_utils import (
+    get_candle_open_timestamp,
+    get_timeframe_in_milliseconds,
+    is_resampleable,
+    resample_ohlcv,
+)
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.base import AbstractFuturesExchangeService
+from crypto_futures_bot.infrastructure.services.indicators.warm_up import get_ohlcv_warm_up_size, validate_warm_up
+
+logger = logging.getLogger(__name__)
+
+
+class OHLCVBufferService:
+    """
+    Keeps an in-memory ring buffer of candles per (symbol, timeframe).
+    The buffer is seeded once with a full fetch, after that only the forming
+    and the newly opened candles are pulled from the exchange.
+    Higher timeframes can be kept up to date by resampling a single base stream per symbol.
+    Unless it is configured, the buffer size is the minimum history for the indicators to converge.
+    """
+
+    def __init__(
+        self,
+        configuration_properties: ConfigurationProperties,
+        futures_exchange_service: AbstractFuturesExchangeService,
+    ) -> None:
+        self._configuration_properties = configuration_properties
+        self._futures_exchange_service = futures_exchange_service
+        self._buffer_size = self._configuration_properties.ohlcv_buffer_size or get_ohlcv_warm_up_size(
+            tolerance=self._configuration_properties.indicators_convergence_tolerance
+        )
+        self._buffers: dict[tuple[str, Timeframe], deque[list[Any]]] = {}
+        self._locks: defaultdict[tuple[str, Timeframe], asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    @property
+    def buffer_size(self) -> int:
+        return self._buffer_size
+
+    async def get_ohlcv(self, symbol: str, *, timeframe: Timeframe = "15m") -> list[list[Any]]:
+        key = (symbol, timeframe)
+        async with self._locks[key]:
+            buffer = self._buffers.get(key)
+            if buffer is None or self._is_out_of_range(buffer, timeframe=timeframe):
+                buffer = await self._seed(symbol, timeframe=timeframe)
+            else:
+                buffer = await self._update(buffer, symbol, timeframe=timeframe)
+            return list(buffer)
+
+    async def get_ohlcv_by_timeframe(
+        self, symbol: str, *, timeframes: list[Timeframe]
+    ) -> dict[Timeframe, list[list[Any]]]:
+        """
+        Get the candles of several timeframes of the same symbol.
+        Only the base stream is pulled from the exchange, the rest of the timeframes are resampled from it,
+        once they have been seeded.
+        """
+        base_timeframe = self._get_base_timeframe(timeframes)
+        base_ohlcv = await self.get_ohlcv(symbol, timeframe=base_timeframe)
+        ret: dict[Timeframe, list[list[Any]]] = {}
+        for timeframe in timeframes:
+            if timeframe == base_timeframe:
+                ret[timeframe] = base_ohlcv
+            elif is_resampleable(timeframe, base_timeframe=base_timeframe):
+                ret[timeframe] = await self._get_resampled_ohlcv(symbol, timeframe=timeframe, base_ohlcv=base_ohlcv)
+            else:
+                ret[timeframe] = await self.get_ohlcv(symbol, timeframe=timeframe)
+        return ret
+
+    def invalidate(self, symbol: str, *, timeframe: Timeframe = "15m") -> None:
+        self._buffers.pop((symbol, timeframe), None)
+
+    async def _seed(self, symbol: str, *, timeframe: Timeframe) -> deque[list[Any]]:
+        logger.info(f"Seeding OHLCV buffer for {symbol} ({timeframe})...")
+        if self._configuration_properties.ohlcv_warm_up_validation_enabled:
+            ohlcv = await self._fetch_and_validate_warm_up(symbol, timeframe=timeframe)
+        else:
+            ohlcv = await self._futures_exchange_service.fetch_ohlcv(
+                symbol=symbol, timeframe=timeframe, limit=self._buffer_size
+            )
+        buffer = deque(ohlcv, maxlen=self._buffer_size)
+        self._buffers[(symbol, timeframe)] = buffer
+        return buffer
+
+    async def _update(self, buffer: deque[list[Any]], symbol: str, *, timeframe: Timeframe) -> deque[list[Any]]:
+        last_timestamp = buffer[-1][0]
+        # XXX: The last stored candle is fetched again, since it may have been the forming one
+        limit = self._get_missing_candles(buffer, timeframe=timeframe) + 1
+        ohlcv = await self._futures_exchange_service.fetch_ohlcv(
+            symbol=symbol, timeframe=timeframe, limit=limit, since=last_timestamp
+        )
+        if not self._apply_candles(buffer, ohlcv, timeframe=timeframe):
+            logger.warning(f"Gap detected in OHLCV buffer for {symbol} ({timeframe}), re-seeding...")
+            buffer = await self._seed(symbol, timeframe=timeframe)
+        return buffer
+
+    async def _get_resampled_ohlcv(
+        self, symbol: str, *, timeframe: Timeframe, base_ohlcv: list[list[Any]]
+    ) -> list[list[Any]]:
+        key = (symbol, timeframe)
+        async with self._locks[key]:
+            buffer = self._buffers.get(key)
+            if (
+                buffer is None
+                or self._is_out_of_range(buffer, timeframe=timeframe)
+                or not base_ohlcv
+                or base_ohlcv[0][0] > buffer[-1][0]
+            ):
+                # XXX: The base stream does not cover the last stored candle, so it can not be resampled
+                buffer = await self._seed(symbol, timeframe=timeframe)
+            else:
+                last_timestamp = buffer[-1][0]
+                resampled_ohlcv = resample_ohlcv(
+                    [candle for candle in base_ohlcv if candle[0] >= last_timestamp], timeframe=timeframe
+                )
+                if not self._apply_candles(buffer, resampled_ohlcv, timeframe=timeframe):  # pragma: no cover
+                    logger.warning(f"Gap detected in OHLCV buffer for {symbol} ({timeframe}), re-seeding...")
+                    buffer = await self._seed(symbol, timeframe=timeframe)
+            return list(buffer)
+
+    async def _fetch_and_validate_warm_up(self, symbol: str, *, timeframe: Timeframe) -> list[list[Any]]:
+        """
+        Fetch a long history, checking the indicators over the buffer against the ones over the whole history
+        """
+        ohlcv = await self._futures_exchange_service.fetch_ohlcv(
+            symbol=symbol, timeframe=timeframe, limit=self._buffer_size * OHLCV_WARM_UP_VALIDATION_MULTIPLIER
+        )
+        if len(ohlcv) > self._buffer_size:
+            errors = validate_warm_up(ohlcv, warm_up_size=self._buffer_size)
+            tolerance = self._configuration_properties.indicators_convergence_tolerance
+            if not_converged := {column: error for column, error in errors.items() if error > tolerance}:
+                logger.warning(
+                    f"Indicators of {symbol} ({timeframe}) have not converged within "
+                    f"{self._buffer_size} candles: {not_converged}"
+                )
+            else:
+                logger.info(f"Indicators of {symbol} ({timeframe}) converged within {self._buffer_size} candles")
+        return ohlcv[-self._buffer_size :]
+
+    def _apply_candles(self, buffer: deque[list[Any]], ohlcv: list[list[Any]], *, timeframe: Timeframe) -> bool:
+        timeframe_in_millis = get_timeframe_in_milliseconds(timeframe)
+        for candle in ohlcv:
+            current_last_timestamp = buffer[-1][0]
+            if candle[0] == current_last_timestamp:
+                # Restatement of the forming candle
+                buffer[-1] = candle
+            elif candle[0] == current_last_timestamp + timeframe_in_millis:
+                buffer.append(candle)
+            elif candle[0] > current_last_timestamp:
+                return False
+        return True
+
+    def _get_base_timeframe(self, timeframes: list[Timeframe]) -> Timeframe:
+        return self._configuration_properties.ohlcv_base_timeframe or min(timeframes, key=get_timeframe_in_milliseconds)
+
+    def _is_out_of_range(self, buffer: deque[list[Any]], *, timeframe: Timeframe) -> bool:
+        return not buffer or self._get_missing_candles(buffer, timeframe=timeframe) >= buffer.maxlen
+
+    def _get_missing_candles(self, buffer: deque[list[Any]], *, timeframe: Timeframe) -> int:
+        current_candle_timestamp = get_candle_open_timestamp(timeframe, int(datetime.now(UTC).timestamp() * 1000))
+        return max(0, (current_candle_timestamp - buffer[-1][0]) // get_timeframe_in_milliseconds(timeframe))
@@ -3,7 +3,7 @@ import math
 from crypto_futures_bot.config.configuration_properties import ConfigurationProperties
 from crypto_futures_bot.domain.vo import CandleStickIndicators, PositionMetrics, SignalParametrizationItem
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.base import AbstractFuturesExchangeService
-from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo.symbol_market_config import SymbolMarketConfig
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo import AccountSnapshot, Position, SymbolMarketConfig
 from crypto_futures_bot.infrastructure.services.base import AbstractService
 from crypto_futures_bot.infrastructure.services.push_notification_service import PushNotificationService
 from crypto_futures_bot.interfaces.telegram.services.telegram_service import TelegramService
@@ -21,12 +21,15 @@ class OrdersAnalyticsService(AbstractService):
         self._configuration_properties = configuration_properties
         self._futures_exchange_service = futures_exchange_service
 
-    async def get_open_position_metrics(self) -> list[PositionMetrics]:
-        positions = await self._futures_exchange_service.get_open_positions()
+    async def get_open_position_metrics(
+        self, *, account_snapshot: AccountSnapshot | None = None
+    ) -> list[PositionMetrics]:
+        positions = await self._get_open_positions(account_snapshot)
         ret = []
         if positions:
             tickers = await self._futures_exchange_service.get_symbol_tickers(
-                symbols=[position.symbol for position in positions]
+                symbols=[position.symbol for position in positions],
+                max_age_ms=self._configuration_properties.ticker_max_age_ms,
             )
             tickers = {ticker.symbol: ticker for ticker in tickers}
             for position in positions:
@@ -35,15 +38,25 @@ class OrdersAnalyticsService(AbstractService):
                 ret.append(PositionMetrics(position=position, symbol_market_config=symbol_market_config, ticker=ticker))
         return ret
 
-    async def get_metrics_by_position_id(self, position_id: str) -> PositionMetrics:
-        positions = await self._futures_exchange_service.get_open_positions()
+    async def get_metrics_by_position_id(
+        self, position_id: str, *, account_snapshot: AccountSnapshot | None = None
+    ) -> PositionMetrics:
+        positions = await self._get_open_positions(account_snapshot)
         position = next((p for p in positions if p.position_id == position_id), None)
         if not position:
             raise ValueError(f"Position with id {position_id} not found")
-        ticker = await self._futures_exchange_service.get_symbol_ticker(position.symbol)
+        ticker = await self._futures_exchange_service.get_symbol_ticker(
+            position.symbol, max_age_ms=self._configuration_properties.ticker_max_age_ms
+        )
         symbol_market_config = await self._futures_exchange_service.get_symbol_market_config(ticker.base_asset)
         return PositionMetrics(position=position, symbol_market_config=symbol_market_config, ticker=ticker)
 
+    async def _get_open_positions(self, account_snapshot: AccountSnapshot | None) -> list[Position]:
+        # XXX: A decision taken over a snapshot reads the same positions, instead of fetching them again
+        if account_snapshot is not None:
+            return account_snapshot.positions
+        return await self._futures_exchange_service.get_open_positions()
+
     def get_stop_loss_percent_value(
         self,
         entry_price: float,
@@ -1,26 +1,25 @@
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from crypto_futures_bot.constants import DEFAULT_TIMEFRAME
 from crypto_futures_bot.domain.vo.signal_parametrization_item import SignalParametrizationItem
 from crypto_futures_bot.infrastructure.database.models.signal_parametrization import SignalParametrization
 from crypto_futures_bot.infrastructure.services.decorators import transactional
 
 
 class SignalParametrizationService:
+    @transactional(read_only=True)
+    async def find_all(self, *, session: AsyncSession | None = None) -> list[SignalParametrizationItem]:
+        query_result = await session.execute(select(SignalParametrization))
+        return [self._convert_model_to_vo(entity) for entity in query_result.scalars().all()]
+
     @transactional(read_only=True)
     async def find_by_crypto_currency(
         self, crypto_currency: str, *, session: AsyncSession
     ) -> SignalParametrizationItem:
         entity = await self._find_one_or_none(crypto_currency=crypto_currency, session=session)
         if entity:
-            ret = SignalParametrizationItem(
-                crypto_currency=entity.crypto_currency,
-                atr_sl_mult=entity.atr_sl_mult,
-                atr_tp_mult=entity.atr_tp_mult,
-                long_entry_oversold_threshold=entity.long_entry_oversold_threshold,
-                short_entry_overbought_threshold=entity.short_entry_overbought_threshold,
-                double_confirm_trend=bool(entity.double_confirm_trend),
-            )
+            ret = self._convert_model_to_vo(entity)
         else:
             ret = SignalParametrizationItem(crypto_currency=crypto_currency)
         return ret
@@ -34,6 +33,7 @@ class SignalParametrizationService:
             entity.long_entry_oversold_threshold = item.long_entry_oversold_threshold
             entity.short_entry_overbought_threshold = item.short_entry_overbought_threshold
             entity.double_confirm_trend = item.double_confirm_trend
+            entity.timeframes = ",".join(item.timeframes)
         else:
             entity = SignalParametrization(
                 crypto_currency=item.crypto_currency,
@@ -42,6 +42,7 @@ class SignalParametrizationService:
                 long_entry_oversold_threshold=item.long_entry_oversold_threshold,
                 short_entry_overbought_threshold=item.short_entry_overbought_threshold,
                 double_confirm_trend=item.double_confirm_trend,
+                timeframes=",".join(item.timeframes),
             )
             session.add(entity)
         await session.flush()
@@ -51,3 +52,14 @@ class SignalParametrizationService:
         query_result = await session.execute(query)
         entity: SignalParametrization | None = query_result.scalars().one_or_none()
         return entity
+
+    def _convert_model_to_vo(self, entity: SignalParametrization) -> SignalParametrizationItem:
+        return SignalParametrizationItem(
+            crypto_currency=entity.crypto_currency,
+            atr_sl_mult=entity.atr_sl_mult,
+            atr_tp_mult=entity.atr_tp_mult,
+            long_entry_oversold_threshold=entity.long_entry_oversold_threshold,
+            short_entry_overbought_threshold=entity.short_entry_overbought_threshold,
+            double_confirm_trend=bool(entity.double_confirm_trend),
+            timeframes=entity.timeframes.split(",") if entity.timeframes else [DEFAULT_TIMEFRAME],
+        )
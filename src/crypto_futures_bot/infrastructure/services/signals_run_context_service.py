@@ -0,0 +1,48 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crypto_futures_bot.domain.enums import PushNotificationTypeEnum
+from crypto_futures_bot.domain.vo import SignalsRunContext
+from crypto_futures_bot.infrastructure.services.auto_trader_crypto_currency_service import (
+    AutoTraderCryptoCurrencyService,
+)
+from crypto_futures_bot.infrastructure.services.decorators import transactional
+from crypto_futures_bot.infrastructure.services.push_notification_service import PushNotificationService
+from crypto_futures_bot.infrastructure.services.risk_management_service import RiskManagementService
+from crypto_futures_bot.infrastructure.services.signal_parametrization_service import SignalParametrizationService
+from crypto_futures_bot.infrastructure.services.tracked_crypto_currency_service import TrackedCryptoCurrencyService
+
+
+class SignalsRunContextService:
+    def __init__(
+        self,
+        tracked_crypto_currency_service: TrackedCryptoCurrencyService,
+        signal_parametrization_service: SignalParametrizationService,
+        auto_trader_crypto_currency_service: AutoTraderCryptoCurrencyService,
+        risk_management_service: RiskManagementService,
+        push_notification_service: PushNotificationService,
+    ) -> None:
+        self._tracked_crypto_currency_service = tracked_crypto_currency_service
+        self._signal_parametrization_service = signal_parametrization_service
+        self._auto_trader_crypto_currency_service = auto_trader_crypto_currency_service
+        self._risk_management_service = risk_management_service
+        self._push_notification_service = push_notification_service
+
+    @transactional(read_only=True)
+    async def load(self, *, session: AsyncSession | None = None) -> SignalsRunContext:
+        """
+        Load all the configuration needed by a signals run within a single session
+        """
+        tracked_crypto_currencies = await self._tracked_crypto_currency_service.find_all(session=session)
+        signal_parametrization_items = await self._signal_parametrization_service.find_all(session=session)
+        auto_trader_crypto_currencies = await self._auto_trader_crypto_currency_service.find_all(session=session)
+        risk_management = await self._risk_management_service.get(session=session)
+        signals_chat_ids = await self._push_notification_service.get_actived_subscription_by_type(
+            notification_type=PushNotificationTypeEnum.SIGNALS, session=session
+        )
+        return SignalsRunContext(
+            tracked_crypto_currencies=tracked_crypto_currencies,
+            signal_parametrization_items={item.crypto_currency: item for item in signal_parametrization_items},
+            auto_trader_crypto_currencies=auto_trader_crypto_currencies,
+            risk_management=risk_management,
+            signals_chat_ids=list(signals_chat_ids),
+        )
@@ -1,20 +1,26 @@
+import asyncio
 import math
+import time
 
+from crypto_futures_bot.config.configuration_properties import ConfigurationProperties
 from crypto_futures_bot.domain.enums import OpenPositionResultTypeEnum, PositionOpenTypeEnum, PositionTypeEnum
+from crypto_futures_bot.domain.types import Timeframe
 from crypto_futures_bot.domain.vo import (
     CandleStickIndicators,
     OpenPositionResult,
     PositionHints,
+    PositionMetrics,
     RiskManagementItem,
     SignalParametrizationItem,
+    SignalsRunContext,
     TrackedCryptoCurrencyItem,
     TradeNowHints,
 )
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.base import AbstractFuturesExchangeService
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo import (
+    AccountSnapshot,
     CreateMarketPositionOrder,
     FuturesWallet,
-    PortfolioBalance,
     SymbolMarketConfig,
     SymbolTicker,
 )
@@ -31,6 +37,7 @@ from crypto_futures_bot.infrastructure.services.tracked_crypto_currency_service
 class TradeNowService:
     def __init__(
         self,
+        configuration_properties: ConfigurationProperties,
         futures_exchange_service: AbstractFuturesExchangeService,
         signal_parametrization_service: SignalParametrizationService,
         crypto_technical_analysis_service: CryptoTechnicalAnalysisService,
@@ -39,6 +46,7 @@ class TradeNowService:
         tracked_crypto_currency_service: TrackedCryptoCurrencyService,
         auto_trader_crypto_currency_service: AutoTraderCryptoCurrencyService,
     ):
+        self._configuration_properties = configuration_properties
         self._futures_exchange_service = futures_exchange_service
         self._signal_parametrization_service = signal_parametrization_service
         self._crypto_technical_analysis_service = crypto_technical_analysis_service
@@ -51,7 +59,11 @@ class TradeNowService:
         self, crypto_currency: TrackedCryptoCurrencyItem, position_type: PositionTypeEnum
     ) -> OpenPositionResult:
         account_info = await self._futures_exchange_service.get_account_info()
-        open_positions = await self._orders_analytics_service.get_open_position_metrics()
+        # The whole decision is taken over a single account snapshot
+        account_snapshot = await self._futures_exchange_service.get_account_snapshot()
+        open_positions = await self._orders_analytics_service.get_open_position_metrics(
+            account_snapshot=account_snapshot
+        )
         symbols = set(p.position.symbol for p in open_positions)
         if crypto_currency.to_symbol(account_info) in symbols:
             ret = OpenPositionResult(
@@ -68,7 +80,9 @@ class TradeNowService:
                     position_type=position_type,
                 )
             else:
-                trade_now_hints = await self.get_trade_now_hints(crypto_currency, risk_management=risk_management)
+                trade_now_hints = await self.get_trade_now_hints(
+                    crypto_currency, risk_management=risk_management, account_snapshot=account_snapshot
+                )
                 position_hints = (
                     trade_now_hints.long if position_type == PositionTypeEnum.LONG else trade_now_hints.short
                 )
@@ -91,8 +105,20 @@ class TradeNowService:
                     opened_position = await self._futures_exchange_service.create_market_position_order(
                         position=market_position_order
                     )
-                    position_metrics = await self._orders_analytics_service.get_metrics_by_position_id(
-                        position_id=opened_position.position_id
+                    # XXX: Metrics come from the opened position itself, instead of reloading every position.
+                    # They are priced at the fill, since the hints ticker was read before placing the order
+                    fill_ticker = SymbolTicker(
+                        timestamp=int(time.time() * 1000),
+                        symbol=opened_position.symbol,
+                        close=opened_position.entry_price,
+                        mark_price=opened_position.entry_price,
+                    )
+                    position_metrics = PositionMetrics(
+                        position=opened_position,
+                        symbol_market_config=await self._futures_exchange_service.get_symbol_market_config(
+                            crypto_currency=crypto_currency.currency
+                        ),
+                        ticker=fill_ticker,
                     )
                     ret = OpenPositionResult(
                         result_type=OpenPositionResultTypeEnum.SUCCESS,
@@ -106,24 +132,39 @@ class TradeNowService:
         self,
         tracked_crypto_currency: TrackedCryptoCurrencyItem,
         *,
+        timeframe: Timeframe = "15m",
         risk_management: RiskManagementItem | None = None,
         signal_parametrization_item: SignalParametrizationItem | None = None,
+        signals_run_context: SignalsRunContext | None = None,
+        account_snapshot: AccountSnapshot | None = None,
     ) -> TradeNowHints:
         account_info = await self._futures_exchange_service.get_account_info()
         symbol = tracked_crypto_currency.to_symbol(account_info)
-        portfolio_balance = await self._futures_exchange_service.get_portfolio_balance()
-        futures_wallet = await self._futures_exchange_service.get_futures_wallet()
-        ticker = await self._futures_exchange_service.get_symbol_ticker(symbol=symbol)
-        signal_parametrization_item = (
-            signal_parametrization_item
-            or await self._signal_parametrization_service.find_by_crypto_currency(
-                crypto_currency=tracked_crypto_currency.currency
+        # XXX: Sizing only depends on the futures wallet, so the spot holdings are not valued at all
+        # Independent exchange reads are fanned out, sharing a single deadline
+        async with asyncio.timeout(self._configuration_properties.composite_operation_timeout_seconds):
+            futures_wallet, ticker, symbol_market_config, candlestick_indicators = await asyncio.gather(
+                self._get_futures_wallet(account_snapshot),
+                self._futures_exchange_service.get_symbol_ticker(
+                    symbol=symbol, max_age_ms=self._configuration_properties.ticker_max_age_ms
+                ),
+                self._futures_exchange_service.get_symbol_market_config(
+                    crypto_currency=tracked_crypto_currency.currency
+                ),
+                self._crypto_technical_analysis_service.get_candlestick_indicators(symbol=symbol, timeframe=timeframe),
             )
+        if signal_parametrization_item is None:
+            signal_parametrization_item = (
+                signals_run_context.get_signal_parametrization_item(tracked_crypto_currency.currency)
+                if signals_run_context is not None
+                else await self._signal_parametrization_service.find_by_crypto_currency(
+                    crypto_currency=tracked_crypto_currency.currency
+                )
+            )
+        risk_management = risk_management or (
+            signals_run_context.risk_management if signals_run_context else await self._risk_management_service.get()
         )
-        symbol_market_config = await self._futures_exchange_service.get_symbol_market_config(
-            crypto_currency=tracked_crypto_currency.currency
-        )
-        candlestick_indicators = await self._crypto_technical_analysis_service.get_candlestick_indicators(symbol=symbol)
+        num_assets_investing = await self._get_num_assets_investing(signals_run_context)
         stop_loss_percent_value = self._orders_analytics_service.get_stop_loss_percent_value(
             entry_price=ticker.ask_or_close,
             last_candlestick_indicators=candlestick_indicators,
@@ -137,7 +178,6 @@ class TradeNowService:
             symbol_market_config=symbol_market_config,
         )
         long = await self._calculate_position_hints(
-            portfolio_balance=portfolio_balance,
             futures_wallet=futures_wallet,
             ticker=ticker,
             stop_loss_percent_value=stop_loss_percent_value,
@@ -145,10 +185,10 @@ class TradeNowService:
             signal_parametrization_item=signal_parametrization_item,
             symbol_market_config=symbol_market_config,
             risk_management=risk_management,
+            num_assets_investing=num_assets_investing,
             is_long=True,
         )
         short = await self._calculate_position_hints(
-            portfolio_balance=portfolio_balance,
             futures_wallet=futures_wallet,
             ticker=ticker,
             stop_loss_percent_value=stop_loss_percent_value,
@@ -156,6 +196,7 @@ class TradeNowService:
             signal_parametrization_item=signal_parametrization_item,
             symbol_market_config=symbol_market_config,
             risk_management=risk_management,
+            num_assets_investing=num_assets_investing,
             is_long=False,
         )
         return TradeNowHints(
@@ -167,9 +208,23 @@ class TradeNowService:
             short=short,
         )
 
+    async def _get_futures_wallet(self, account_snapshot: AccountSnapshot | None) -> FuturesWallet:
+        if account_snapshot is not None:
+            return account_snapshot.futures_wallet
+        return await self._futures_exchange_service.get_futures_wallet()
+
+    async def _get_num_assets_investing(self, signals_run_context: SignalsRunContext | None) -> int:
+        if signals_run_context is not None:
+            num_tracked_assets = signals_run_context.num_tracked_crypto_currencies
+            num_auto_traded_enabled_assets = signals_run_context.num_auto_trader_enabled_crypto_currencies
+        else:
+            num_tracked_assets = await self._tracked_crypto_currency_service.count()
+            num_auto_traded_enabled_assets = await self._auto_trader_crypto_currency_service.count_enabled()
+        num_assets_investing = min(num_tracked_assets, num_auto_traded_enabled_assets)
+        return num_assets_investing if num_assets_investing > 0 else 1
+
     async def _calculate_position_hints(
         self,
-        portfolio_balance: PortfolioBalance,
         futures_wallet: FuturesWallet,
         ticker: SymbolTicker,
         stop_loss_percent_value: float,
@@ -178,7 +233,8 @@ class TradeNowService:
         symbol_market_config: SymbolMarketConfig,
         *,
         is_long: bool,
-        risk_management: RiskManagementItem | None = None,
+        risk_management: RiskManagementItem,
+        num_assets_investing: int,
         maintenance_margin_rate: float = 0.01,
     ) -> PositionHints:
         entry_price = ticker.ask_or_close if is_long else ticker.bid_or_close
@@ -192,25 +248,17 @@ class TradeNowService:
         )
 
         # 2. Risk & Leverage Calculation
-        num_tracked_assets = await self._tracked_crypto_currency_service.count()
-        num_auto_traded_enabled_assets = await self._auto_trader_crypto_currency_service.count_enabled()
-        num_assets_investing = min(num_tracked_assets, num_auto_traded_enabled_assets)
-        num_assets_investing = num_assets_investing if num_assets_investing > 0 else 1
-        if not risk_management:
-            risk_management = await self._risk_management_service.get()
-
         # Financial Goal: How much we WANT to risk
         # Using futures balance to be more conservative
         desired_risk_amount = round(
-            portfolio_balance.futures_balance * (risk_management.percent_value / 100),
-            ndigits=symbol_market_config.price_precision,
+            futures_wallet.equity * (risk_management.percent_value / 100), ndigits=symbol_market_config.price_precision
         )
         target_notional_size = round(
             desired_risk_amount / (stop_loss_percent_value / 100), ndigits=symbol_market_config.price_precision
         )
         # Margin Availability
         available_margin = round(
-            min(portfolio_balance.futures_balance / num_assets_investing, futures_wallet.available_balance),
+            min(futures_wallet.equity / num_assets_investing, futures_wallet.available_balance),
             ndigits=symbol_market_config.price_precision,
         )
         # Safety Constraint: Max Leverage < 1 / (SL% + MMR)
@@ -1,12 +1,22 @@
 import logging
 from abc import ABCMeta, abstractmethod
+from datetime import UTC, datetime, timedelta
 
+from apscheduler.events import (
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_MISSED,
+    EVENT_JOB_SUBMITTED,
+    JobEvent,
+    JobExecutionEvent,
+    JobSubmissionEvent,
+)
 from apscheduler.job import Job
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.base import BaseTrigger
 
 from crypto_futures_bot.config.configuration_properties import ConfigurationProperties
 from crypto_futures_bot.domain.enums import TaskTypeEnum
+from crypto_futures_bot.domain.vo import TaskRunStats
 from crypto_futures_bot.infrastructure.services.base import AbstractService
 from crypto_futures_bot.infrastructure.services.push_notification_service import PushNotificationService
 from crypto_futures_bot.interfaces.telegram.services.telegram_service import TelegramService
@@ -26,11 +36,21 @@ class AbstractTaskService(AbstractService, metaclass=ABCMeta):
         self._configuration_properties = configuration_properties
         self._scheduler = scheduler
         self._job: Job | None = None
+        self._run_stats = TaskRunStats()
+        # Last fire time seen from the scheduler, and the one of the run pending to be started
+        self._last_scheduled_run_time: datetime | None = None
+        self._pending_scheduled_run_time: datetime | None = None
+        # XXX: Registered once, the scheduler notifies the events of every job, so they are filtered by job id
+        self._scheduler.add_listener(
+            self._on_job_event, EVENT_JOB_SUBMITTED | EVENT_JOB_MAX_INSTANCES | EVENT_JOB_MISSED
+        )
 
     async def start(self) -> None:
         if not self._job:
             self._job = self._create_job()
         else:  # pragma: no cover
+            # Fires while paused are not accounted as skipped
+            self._last_scheduled_run_time = None
             self._job.resume()
 
     async def stop(self) -> None:
@@ -38,11 +58,18 @@ class AbstractTaskService(AbstractService, metaclass=ABCMeta):
             self._job.pause()
 
     async def run(self) -> None:
+        started_at = datetime.now(UTC)
+        scheduled_run_time, self._pending_scheduled_run_time = self._pending_scheduled_run_time, None
         try:
             await self._run()
         except Exception as e:  # pragma: no cover
             logger.error(str(e), exc_info=True)
             await self._notify_fatal_error_via_telegram(e)
+        finally:
+            self._register_run(started_at, scheduled_run_time=scheduled_run_time)
+
+    def get_run_stats(self) -> TaskRunStats:
+        return self._run_stats
 
     @abstractmethod
     def get_task_type(self) -> TaskTypeEnum | None:
@@ -76,3 +103,56 @@ class AbstractTaskService(AbstractService, metaclass=ABCMeta):
             coalesce=True,  # Skip intermediate runs if one was missed
         )
         return job
+
+    def _on_job_event(self, event: JobEvent) -> None:
+        if event.job_id != self.__class__.__name__:
+            return
+        if isinstance(event, JobSubmissionEvent):
+            scheduled_run_times = event.scheduled_run_times
+            # XXX: Fires coalesced by the scheduler are not notified, they are the ones in between
+            self._run_stats.skipped += self._count_fire_times_between(
+                self._last_scheduled_run_time, scheduled_run_times[-1]
+            )
+            if event.code == EVENT_JOB_MAX_INSTANCES:
+                # The previous run is still in progress
+                self._run_stats.skipped += len(scheduled_run_times)
+                logger.warning(f"{self.__class__.__name__} skipped, since the previous run is still in progress")
+            else:
+                self._pending_scheduled_run_time = scheduled_run_times[-1]
+            self._last_scheduled_run_time = scheduled_run_times[-1]
+        elif isinstance(event, JobExecutionEvent):
+            self._run_stats.skipped += 1
+            logger.warning(f"{self.__class__.__name__} run scheduled at {event.scheduled_run_time} was missed")
+
+    def _register_run(self, started_at: datetime, *, scheduled_run_time: datetime | None) -> None:
+        finished_at = datetime.now(UTC)
+        duration_seconds = (finished_at - started_at).total_seconds()
+        self._run_stats.runs += 1
+        self._run_stats.last_started_at = started_at
+        self._run_stats.last_duration_seconds = duration_seconds
+        self._run_stats.max_duration_seconds = max(self._run_stats.max_duration_seconds, duration_seconds)
+        self._run_stats.last_lateness_seconds = None
+        self._run_stats.last_run_overran = False
+        if scheduled_run_time is not None:
+            self._run_stats.last_lateness_seconds = (started_at - scheduled_run_time).total_seconds()
+            next_fire_time = self._get_next_fire_time(scheduled_run_time)
+            if next_fire_time is not None and finished_at > next_fire_time:
+                self._run_stats.overruns += 1
+                self._run_stats.last_run_overran = True
+                logger.warning(
+                    f"{self.__class__.__name__} overrun: it took {duration_seconds:.2f} seconds, "
+                    f"{self._run_stats.last_lateness_seconds:.2f} seconds late against its schedule"
+                )
+
+    def _count_fire_times_between(self, since: datetime | None, until: datetime) -> int:
+        ret = 0
+        if since is not None:
+            next_fire_time = self._get_next_fire_time(since)
+            while next_fire_time is not None and next_fire_time < until:
+                ret += 1
+                next_fire_time = self._get_next_fire_time(next_fire_time)
+        return ret
+
+    def _get_next_fire_time(self, fire_time: datetime) -> datetime | None:
+        trigger = self._job.trigger if self._job else self._get_job_trigger()
+        return trigger.get_next_fire_time(fire_time, fire_time + timedelta(microseconds=1))
@@ -1,6 +1,7 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from dependency_injector import containers, providers
 
+from crypto_futures_bot.infrastructure.tasks.metrics_summary_task_service import MetricsSummaryTaskService
 from crypto_futures_bot.infrastructure.tasks.signals_task_service import SignalsTaskService
 from crypto_futures_bot.infrastructure.tasks.task_manager import TaskManager
 
@@ -12,13 +13,13 @@ class TasksContainer(containers.DeclarativeContainer):
     event_emitter = providers.Dependency()
     telegram_service = providers.Dependency()
 
-    tracked_crypto_currency_service = providers.Dependency()
     push_notification_service = providers.Dependency()
     futures_exchange_service = providers.Dependency()
     crypto_technical_analysis_service = providers.Dependency()
     trade_now_service = providers.Dependency()
     market_signal_service = providers.Dependency()
-    signal_parametrization_service = providers.Dependency()
+    signals_run_context_service = providers.Dependency()
+    metrics_service = providers.Dependency()
 
     scheduler = providers.Singleton(AsyncIOScheduler)
 
@@ -31,10 +32,20 @@ class TasksContainer(containers.DeclarativeContainer):
         scheduler=scheduler,
         telegram_service=telegram_service,
         push_notification_service=push_notification_service,
-        tracked_crypto_currency_service=tracked_crypto_currency_service,
         futures_exchange_service=futures_exchange_service,
         crypto_technical_analysis_service=crypto_technical_analysis_service,
         trade_now_service=trade_now_service,
         market_signal_service=market_signal_service,
-        signal_parametrization_service=signal_parametrization_service,
+        signals_run_context_service=signals_run_context_service,
+        metrics_service=metrics_service,
+    )
+
+    metrics_summary_task_service = providers.Singleton(
+        MetricsSummaryTaskService,
+        configuration_properties=configuration_properties,
+        scheduler=scheduler,
+        telegram_service=telegram_service,
+        push_notification_service=push_notification_service,
+        futures_exchange_service=futures_exchange_service,
+        metrics_service=metrics_service,
     )
@@ -0,0 +1,71 @@
+import logging
+from typing import override
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+from crypto_futures_bot.config.configuration_properties import ConfigurationProperties
+from crypto_futures_bot.domain.enums import TaskTypeEnum
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.base import AbstractFuturesExchangeService
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.impl.single_flight_futures_exchange import (
+    SingleFlightFuturesExchangeService,
+)
+from crypto_futures_bot.infrastructure.services.metrics_service import MetricsService
+from crypto_futures_bot.infrastructure.services.push_notification_service import PushNotificationService
+from crypto_futures_bot.infrastructure.tasks.base import AbstractTaskService
+from crypto_futures_bot.interfaces.telegram.services.telegram_service import TelegramService
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsSummaryTaskService(AbstractTaskService):
+    def __init__(
+        self,
+        configuration_properties: ConfigurationProperties,
+        telegram_service: TelegramService,
+        push_notification_service: PushNotificationService,
+        scheduler: AsyncIOScheduler,
+        futures_exchange_service: AbstractFuturesExchangeService,
+        metrics_service: MetricsService,
+    ) -> None:
+        super().__init__(configuration_properties, scheduler, push_notification_service, telegram_service)
+        self._futures_exchange_service = futures_exchange_service
+        self._metrics_service = metrics_service
+        if self._configuration_properties.metrics_summary_interval_seconds > 0:
+            self._job = self._create_job()
+
+    @override
+    async def start(self) -> None:
+        """
+        Start method does not do anything,
+        this job will be running every time to log the latency summary
+        """
+
+    @override
+    async def stop(self) -> None:
+        """
+        Stop method does not do anything,
+        this job will be running every time to log the latency summary
+        """
+
+    @override
+    def get_task_type(self) -> TaskTypeEnum | None:
+        return None
+
+    @override
+    async def _run(self) -> None:
+        """
+        Log the latency percentiles of every stage, overall and per symbol,
+        along with the exchange calls saved by joining identical calls in flight
+        """
+        latency_summaries = self._metrics_service.render_latency_summaries()
+        if latency_summaries:
+            logger.info(f"Latency summary:\n{latency_summaries}")
+        if isinstance(self._futures_exchange_service, SingleFlightFuturesExchangeService) and (
+            saved_calls := self._futures_exchange_service.get_saved_calls()
+        ):
+            logger.info(f"Exchange calls saved by single-flight: {saved_calls}")
+
+    @override
+    def _get_job_trigger(self) -> IntervalTrigger:  # pragma: no cover
+        return IntervalTrigger(seconds=self._configuration_properties.metrics_summary_interval_seconds)
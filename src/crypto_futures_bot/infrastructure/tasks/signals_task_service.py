@@ -1,6 +1,7 @@
 import asyncio
 import logging
-from dataclasses import fields
+from dataclasses import dataclass, fields
+from datetime import UTC, datetime
 from typing import override
 
 import pandas as pd
@@ -12,16 +13,31 @@ from pyee.asyncio import AsyncIOEventEmitter
 
 from crypto_futures_bot.config.configuration_properties import ConfigurationProperties
 from crypto_futures_bot.constants import SIGNALS_EVALUATION_RESULT_EVENT_NAME
-from crypto_futures_bot.domain.enums import CandleStickEnum, PositionTypeEnum, PushNotificationTypeEnum, TaskTypeEnum
-from crypto_futures_bot.domain.vo import SignalParametrizationItem, SignalsEvaluationResult, TrackedCryptoCurrencyItem
+from crypto_futures_bot.domain.enums import CandleStickEnum, PositionTypeEnum, TaskTypeEnum
+from crypto_futures_bot.domain.types import Timeframe
+from crypto_futures_bot.domain.utils.timeframe_utils import (
+    get_last_closed_candle_timestamp,
+    get_timeframe_in_milliseconds,
+)
+from crypto_futures_bot.domain.vo import (
+    SignalParametrizationItem,
+    SignalsEvaluationResult,
+    SignalsRunContext,
+    TrackedCryptoCurrencyItem,
+)
 from crypto_futures_bot.domain.vo.candlestick_indicators import CandleStickIndicators
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.base import AbstractFuturesExchangeService
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo import AccountInfo, SymbolTicker
 from crypto_futures_bot.infrastructure.services.crypto_technical_analysis_service import CryptoTechnicalAnalysisService
+from crypto_futures_bot.infrastructure.services.indicators import (
+    evaluate_entry_signals,
+    stack_candlestick_indicators,
+    stack_signal_parametrization_items,
+)
 from crypto_futures_bot.infrastructure.services.market_signal_service import MarketSignalService
+from crypto_futures_bot.infrastructure.services.metrics_service import MetricsService
 from crypto_futures_bot.infrastructure.services.push_notification_service import PushNotificationService
-from crypto_futures_bot.infrastructure.services.signal_parametrization_service import SignalParametrizationService
-from crypto_futures_bot.infrastructure.services.tracked_crypto_currency_service import TrackedCryptoCurrencyService
+from crypto_futures_bot.infrastructure.services.signals_run_context_service import SignalsRunContextService
 from crypto_futures_bot.infrastructure.services.trade_now_service import TradeNowService
 from crypto_futures_bot.infrastructure.tasks.base import AbstractTaskService
 from crypto_futures_bot.interfaces.telegram.services.telegram_service import TelegramService
@@ -29,29 +45,42 @@ from crypto_futures_bot.interfaces.telegram.services.telegram_service import Tel
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class _SignalsCandleSticks:
+    crypto_currency: TrackedCryptoCurrencyItem
+    timeframe: Timeframe
+    signal_parametrization_item: SignalParametrizationItem
+    prev_candle: CandleStickIndicators
+    last_candle: CandleStickIndicators
+
+
 class SignalsTaskService(AbstractTaskService):
     def __init__(
         self,
         configuration_properties: ConfigurationProperties,
         telegram_service: TelegramService,
         push_notification_service: PushNotificationService,
-        signal_parametrization_service: SignalParametrizationService,
         event_emitter: AsyncIOEventEmitter,
         scheduler: AsyncIOScheduler,
-        tracked_crypto_currency_service: TrackedCryptoCurrencyService,
         futures_exchange_service: AbstractFuturesExchangeService,
         crypto_technical_analysis_service: CryptoTechnicalAnalysisService,
         trade_now_service: TradeNowService,
         market_signal_service: MarketSignalService,
+        signals_run_context_service: SignalsRunContextService,
+        metrics_service: MetricsService,
     ) -> None:
         super().__init__(configuration_properties, scheduler, push_notification_service, telegram_service)
         self._event_emitter = event_emitter
-        self._tracked_crypto_currency_service = tracked_crypto_currency_service
         self._futures_exchange_service = futures_exchange_service
         self._crypto_technical_analysis_service = crypto_technical_analysis_service
         self._trade_now_service = trade_now_service
         self._market_signal_service = market_signal_service
-        self._signal_parametrization_service = signal_parametrization_service
+        self._signals_run_context_service = signals_run_context_service
+        self._metrics_service = metrics_service
+        # Open timestamp (in millis) of the last closed candle evaluated per (crypto currency, timeframe)
+        self._last_evaluated_candle_timestamps: dict[tuple[str, Timeframe], int] = {}
+        # When that candle was evaluated, per (crypto currency, timeframe)
+        self._last_evaluated_at: dict[tuple[str, Timeframe], datetime] = {}
         self._job = self._create_job()
 
     @override
@@ -78,94 +107,250 @@ class SignalsTaskService(AbstractTaskService):
         Run the task
         """
         account_info = await self._futures_exchange_service.get_account_info()
-        tracked_crypto_currencies = await self._tracked_crypto_currency_service.find_all()
-        for tracked_crypto_currency in tracked_crypto_currencies:
-            await self._eval_signals(tracked_crypto_currency=tracked_crypto_currency, account_info=account_info)
+        # XXX: Configuration tables are read once per run, instead of once per crypto currency
+        with self._metrics_service.span("run_context_load"):
+            signals_run_context = await self._signals_run_context_service.load()
+        timeframes_by_crypto_currency = [
+            (tracked_crypto_currency, timeframes)
+            for tracked_crypto_currency in signals_run_context.tracked_crypto_currencies
+            if (
+                timeframes := self._get_due_timeframes(
+                    tracked_crypto_currency, account_info=account_info, signals_run_context=signals_run_context
+                )
+            )
+        ]
+        # XXX: Technical analysis of every symbol is pulled at once, each symbol under its own deadline,
+        # so the cycle takes roughly max(symbol latency) instead of the sum
+        technical_analysis_by_symbol = await self._crypto_technical_analysis_service.get_technical_analysis_many(
+            {
+                tracked_crypto_currency.to_symbol(account_info=account_info): timeframes
+                for tracked_crypto_currency, timeframes in timeframes_by_crypto_currency
+            },
+            timeout=self._configuration_properties.signals_symbol_timeout_seconds,
+        )
+        signals_candlesticks_by_crypto_currency = await asyncio.gather(
+            *[
+                self._get_signals_candlesticks(
+                    tracked_crypto_currency,
+                    account_info=account_info,
+                    technical_analysis=technical_analysis_by_symbol[
+                        tracked_crypto_currency.to_symbol(account_info=account_info)
+                    ],
+                    signals_run_context=signals_run_context,
+                )
+                for tracked_crypto_currency, _ in timeframes_by_crypto_currency
+            ]
+        )
+        signals_candlesticks = [
+            item for signals_candlesticks in signals_candlesticks_by_crypto_currency for item in signals_candlesticks
+        ]
+        # XXX: Entry rules of every (crypto currency, timeframe) are evaluated at once, in a single vectorized pass
+        with self._metrics_service.span("entry_rules"):
+            signals_evaluation_results = self._evaluate_signals(signals_candlesticks)
+        semaphore = asyncio.Semaphore(self._configuration_properties.signals_max_concurrency)
+        await asyncio.gather(
+            *[
+                self._handle_signals_evaluation_result(
+                    signals_evaluation_result,
+                    account_info=account_info,
+                    signal_parametrization_item=item.signal_parametrization_item,
+                    signals_run_context=signals_run_context,
+                    semaphore=semaphore,
+                )
+                for item, signals_evaluation_result in zip(
+                    signals_candlesticks, signals_evaluation_results, strict=True
+                )
+            ]
+        )
 
     @override
     def _get_job_trigger(self) -> CronTrigger | IntervalTrigger:  # pragma: no cover
-        if self._configuration_properties.signals_run_via_cron_pattern:
+        if self._configuration_properties.signals_run_on_candle_close:
+            # XXX: Every minute (the finest timeframe), right after the candle close.
+            # Each (crypto currency, timeframe) is only evaluated once its candle has been closed
+            trigger = CronTrigger(minute="*", second=self._configuration_properties.signals_candle_close_delay_seconds)
+        elif self._configuration_properties.signals_run_via_cron_pattern:
             trigger = CronTrigger(minute="*")  # Every minute
         else:
             trigger = IntervalTrigger(seconds=self._configuration_properties.job_interval_seconds)
         return trigger
 
-    async def _eval_signals(
-        self, tracked_crypto_currency: TrackedCryptoCurrencyItem, *, account_info: AccountInfo
-    ) -> None:
+    def _get_due_timeframes(
+        self,
+        tracked_crypto_currency: TrackedCryptoCurrencyItem,
+        *,
+        account_info: AccountInfo,
+        signals_run_context: SignalsRunContext,
+    ) -> list[Timeframe]:
+        symbol = tracked_crypto_currency.to_symbol(account_info=account_info)
+        signal_parametrization_item = signals_run_context.get_signal_parametrization_item(
+            tracked_crypto_currency.currency
+        )
+        ret = [
+            timeframe
+            for timeframe in signal_parametrization_item.timeframes
+            if self._is_signals_evaluation_due(tracked_crypto_currency, timeframe=timeframe)
+        ]
+        if ret:
+            logger.info(f"Evaluating signals for {symbol}...")
+        else:
+            logger.info(f"Skipping signals evaluation for {symbol}, waiting for the next candle close")
+        return ret
+
+    async def _get_signals_candlesticks(
+        self,
+        tracked_crypto_currency: TrackedCryptoCurrencyItem,
+        *,
+        account_info: AccountInfo,
+        technical_analysis: dict[Timeframe, pd.DataFrame] | Exception,
+        signals_run_context: SignalsRunContext,
+    ) -> list[_SignalsCandleSticks]:
+        ret: list[_SignalsCandleSticks] = []
+        if isinstance(technical_analysis, TimeoutError):
+            logger.error(
+                f"Timeout evaluating signals for {tracked_crypto_currency} after "
+                f"{self._configuration_properties.signals_symbol_timeout_seconds} seconds"
+            )
+            await self._notify_fatal_error_via_telegram(technical_analysis)
+            return ret
         try:
+            if isinstance(technical_analysis, Exception):
+                raise technical_analysis
             symbol = tracked_crypto_currency.to_symbol(account_info=account_info)
-            logger.info(f"Evaluating signals for {symbol}...")
-            signal_parametrization_item = await self._signal_parametrization_service.find_by_crypto_currency(
-                crypto_currency=tracked_crypto_currency.currency
+            signal_parametrization_item = signals_run_context.get_signal_parametrization_item(
+                tracked_crypto_currency.currency
             )
-            technical_analysis_df = await self._crypto_technical_analysis_service.get_technical_analysis(symbol=symbol)
-            signals_evaluation_result, *_ = await self._check_signals(
-                tracked_crypto_currency=tracked_crypto_currency,
-                technical_analysis_df=technical_analysis_df,
-                account_info=account_info,
-                signal_parametrization_item=signal_parametrization_item,
+            for timeframe, technical_analysis_df in technical_analysis.items():
+                prev_candle = await self._crypto_technical_analysis_service.get_candlestick_indicators(
+                    symbol=symbol, index=CandleStickEnum.PREV, technical_analysis_df=technical_analysis_df
+                )
+                last_candle = await self._crypto_technical_analysis_service.get_candlestick_indicators(
+                    symbol=symbol, index=CandleStickEnum.LAST, technical_analysis_df=technical_analysis_df
+                )
+                ret.append(
+                    _SignalsCandleSticks(
+                        crypto_currency=tracked_crypto_currency,
+                        timeframe=timeframe,
+                        signal_parametrization_item=signal_parametrization_item,
+                        prev_candle=prev_candle,
+                        last_candle=last_candle,
+                    )
+                )
+        except Exception as e:
+            logger.error(f"Error evaluating signals for {tracked_crypto_currency}: {e}", exc_info=True)
+            await self._notify_fatal_error_via_telegram(e)
+        return ret
+
+    def _evaluate_signals(self, signals_candlesticks: list[_SignalsCandleSticks]) -> list[SignalsEvaluationResult]:
+        if not signals_candlesticks:
+            return []
+        long_entry, short_entry = evaluate_entry_signals(
+            stack_candlestick_indicators([item.prev_candle for item in signals_candlesticks]),
+            stack_candlestick_indicators([item.last_candle for item in signals_candlesticks]),
+            **stack_signal_parametrization_items([item.signal_parametrization_item for item in signals_candlesticks]),
+        )
+        ret: list[SignalsEvaluationResult] = []
+        for idx, item in enumerate(signals_candlesticks):
+            signals_evaluation_result = SignalsEvaluationResult(
+                timestamp=item.last_candle.timestamp,
+                crypto_currency=item.crypto_currency,
+                timeframe=item.timeframe,
+                long_entry=bool(long_entry[idx]),
+                short_entry=bool(short_entry[idx]),
+            )
+            self._last_evaluated_candle_timestamps[(item.crypto_currency.currency, item.timeframe)] = int(
+                signals_evaluation_result.timestamp.timestamp() * 1000
             )
+            self._last_evaluated_at[(item.crypto_currency.currency, item.timeframe)] = datetime.now(UTC)
             logger.info(
-                f"SignalsEvaluationResult[{symbol}]: "
+                f"SignalsEvaluationResult[{item.last_candle.symbol} ({item.timeframe})]: "
                 f"<Long Entry? = {signals_evaluation_result.long_entry}, "
                 f"Short Entry? = {signals_evaluation_result.short_entry}>"
             )
-            chat_ids = await self._push_notification_service.get_actived_subscription_by_type(
-                notification_type=PushNotificationTypeEnum.SIGNALS
-            )
-            if chat_ids:
-                await self._notify_signals(
-                    signals_evaluation_result=signals_evaluation_result,
-                    chat_ids=chat_ids,
-                    account_info=account_info,
-                    signal_parametrization_item=signal_parametrization_item,
-                )
-        except Exception as e:
-            logger.error(f"Error evaluating signals for {tracked_crypto_currency}: {e}", exc_info=True)
-            await self._notify_fatal_error_via_telegram(e)
-        finally:
-            if signals_evaluation_result.is_entry:
-                self._event_emitter.emit(SIGNALS_EVALUATION_RESULT_EVENT_NAME, signals_evaluation_result)
+            ret.append(signals_evaluation_result)
+        return ret
 
-    async def _check_signals(
+    async def _handle_signals_evaluation_result(
         self,
-        tracked_crypto_currency: TrackedCryptoCurrencyItem,
-        technical_analysis_df: pd.DataFrame,
-        account_info: AccountInfo,
+        signals_evaluation_result: SignalsEvaluationResult,
         *,
+        account_info: AccountInfo,
         signal_parametrization_item: SignalParametrizationItem,
-    ) -> tuple[SignalsEvaluationResult, CandleStickIndicators]:
-        symbol = tracked_crypto_currency.to_symbol(account_info=account_info)
-        prev_candle = await self._crypto_technical_analysis_service.get_candlestick_indicators(
-            symbol=symbol, index=CandleStickEnum.PREV, technical_analysis_df=technical_analysis_df
-        )
-        last_candle = await self._crypto_technical_analysis_service.get_candlestick_indicators(
-            symbol=symbol, index=CandleStickEnum.LAST, technical_analysis_df=technical_analysis_df
-        )
-        signals_evaluation_result = SignalsEvaluationResult(
-            timestamp=last_candle.timestamp,
-            crypto_currency=tracked_crypto_currency,
-            long_entry=self._is_long_entry(
-                prev_candle=prev_candle,
-                last_candle=last_candle,
-                signal_parametrization_item=signal_parametrization_item,
-            ),
-            short_entry=self._is_short_entry(
-                prev_candle=prev_candle,
-                last_candle=last_candle,
-                signal_parametrization_item=signal_parametrization_item,
-            ),
+        signals_run_context: SignalsRunContext,
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        async with semaphore:
+            try:
+                if signals_run_context.signals_chat_ids:
+                    await self._notify_signals(
+                        signals_evaluation_result=signals_evaluation_result,
+                        chat_ids=signals_run_context.signals_chat_ids,
+                        account_info=account_info,
+                        signal_parametrization_item=signal_parametrization_item,
+                        signals_run_context=signals_run_context,
+                    )
+            except Exception as e:
+                logger.error(
+                    f"Error notifying signals for {signals_evaluation_result.crypto_currency}: {e}", exc_info=True
+                )
+                await self._notify_fatal_error_via_telegram(e)
+            finally:
+                if signals_evaluation_result.is_entry:
+                    self._event_emitter.emit(SIGNALS_EVALUATION_RESULT_EVENT_NAME, signals_evaluation_result)
+
+    def _is_signals_evaluation_due(
+        self, tracked_crypto_currency: TrackedCryptoCurrencyItem, *, timeframe: Timeframe
+    ) -> bool:
+        """
+        Check whether the last closed candle is still pending to be evaluated.
+        It is always due, unless signals are configured to run on candle close
+        or the candle has been evaluated moments ago (see `_get_coalescing_window_seconds`).
+        """
+        now = datetime.now(UTC)
+        last_closed_candle_timestamp = get_last_closed_candle_timestamp(timeframe, now)
+        key = (tracked_crypto_currency.currency, timeframe)
+        last_evaluated_candle_timestamp = self._last_evaluated_candle_timestamps.get(key)
+        is_last_closed_candle_evaluated = (
+            last_evaluated_candle_timestamp is not None
+            and last_evaluated_candle_timestamp >= last_closed_candle_timestamp
         )
-        return signals_evaluation_result, last_candle
+        if not self._configuration_properties.signals_run_on_candle_close:
+            last_evaluated_at = self._last_evaluated_at.get(key)
+            return not (
+                is_last_closed_candle_evaluated
+                and last_evaluated_at is not None
+                and (now - last_evaluated_at).total_seconds() < self._get_coalescing_window_seconds()
+            )
+        if is_last_closed_candle_evaluated:
+            return False
+        if self._configuration_properties.signals_intra_candle_check_enabled:
+            # XXX: Catch up with candles which could not be evaluated right after their close
+            # (e.g. exchange errors, timeouts or the closed candle was not yet published)
+            return True
+        # Otherwise, only right after the candle close
+        candle_close_timestamp = last_closed_candle_timestamp + get_timeframe_in_milliseconds(timeframe)
+        return int(now.timestamp() * 1000) - candle_close_timestamp < get_timeframe_in_milliseconds("1m")
+
+    def _get_coalescing_window_seconds(self) -> float:
+        """
+        Candles evaluated within this window are not evaluated again.
+        It is widened to the duration of the last run when it overran, so an overloaded task catches up
+        by skipping the crypto currencies which are up to date.
+        """
+        ret = self._configuration_properties.signals_coalescing_window_seconds
+        run_stats = self.get_run_stats()
+        if run_stats.last_run_overran and run_stats.last_duration_seconds is not None:
+            ret = max(ret, run_stats.last_duration_seconds)
+        return ret
 
     async def _notify_signals(
         self,
         signals_evaluation_result: SignalsEvaluationResult,
-        chat_ids: list[str],
+        chat_ids: list[int],
         account_info: AccountInfo,
         *,
         signal_parametrization_item: SignalParametrizationItem,
+        signals_run_context: SignalsRunContext | None = None,
     ) -> None:
         signals_field_names = [field.name for field in fields(signals_evaluation_result) if field.type is bool]
         for signals_field_name in signals_field_names:
@@ -177,6 +362,7 @@ class SignalsTaskService(AbstractTaskService):
                     chat_ids=chat_ids,
                     account_info=account_info,
                     signal_parametrization_item=signal_parametrization_item,
+                    signals_run_context=signals_run_context,
                 )
 
     async def _notify_single_signal(
@@ -185,20 +371,24 @@ class SignalsTaskService(AbstractTaskService):
         *,
         is_long: bool,
         is_entry: bool,
-        chat_ids: list[str],
+        chat_ids: list[int],
         account_info: AccountInfo,
         signal_parametrization_item: SignalParametrizationItem,
+        signals_run_context: SignalsRunContext | None = None,
     ) -> None:
-        exists = await self._market_signal_service.exists_market_signal_by_timestamp(
-            timestamp=int(signals_evaluation_result.timestamp.timestamp() * 1000),
-            crypto_currency=signals_evaluation_result.crypto_currency,
-            position_type=PositionTypeEnum.LONG if is_long else PositionTypeEnum.SHORT,
-            timeframe=signals_evaluation_result.timeframe,
-        )
-        if not exists:
-            symbol_ticker = await self._futures_exchange_service.get_symbol_ticker(
-                symbol=signals_evaluation_result.crypto_currency.to_symbol(account_info=account_info)
+        symbol = signals_evaluation_result.crypto_currency.to_symbol(account_info=account_info)
+        with self._metrics_service.span("market_signal_lookup", symbol=symbol):
+            exists = await self._market_signal_service.exists_market_signal_by_timestamp(
+                timestamp=int(signals_evaluation_result.timestamp.timestamp() * 1000),
+                crypto_currency=signals_evaluation_result.crypto_currency,
+                position_type=PositionTypeEnum.LONG if is_long else PositionTypeEnum.SHORT,
+                timeframe=signals_evaluation_result.timeframe,
             )
+        if not exists:
+            with self._metrics_service.span("symbol_ticker_fetch", symbol=symbol):
+                symbol_ticker = await self._futures_exchange_service.get_symbol_ticker(
+                    symbol=symbol, max_age_ms=self._configuration_properties.ticker_max_age_ms
+                )
             if is_entry:
                 await self._notify_entry(
                     signals_evaluation_result=signals_evaluation_result,
@@ -206,6 +396,7 @@ class SignalsTaskService(AbstractTaskService):
                     chat_ids=chat_ids,
                     account_info=account_info,
                     signal_parametrization_item=signal_parametrization_item,
+                    signals_run_context=signals_run_context,
                 )
             else:  # pragma: no cover
                 await self._notify_exit(
@@ -221,15 +412,21 @@ class SignalsTaskService(AbstractTaskService):
         signals_evaluation_result: SignalsEvaluationResult,
         *,
         is_long: bool,
-        chat_ids: list[str],
+        chat_ids: list[int],
         account_info: AccountInfo,
         signal_parametrization_item: SignalParametrizationItem,
+        signals_run_context: SignalsRunContext | None = None,
     ) -> None:
         if not self._configuration_properties.notify_entry_signals:
             return
-        trade_now_hints = await self._trade_now_service.get_trade_now_hints(
-            signals_evaluation_result.crypto_currency, signal_parametrization_item=signal_parametrization_item
-        )
+        symbol = signals_evaluation_result.crypto_currency.to_symbol(account_info=account_info)
+        with self._metrics_service.span("trade_now_hints", symbol=symbol):
+            trade_now_hints = await self._trade_now_service.get_trade_now_hints(
+                signals_evaluation_result.crypto_currency,
+                timeframe=signals_evaluation_result.timeframe,
+                signal_parametrization_item=signal_parametrization_item,
+                signals_run_context=signals_run_context,
+            )
         position_hints = trade_now_hints.long if is_long else trade_now_hints.short
         icon = "🟢" if is_long else "🔴"
         signal_type = "LONG" if is_long else "SHORT"
@@ -237,6 +434,7 @@ class SignalsTaskService(AbstractTaskService):
             f"{icon} {html.bold(signal_type + ' ENTRY SIGNAL')} for {html.code(signals_evaluation_result.crypto_currency.currency)} {icon}",  # noqa: E501
             "================================",
             f"🏷️ {html.bold('Symbol')} = {html.code(signals_evaluation_result.crypto_currency.to_symbol(account_info=account_info))}",  # noqa: E501
+            f"⏱️ {html.bold('Timeframe')} = {html.code(signals_evaluation_result.timeframe)}",
             "--------------------------------",
             f"🎯 {html.bold('Entry')} = {html.code(position_hints.entry_price)} {account_info.currency_code}",
             f"⚡ {html.bold('Leverage')} = x{html.code(f'{position_hints.leverage}')}",
@@ -254,14 +452,15 @@ class SignalsTaskService(AbstractTaskService):
             f"🔴 {html.bold('Losses at SL')} = {html.bold(f'-{position_hints.potential_loss}')} {account_info.currency_code}",  # noqa: E501
         ]
         message = "\n".join(message_lines)
-        await self._notify_alert(telegram_chat_ids=chat_ids, body_message=message)
+        with self._metrics_service.span("telegram_notification", symbol=symbol):
+            await self._notify_alert(telegram_chat_ids=chat_ids, body_message=message)
 
     async def _notify_exit(
         self,
         signals_evaluation_result: SignalsEvaluationResult,
         *,
         is_long: bool,
-        chat_ids: list[str],
+        chat_ids: list[int],
         account_info: AccountInfo,
         symbol_ticker: SymbolTicker,
     ) -> None:  # pragma: no cover
@@ -279,47 +478,7 @@ class SignalsTaskService(AbstractTaskService):
         message = "\n".join(message_lines)
         await self._notify_alert(telegram_chat_ids=chat_ids, body_message=message)
 
-    def _is_long_entry(
-        self,
-        prev_candle: CandleStickIndicators,
-        last_candle: CandleStickIndicators,
-        *,
-        signal_parametrization_item: SignalParametrizationItem,
-    ) -> bool:
-        # TREND: Price is above the baseline (Safety)
-        trend_ok = (
-            not signal_parametrization_item.double_confirm_trend or prev_candle.closing_price > prev_candle.ema50
-        ) and last_candle.closing_price > last_candle.ema50
-        # TRIGGER: Stoch Cross Up
-        stoch_cross = (
-            prev_candle.stoch_rsi_k <= prev_candle.stoch_rsi_d and last_candle.stoch_rsi_k > last_candle.stoch_rsi_d
-        )
-        # FILTER: Must be Oversold (Buying the dip)
-        stoch_condition = prev_candle.stoch_rsi_k < signal_parametrization_item.long_entry_oversold_threshold
-        # MOMENTUM: Histogram must be positive (Recovery started)
-        macd_positive = last_candle.macd_hist > 0
-        is_long_entry = bool(trend_ok and stoch_cross and stoch_condition and macd_positive)
-        return is_long_entry
-
-    def _is_short_entry(
-        self,
-        prev_candle: CandleStickIndicators,
-        last_candle: CandleStickIndicators,
-        *,
-        signal_parametrization_item: SignalParametrizationItem,
-    ) -> bool:
-        trend_ok = (
-            not signal_parametrization_item.double_confirm_trend or prev_candle.closing_price < prev_candle.ema50
-        ) and last_candle.closing_price < last_candle.ema50
-        stoch_cross = (
-            prev_candle.stoch_rsi_k >= prev_candle.stoch_rsi_d and last_candle.stoch_rsi_k < last_candle.stoch_rsi_d
-        )
-        stoch_condition = prev_candle.stoch_rsi_k > signal_parametrization_item.short_entry_overbought_threshold
-        macd_negative = last_candle.macd_hist < 0
-        is_short_entry = bool(trend_ok and stoch_cross and stoch_condition and macd_negative)
-        return is_short_entry
-
-    async def _notify_alert(self, telegram_chat_ids: list[str], body_message: str) -> None:
+    async def _notify_alert(self, telegram_chat_ids: list[int], body_message: str) -> None:
         await asyncio.gather(
             *[
                 self._telegram_service.send_message(chat_id=tg_chat_id, text=body_message)
@@ -6,6 +6,7 @@ from aiogram3_form import Form, FormField
 from crypto_futures_bot.constants import (
     LONG_ENTRY_OVERSOLD_THRESHOLDS,
     SHORT_ENTRY_OVERBOUGHT_THRESHOLDS,
+    SIGNALS_TIMEFRAMES_VALUES,
     SL_MULTIPLIERS,
     TP_MULTIPLIERS,
     YES_NO_VALUES,
@@ -49,6 +50,12 @@ class SignalParametrizationForm(Form):
         filter=F.text.in_(YES_NO_VALUES) & F.text,
         reply_markup=ReplyKeyboardBuilder().add(*(KeyboardButton(text=text) for text in YES_NO_VALUES)).as_markup(),
     )
+    timeframes: str = FormField(
+        enter_message_text="⏱️ Select Timeframes",
+        error_message_text=f"❌ Invalid Timeframes value. Valid values: {', '.join(SIGNALS_TIMEFRAMES_VALUES)}",
+        filter=F.text.in_(SIGNALS_TIMEFRAMES_VALUES) & F.text,
+        reply_markup=KeyboardsBuilder.get_signal_parametrization_keyboard_for(SIGNALS_TIMEFRAMES_VALUES),
+    )
 
     def to_value_object(self, crypto_currency: str) -> SignalParametrizationItem:
         ret = SignalParametrizationItem(
@@ -58,5 +65,6 @@ class SignalParametrizationForm(Form):
             long_entry_oversold_threshold=float(self.long_entry_oversold_threshold),
             short_entry_overbought_threshold=float(self.short_entry_overbought_threshold),
             double_confirm_trend=bool(self.double_confirm_trend.lower() == "yes"),
+            timeframes=self.timeframes.split(","),
         )
         return ret
@@ -197,6 +197,7 @@ class MessagesFormatter:
             f"🛡️ SL ATR x = {html.code(signal_parametrization.atr_sl_mult)}",
             f"🏁 TP ATR x = {html.code(signal_parametrization.atr_tp_mult)}",
             f"➿ Double Confirm Trend? = {'🟢' if signal_parametrization.double_confirm_trend else '🟥'}",
+            f"⏱️ Timeframes = {html.code(', '.join(signal_parametrization.timeframes))}",
         ]
         ret = "\n".join(message_lines)
         return ret
@@ -59,12 +59,17 @@ async def main() -> None:
         if isclass(provider.provides) and issubclass(provider.provides, AbstractEventHandlerService):
             dependency_object = provider()
             dependency_object.configure()
+    await application_container.infrastructure_container().services_container().market_signal_service().warm_up()
     logger.info("Futures exchange service initialization...")
     await futures_exchange_service.post_init()
     logger.info("Futures exchange service initialized...")
     if configuration_properties.telegram_bot_enabled:
         logger.info("Starting Telegram bot...")
-        await dp.start_polling(telegram_bot)
+        try:
+            await dp.start_polling(telegram_bot)
+        finally:
+            # XXX: Polling runs until the bot is shut down, then the market stream and exchange connections are closed
+            await futures_exchange_service.close()
 
 
 if __name__ == "__main__":
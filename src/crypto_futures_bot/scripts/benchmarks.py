@@ -0,0 +1,88 @@
+import time
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+from ta.momentum import RSIIndicator, StochRSIIndicator
+from ta.trend import MACD, EMAIndicator
+from ta.volatility import AverageTrueRange
+from typer import echo
+
+from crypto_futures_bot.infrastructure.services.indicators import INDICATOR_COLUMNS, OHLCV_COLUMNS
+from crypto_futures_bot.infrastructure.services.indicators.registry import calculate_indicators
+
+
+def calculate_indicators_with_ta(df: pd.DataFrame) -> pd.DataFrame:
+    """Reference implementation of the indicators, based on the `ta` library."""
+    df = df.copy()
+    # EMAs
+    df["ema50"] = EMAIndicator(df["Close"], window=50).ema_indicator()
+    # MACD
+    macd = MACD(df["Close"])
+    df["macd_line"] = macd.macd()
+    df["macd_signal"] = macd.macd_signal()
+    df["macd_hist"] = macd.macd_diff()
+    # Stochastic RSI
+    stoch_rsi = StochRSIIndicator(df["Close"])
+    df["stoch_rsi"] = stoch_rsi.stochrsi()
+    df["stoch_rsi_k"] = stoch_rsi.stochrsi_k()
+    df["stoch_rsi_d"] = stoch_rsi.stochrsi_d()
+    # Relative Strength Index (RSI)
+    df["rsi"] = RSIIndicator(df["Close"]).rsi()
+    # Average True Range (ATR)
+    df["atr"] = AverageTrueRange(df["High"], df["Low"], df["Close"]).average_true_range()
+    # Relative Volume (RVOL)
+    df["volume_sma"] = df["Volume"].rolling(window=20).mean()
+    df["relative_volume"] = df["Volume"] / df["volume_sma"]
+    return df
+
+
+def calculate_indicators_with_kernels(df: pd.DataFrame) -> dict[str, np.ndarray]:
+    return calculate_indicators(
+        high=df["High"].to_numpy(dtype=np.float64),
+        low=df["Low"].to_numpy(dtype=np.float64),
+        close=df["Close"].to_numpy(dtype=np.float64),
+        volume=df["Volume"].to_numpy(dtype=np.float64),
+    )
+
+
+def generate_random_walk_ohlcv(candles: int, *, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.cumprod(1 + rng.normal(0, 0.005, candles))
+    open_price = np.concatenate([[close[0]], close[:-1]])
+    high = np.maximum(open_price, close) * (1 + rng.uniform(0, 0.005, candles))
+    low = np.minimum(open_price, close) * (1 - rng.uniform(0, 0.005, candles))
+    volume = rng.uniform(1_000, 5_000, candles)
+    timestamp = 1672531200000 + np.arange(candles, dtype=np.int64) * 900_000
+    return pd.DataFrame(
+        {"timestamp": timestamp, "Open": open_price, "High": high, "Low": low, "Close": close, "Volume": volume},
+        columns=OHLCV_COLUMNS,
+    )
+
+
+def run_indicators_benchmark(*, candles: int, repeat: int) -> None:
+    df = generate_random_walk_ohlcv(candles)
+    ta_elapsed = _measure(lambda: calculate_indicators_with_ta(df), repeat=repeat)
+    kernels_elapsed = _measure(lambda: calculate_indicators_with_kernels(df), repeat=repeat)
+    echo(f"Indicators over {candles} candles (best of {repeat})")
+    echo(f"  ta:      {ta_elapsed * 1000:10.2f} ms")
+    echo(f"  kernels: {kernels_elapsed * 1000:10.2f} ms ({ta_elapsed / kernels_elapsed:.1f}x)")
+
+    expected_df = calculate_indicators_with_ta(df)
+    actual = calculate_indicators_with_kernels(df)
+    for column in INDICATOR_COLUMNS:
+        expected_values = expected_df[column].to_numpy(dtype=np.float64)
+        same_nan_positions = np.array_equal(np.isnan(actual[column]), np.isnan(expected_values))
+        max_relative_error = np.nanmax(
+            np.abs(actual[column] - expected_values) / np.maximum(1.0, np.abs(expected_values))
+        )
+        echo(f"  {column:<16} max relative error: {max_relative_error:.3e}, same NaN positions: {same_nan_positions}")
+
+
+def _measure(fn: Callable[[], object], *, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
@@ -14,6 +14,7 @@ from crypto_futures_bot.constants import (
     DEFAULT_RISK_MANAGEMENT_PERCENTAGE,
     DEFAULT_SHORT_ENTRY_OVERBOUGHT_THRESHOLD,
 )
+from crypto_futures_bot.scripts.benchmarks import run_indicators_benchmark
 from crypto_futures_bot.scripts.config import Container
 from crypto_futures_bot.scripts.services import BacktestingService
 
@@ -105,5 +106,16 @@ def research(
     )
 
 
+@app.command()
+def benchmark_indicators(
+    candles: int = typer.Option(35_040, help="Number of candles (one year of 15m candles by default)"),
+    repeat: int = typer.Option(5, help="Number of repetitions"),
+):
+    """
+    Compare the NumPy indicator kernels against the `ta` implementation.
+    """
+    run_indicators_benchmark(candles=candles, repeat=repeat)
+
+
 if __name__ == "__main__":
     app()
@@ -7,40 +7,39 @@ from crypto_futures_bot.infrastructure.adapters.futures_exchange.impl.mexc_futur
     MEXCFuturesExchangeService,
 )
 from crypto_futures_bot.infrastructure.services.crypto_technical_analysis_service import CryptoTechnicalAnalysisService
-from crypto_futures_bot.infrastructure.services.market_signal_service import MarketSignalService
+from crypto_futures_bot.infrastructure.services.metrics_service import MetricsService
+from crypto_futures_bot.infrastructure.services.ohlcv_buffer_service import OHLCVBufferService
 from crypto_futures_bot.infrastructure.services.orders_analytics_service import OrdersAnalyticsService
-from crypto_futures_bot.infrastructure.services.trade_now_service import TradeNowService
-from crypto_futures_bot.infrastructure.tasks.signals_task_service import SignalsTaskService
 from crypto_futures_bot.scripts.services import BacktestingService
 
 
-def _noop_add_job(*args, **kwargs) -> None:
-    pass
-
-
 class Container(containers.DeclarativeContainer):
     configuration_properties = providers.Singleton(ConfigurationProperties)
     # Mocks
     telegram_service_mock = providers.Object(SimpleNamespace())
     push_notification_service_mock = providers.Object(SimpleNamespace())
-    event_emitter_mock = providers.Object(SimpleNamespace())
-    scheduler_mock = providers.Object(SimpleNamespace(add_job=_noop_add_job))
-    auto_trader_crypto_currency_service_mock = providers.Object(SimpleNamespace())
     tracked_crypto_currency_service_mock = providers.Object(SimpleNamespace())
-    signal_parametrization_service_mock = providers.Object(SimpleNamespace())
-    risk_management_service_mock = providers.Object(SimpleNamespace())
     mexc_remote_service_mock = providers.Object(SimpleNamespace())
     # Services
+    metrics_service = providers.Singleton(MetricsService, configuration_properties=configuration_properties)
     futures_exchange_service = providers.Singleton(
         MEXCFuturesExchangeService,
         configuration_properties=configuration_properties,
         mexc_remote_service=mexc_remote_service_mock,
+        record_latency=metrics_service.provided.record,
+    )
+    ohlcv_buffer_service = providers.Singleton(
+        OHLCVBufferService,
+        configuration_properties=configuration_properties,
+        futures_exchange_service=futures_exchange_service,
     )
-
     crypto_technical_analysis_service = providers.Singleton(
         CryptoTechnicalAnalysisService,
+        configuration_properties=configuration_properties,
         tracked_crypto_currency_service=tracked_crypto_currency_service_mock,
         futures_exchange_service=futures_exchange_service,
+        ohlcv_buffer_service=ohlcv_buffer_service,
+        metrics_service=metrics_service,
     )
 
     orders_analytics_service = providers.Singleton(
@@ -50,46 +49,10 @@ class Container(containers.DeclarativeContainer):
         push_notification_service=push_notification_service_mock,
         telegram_service=telegram_service_mock,
     )
-    trade_now_service = providers.Singleton(
-        TradeNowService,
-        futures_exchange_service=futures_exchange_service,
-        crypto_technical_analysis_service=crypto_technical_analysis_service,
-        orders_analytics_service=orders_analytics_service,
-        signal_parametrization_service=signal_parametrization_service_mock,
-        risk_management_service=risk_management_service_mock,
-        tracked_crypto_currency_service=tracked_crypto_currency_service_mock,
-        auto_trader_crypto_currency_service=auto_trader_crypto_currency_service_mock,
-    )
-
-    market_signal_service = providers.Singleton(
-        MarketSignalService,
-        configuration_properties=configuration_properties,
-        event_emitter=event_emitter_mock,
-        push_notification_service=push_notification_service_mock,
-        telegram_service=telegram_service_mock,
-        trade_now_service=trade_now_service,
-    )
-
-    signals_task_service = providers.Singleton(
-        SignalsTaskService,
-        configuration_properties=configuration_properties,
-        telegram_service=telegram_service_mock,
-        push_notification_service=push_notification_service_mock,
-        event_emitter=event_emitter_mock,
-        scheduler=scheduler_mock,
-        tracked_crypto_currency_service=tracked_crypto_currency_service_mock,
-        futures_exchange_service=futures_exchange_service,
-        crypto_technical_analysis_service=crypto_technical_analysis_service,
-        market_signal_service=market_signal_service,
-        trade_now_service=trade_now_service,
-        signal_parametrization_service=signal_parametrization_service_mock,
-    )
-
     backtesting_service = providers.Singleton(
         BacktestingService,
         configuration_properties=configuration_properties,
         futures_exchange_service=futures_exchange_service,
         crypto_technical_analysis_service=crypto_technical_analysis_service,
         orders_analytics_service=orders_analytics_service,
-        signals_task_service=signals_task_service,
     )
@@ -24,8 +24,8 @@ from crypto_futures_bot.infrastructure.adapters.futures_exchange.impl.mexc_futur
 )
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo import SymbolMarketConfig
 from crypto_futures_bot.infrastructure.services.crypto_technical_analysis_service import CryptoTechnicalAnalysisService
+from crypto_futures_bot.infrastructure.services.indicators import STRATEGY_INDICATOR_COLUMNS
 from crypto_futures_bot.infrastructure.services.orders_analytics_service import OrdersAnalyticsService
-from crypto_futures_bot.infrastructure.tasks.signals_task_service import SignalsTaskService
 from crypto_futures_bot.scripts.jobs import run_single_backtest_combination
 from crypto_futures_bot.scripts.strategy import BotStrategy
 from crypto_futures_bot.scripts.vo import BacktestingResult
@@ -40,13 +40,11 @@ class BacktestingService:
         futures_exchange_service: MEXCFuturesExchangeService,
         crypto_technical_analysis_service: CryptoTechnicalAnalysisService,
         orders_analytics_service: OrdersAnalyticsService,
-        signals_task_service: SignalsTaskService,
     ) -> None:
         self._config = configuration_properties
         self._exchange_service = futures_exchange_service
         self._crypto_technical_analysis_service = crypto_technical_analysis_service
         self._orders_analytics_service = orders_analytics_service
-        self._signals_task_service = signals_task_service
 
     async def run(
         self,
@@ -190,7 +188,6 @@ class BacktestingService:
             if not use_tqdm:
                 backtesting._tqdm = lambda iterable=None, *args, **kwargs: iterable
             stats = bt.run(
-                signals_task_service=self._signals_task_service,
                 orders_analytics_service=self._orders_analytics_service,
                 symbol_market_config=symbol_market_config,
                 risk=risk,
@@ -256,7 +253,9 @@ class BacktestingService:
         echo(f"Total candles fetched: {len(all_ohlcv)}")
         if not all_ohlcv:
             return None
-        df = await self._crypto_technical_analysis_service.get_technical_analysis(symbol, ohlcv=all_ohlcv)
+        df = await self._crypto_technical_analysis_service.get_technical_analysis(
+            symbol, ohlcv=all_ohlcv, indicators=STRATEGY_INDICATOR_COLUMNS
+        )
         return df
 
     def _calculate_timeframe_duration_ms(self, timeframe: Timeframe) -> int:
@@ -4,48 +4,43 @@ from crypto_futures_bot.domain.enums import CandleStickEnum
 from crypto_futures_bot.domain.vo import SignalParametrizationItem
 from crypto_futures_bot.domain.vo.candlestick_indicators import CandleStickIndicators
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo import SymbolMarketConfig
+from crypto_futures_bot.infrastructure.services.indicators import get_entry_signals
 from crypto_futures_bot.infrastructure.services.orders_analytics_service import OrdersAnalyticsService
-from crypto_futures_bot.infrastructure.tasks.signals_task_service import SignalsTaskService
 
 
 class BotStrategy(Strategy):
     # These will be injected
-    signals_task_service: SignalsTaskService | None = None
     orders_analytics_service: OrdersAnalyticsService | None = None
     symbol_market_config: SymbolMarketConfig | None = None
     signal_parametrization: SignalParametrizationItem | None = None
     risk: float | None = None
 
     def init(self):
-        # Indicators are already computed in the dataframe passed to Backtest
-        pass
+        # Indicators are already computed in the dataframe passed to Backtest,
+        # so entry signals are evaluated at once, with the same kernel than the live signals task
+        self._long_entries, self._short_entries = get_entry_signals(
+            self.data.df, signal_parametrization_item=self.signal_parametrization
+        )
 
     def next(self):
         # Need at least 2 candles to compare PREV and LAST
         if len(self.data) < 2:
             return
 
-        prev_series = self.data.df.iloc[-2]
-        last_series = self.data.df.iloc[-1]
-
-        # 1. Define Standard Indicators
-        prev_candle = CandleStickIndicators.from_series(symbol="TEST", index=CandleStickEnum.PREV, series=prev_series)
-        last_candle = CandleStickIndicators.from_series(symbol="TEST", index=CandleStickEnum.LAST, series=last_series)
+        # 1. Check Signals
+        is_long_entry = bool(self._long_entries[len(self.data) - 1])
+        is_short_entry = bool(self._short_entries[len(self.data) - 1])
 
         current_price = self.data.Close[-1]
 
-        # 2. Check Signals
-        is_long_entry = self.signals_task_service._is_long_entry(
-            prev_candle, last_candle, signal_parametrization_item=self.signal_parametrization
-        )
-        is_short_entry = self.signals_task_service._is_short_entry(
-            prev_candle, last_candle, signal_parametrization_item=self.signal_parametrization
-        )
-
         # -----------------------------------------------------------
         # ENTRY LOGIC
         # -----------------------------------------------------------
         if not self.position and (is_long_entry or is_short_entry):
+            # 2. Define Standard Indicators
+            last_candle = CandleStickIndicators.from_series(
+                symbol="TEST", index=CandleStickEnum.LAST, series=self.data.df.iloc[-1]
+            )
             sl_pct = self.orders_analytics_service.get_stop_loss_percent_value(
                 entry_price=current_price,
                 last_candlestick_indicators=last_candle,
@@ -0,0 +1,60 @@
+import json
+from typing import Any
+
+from aiohttp import WSMsgType, web
+from aiohttp.test_utils import TestServer
+
+
+class FakeMEXCMarketStreamServer:
+    """
+    Local stand-in of the MEXC futures WebSocket, recording every subscription and pushing the given messages
+    """
+
+    def __init__(self) -> None:
+        app = web.Application()
+        app.router.add_get("/edge", self._handle_websocket)
+        self._server = TestServer(app)
+        self._websockets: list[web.WebSocketResponse] = []
+        self.subscriptions: list[dict[str, Any]] = []
+        self.connections = 0
+
+    @property
+    def url(self) -> str:
+        return str(self._server.make_url("/edge"))
+
+    async def start(self) -> None:
+        await self._server.start_server()
+
+    async def stop(self) -> None:
+        await self.drop_connections()
+        await self._server.close()
+
+    async def push(self, channel: str, data: dict[str, Any]) -> None:
+        for websocket in self._websockets:
+            await websocket.send_json({"channel": channel, "data": data, "symbol": data["symbol"]})
+
+    async def push_raw(self, message: str) -> None:
+        for websocket in self._websockets:
+            await websocket.send_str(message)
+
+    async def drop_connections(self) -> None:
+        for websocket in list(self._websockets):
+            await websocket.close()
+
+    async def _handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        self.connections += 1
+        self._websockets.append(websocket)
+        try:
+            async for message in websocket:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                payload = json.loads(message.data)
+                if payload["method"] == "ping":
+                    await websocket.send_json({"channel": "pong", "data": 0})
+                else:
+                    self.subscriptions.append(payload)
+        finally:
+            self._websockets.remove(websocket)
+        return websocket
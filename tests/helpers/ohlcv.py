@@ -0,0 +1,23 @@
+from typing import Any
+
+from faker import Faker
+
+from crypto_futures_bot.domain.types import Timeframe
+from crypto_futures_bot.domain.utils.timeframe_utils import get_timeframe_in_milliseconds
+
+
+def generate_ohlcv(
+    faker: Faker, *, size: int, start_timestamp: int = 1672531200000, timeframe: Timeframe = "15m"
+) -> list[list[Any]]:
+    """Generate a random walk of consistent OHLCV candles."""
+    timeframe_in_millis = get_timeframe_in_milliseconds(timeframe)
+    ohlcv = []
+    close = faker.pyfloat(min_value=100, max_value=200)
+    for i in range(size):
+        open_price = close
+        close = max(1.0, open_price * (1 + faker.pyfloat(min_value=-0.02, max_value=0.02)))
+        high = max(open_price, close) * (1 + faker.pyfloat(min_value=0, max_value=0.01))
+        low = min(open_price, close) * (1 - faker.pyfloat(min_value=0, max_value=0.01))
+        volume = faker.pyfloat(min_value=1000, max_value=5000)
+        ohlcv.append([start_timestamp + i * timeframe_in_millis, open_price, high, low, close, volume])
+    return ohlcv
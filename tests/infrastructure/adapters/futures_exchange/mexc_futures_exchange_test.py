@@ -0,0 +1,389 @@
+import asyncio
+import logging
+import time
+from copy import deepcopy
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from dependency_injector.containers import Container
+from faker import Faker
+
+from crypto_futures_bot.domain.enums import PositionOpenTypeEnum, PositionTypeEnum
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.impl.mexc_futures_exchange import (
+    MEXCFuturesExchangeService,
+)
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo import (
+    AccountInfo,
+    CreateMarketPositionOrder,
+    SymbolTicker,
+)
+from crypto_futures_bot.infrastructure.adapters.remote.dtos import MEXCPlaceOrderResponseDto
+from crypto_futures_bot.infrastructure.services.metrics_service import MetricsService
+from tests.helpers.constants import MOCK_CRYPTO_CURRENCIES, MOCK_SYMBOLS_USDT
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def should_serve_tickers_within_the_staleness_budget_from_a_single_fetch(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    mexc_futures_exchange_service: MEXCFuturesExchangeService = (
+        application_container.infrastructure_container().adapters_container()._mexc_futures_exchange_service()
+    )
+    first_symbol, second_symbol = faker.random_elements(MOCK_SYMBOLS_USDT, length=2, unique=True)
+
+    def _generate_raw_ticker(symbol: str) -> dict[str, Any]:
+        close = faker.pyfloat(min_value=1, max_value=100)
+        return {
+            "timestamp": faker.unix_time() * 1000,
+            "symbol": symbol,
+            "close": close,
+            "bid": close,
+            "ask": close,
+            "info": {"fairPrice": close},
+        }
+
+    mock_fetch_ticker = AsyncMock(side_effect=_generate_raw_ticker)
+    mock_fetch_tickers = AsyncMock(
+        side_effect=lambda symbols: {symbol: _generate_raw_ticker(symbol) for symbol in symbols}
+    )
+    futures_client = mexc_futures_exchange_service._futures_client
+    with (
+        patch.object(futures_client, "fetch_ticker", mock_fetch_ticker),
+        patch.object(futures_client, "fetch_tickers", mock_fetch_tickers),
+        patch.dict(mexc_futures_exchange_service._tickers_cache, clear=True),
+    ):
+        tickers = await mexc_futures_exchange_service.get_symbol_tickers(symbols=[first_symbol], max_age_ms=60_000)
+        assert [ticker.symbol for ticker in tickers] == [first_symbol]
+        mock_fetch_tickers.assert_called_once_with(symbols=[first_symbol])
+        # A missing ticker only fetches the requested symbol
+        second_ticker = await mexc_futures_exchange_service.get_symbol_ticker(second_symbol, max_age_ms=60_000)
+        mock_fetch_ticker.assert_called_once_with(second_symbol)
+        first_ticker = await mexc_futures_exchange_service.get_symbol_ticker(first_symbol, max_age_ms=60_000)
+        tickers = await mexc_futures_exchange_service.get_symbol_tickers(
+            symbols=[first_symbol, second_symbol], max_age_ms=60_000
+        )
+        assert tickers == [first_ticker, second_ticker]
+        assert (mock_fetch_tickers.call_count, mock_fetch_ticker.call_count) == (1, 1)
+
+        # Without any staleness budget, a fresh ticker is always fetched
+        fresh_ticker = await mexc_futures_exchange_service.get_symbol_ticker(first_symbol)
+        mock_fetch_ticker.assert_called_with(first_symbol)
+        assert await mexc_futures_exchange_service.get_symbol_ticker(first_symbol, max_age_ms=60_000) == fresh_ticker
+        assert (mock_fetch_tickers.call_count, mock_fetch_ticker.call_count) == (1, 2)
+
+        # Tickers of delisted symbols are dropped once the markets are refreshed
+        first_crypto_currency = first_symbol.split("/")[0]
+        symbol_market_configs = await mexc_futures_exchange_service._get_symbol_market_configs()
+        with patch.object(
+            mexc_futures_exchange_service,
+            "_load_symbol_market_configs",
+            AsyncMock(
+                return_value={
+                    crypto_currency: symbol_market_config
+                    for crypto_currency, symbol_market_config in symbol_market_configs.items()
+                    if crypto_currency != first_crypto_currency
+                }
+            ),
+        ):
+            await mexc_futures_exchange_service._refresh_symbol_market_configs()
+        assert first_symbol not in mexc_futures_exchange_service._tickers_cache
+        assert second_symbol in mexc_futures_exchange_service._tickers_cache
+
+
+@pytest.mark.asyncio
+async def should_refresh_the_symbol_market_configs_in_the_background_when_they_are_stale(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    mexc_futures_exchange_service: MEXCFuturesExchangeService = (
+        application_container.infrastructure_container().adapters_container()._mexc_futures_exchange_service()
+    )
+    futures_client = mexc_futures_exchange_service._futures_client
+    markets = await futures_client.fetch_swap_markets()
+    with (
+        patch.object(mexc_futures_exchange_service, "_symbol_market_configs", None),
+        patch.object(mexc_futures_exchange_service, "_symbol_market_configs_loaded_at", 0.0),
+    ):
+        crypto_currency = faker.random_element(await mexc_futures_exchange_service.get_crypto_currencies())
+        symbol_market_config = await mexc_futures_exchange_service.get_symbol_market_config(crypto_currency)
+        # Lookups are served from the pre-parsed index
+        assert await mexc_futures_exchange_service.get_symbol_market_config(crypto_currency) is symbol_market_config
+
+        delisted_markets = [market for market in markets if market.get("base") != crypto_currency]
+        with (
+            patch.object(futures_client, "fetch_swap_markets", AsyncMock(return_value=delisted_markets)),
+            patch.object(
+                mexc_futures_exchange_service._configuration_properties, "futures_markets_refresh_interval_seconds", -1
+            ),
+        ):
+            # Stale configs are served while they are refreshed in the background
+            assert await mexc_futures_exchange_service.get_symbol_market_config(crypto_currency) is symbol_market_config
+            await mexc_futures_exchange_service._symbol_market_configs_refresh_task
+            with pytest.raises(ValueError):
+                await mexc_futures_exchange_service.get_symbol_market_config(crypto_currency)
+            assert crypto_currency not in await mexc_futures_exchange_service.get_crypto_currencies()
+            # The client markets are refreshed along with the index
+            assert symbol_market_config.symbol not in futures_client.markets
+            await mexc_futures_exchange_service._symbol_market_configs_refresh_task
+
+
+@pytest.mark.asyncio
+async def should_restore_the_markets_from_the_snapshot_while_they_are_revalidated(
+    tmp_path: Path, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    adapters_container = application_container.infrastructure_container().adapters_container()
+    mexc_futures_exchange_service: MEXCFuturesExchangeService = adapters_container._mexc_futures_exchange_service()
+    configuration_properties = mexc_futures_exchange_service._configuration_properties
+    market_snapshot_path = tmp_path / "markets.json"
+    with patch.object(configuration_properties, "market_snapshot_path", str(market_snapshot_path)):
+        # The first boot loads the markets from the exchange and saves the snapshot
+        await mexc_futures_exchange_service.post_init()
+        assert market_snapshot_path.exists()
+        crypto_currencies = await mexc_futures_exchange_service.get_crypto_currencies()
+
+        restored_mexc_futures_exchange_service = MEXCFuturesExchangeService(
+            configuration_properties,
+            mexc_futures_exchange_service._mexc_remote_service,
+            mexc_futures_exchange_service._record_latency,
+        )
+        futures_client = restored_mexc_futures_exchange_service._futures_client
+        exchange_unblocked = asyncio.Event()
+
+        async def _blocked_fetch_markets(*args: Any, **kwargs: Any) -> list[dict[str, Any]]:
+            await exchange_unblocked.wait()
+            return list(futures_client.markets.values())
+
+        with patch.object(futures_client, "fetch_markets", AsyncMock(side_effect=_blocked_fetch_markets)):
+            # Startup does not wait for the exchange, markets are served from the snapshot meanwhile
+            await asyncio.wait_for(restored_mexc_futures_exchange_service.post_init(), timeout=1)
+            assert futures_client.markets.keys() == mexc_futures_exchange_service._futures_client.markets.keys()
+            assert await restored_mexc_futures_exchange_service.get_crypto_currencies() == crypto_currencies
+            crypto_currency, *_ = crypto_currencies
+            assert await restored_mexc_futures_exchange_service.get_symbol_market_config(
+                crypto_currency
+            ) == await mexc_futures_exchange_service.get_symbol_market_config(crypto_currency)
+
+            exchange_unblocked.set()
+            await restored_mexc_futures_exchange_service._markets_revalidation_task
+        assert await restored_mexc_futures_exchange_service.get_crypto_currencies() == crypto_currencies
+        await restored_mexc_futures_exchange_service._spot_client.close()
+        await futures_client.close()
+
+
+@pytest.mark.asyncio
+async def should_value_only_the_held_spot_assets_with_cached_prices(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    mexc_futures_exchange_service: MEXCFuturesExchangeService = (
+        application_container.infrastructure_container().adapters_container()._mexc_futures_exchange_service()
+    )
+    held_crypto_currency, empty_crypto_currency = faker.random_elements(MOCK_CRYPTO_CURRENCIES, length=2, unique=True)
+    spot_balances = {"total": {"USDT": 100.0, held_crypto_currency: 2.0, empty_crypto_currency: 0.0}}
+    price = faker.pyfloat(min_value=1, max_value=100)
+    mock_fetch_tickers = AsyncMock(side_effect=lambda symbols: {symbol: {"last": price} for symbol in symbols})
+    spot_client = mexc_futures_exchange_service._spot_client
+    with (
+        patch.object(spot_client, "fetch_balance", AsyncMock(side_effect=lambda: deepcopy(spot_balances))),
+        patch.object(spot_client, "fetch_tickers", mock_fetch_tickers),
+        patch.dict(mexc_futures_exchange_service._spot_prices_cache, clear=True),
+    ):
+        for _ in range(2):
+            spot_balance = await mexc_futures_exchange_service._get_spot_total_balance(
+                AccountInfo(currency_code="USDT")
+            )
+            assert spot_balance == pytest.approx(100.0 + 2.0 * price)
+        # Only the held assets are fetched, once within the staleness budget
+        mock_fetch_tickers.assert_awaited_once_with([f"{held_crypto_currency}/USDT"])
+
+
+@pytest.mark.asyncio
+async def should_fan_out_the_legs_of_composite_operations_within_a_shared_deadline(
+    test_environment: tuple[Container, ...],
+) -> None:
+    application_container, *_ = test_environment
+    mexc_futures_exchange_service: MEXCFuturesExchangeService = (
+        application_container.infrastructure_container().adapters_container()._mexc_futures_exchange_service()
+    )
+    latency_seconds = 0.2
+
+    def _with_latency(return_value: Any) -> AsyncMock:
+        async def _call(*args: Any, **kwargs: Any) -> Any:
+            await asyncio.sleep(latency_seconds)
+            return deepcopy(return_value)
+
+        return AsyncMock(side_effect=_call)
+
+    spot_client = mexc_futures_exchange_service._spot_client
+    futures_client = mexc_futures_exchange_service._futures_client
+    with (
+        # Fake exchange, where every leg takes the same latency
+        patch.object(spot_client, "fetch_balance", _with_latency({"total": {"USDT": 100.0}})),
+        patch.object(futures_client, "fetch_balance", _with_latency({"info": {"data": []}})),
+        patch.object(futures_client, "fetch_positions", _with_latency([])),
+        patch.object(futures_client, "request", _with_latency({"data": []})),
+    ):
+        for composite_operation in [
+            mexc_futures_exchange_service.get_portfolio_balance,
+            mexc_futures_exchange_service.get_open_positions,
+        ]:
+            started_at = time.perf_counter()
+            await composite_operation()
+            elapsed_seconds = time.perf_counter() - started_at
+            logger.info(f"{composite_operation.__name__} took {elapsed_seconds * 1000:.1f} ms")
+            # The latency is the slowest leg, instead of the sum of them
+            assert elapsed_seconds < 2 * latency_seconds
+
+        with patch.object(
+            mexc_futures_exchange_service._configuration_properties,
+            "composite_operation_timeout_seconds",
+            latency_seconds / 2,
+        ):
+            with pytest.raises(TimeoutError):
+                await mexc_futures_exchange_service.get_open_positions()
+
+
+@pytest.mark.asyncio
+async def should_take_account_snapshots_with_the_stop_orders_indexed_by_position(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    mexc_futures_exchange_service: MEXCFuturesExchangeService = (
+        application_container.infrastructure_container().adapters_container()._mexc_futures_exchange_service()
+    )
+    crypto_currencies = faker.random_elements(
+        await mexc_futures_exchange_service.get_crypto_currencies(), length=2, unique=True
+    )
+    raw_positions = [
+        {
+            "symbol": f"{crypto_currency}/USDT:USDT",
+            "info": {"positionId": position_id, "openType": 1, "totalFee": 0.1, "holdFee": -0.01},
+            "initialMargin": faker.pyfloat(positive=True),
+            "leverage": faker.pyint(min_value=1, max_value=20),
+            "liquidationPrice": faker.pyfloat(positive=True),
+            "side": "long",
+            "entryPrice": faker.pyfloat(positive=True),
+            "contracts": faker.pyint(min_value=1),
+            "contractSize": 0.001,
+        }
+        for position_id, crypto_currency in enumerate(crypto_currencies, start=1)
+    ]
+    first_stop_order = {"positionId": "1", "stopLossPrice": 90.0, "takeProfitPrice": 110.0}
+    raw_stop_orders = {"data": [first_stop_order, {"positionId": "1", "stopLossPrice": 80.0}]}
+    raw_futures_balances = {
+        "info": {"data": [{"currency": "USDT", "equity": 1000.0, "availableBalance": 750.0, "positionMargin": 250.0}]}
+    }
+    futures_client = mexc_futures_exchange_service._futures_client
+    with (
+        patch.object(futures_client, "fetch_positions", AsyncMock(return_value=raw_positions)),
+        patch.object(futures_client, "request", AsyncMock(return_value=raw_stop_orders)),
+        patch.object(futures_client, "fetch_balance", AsyncMock(return_value=raw_futures_balances)),
+    ):
+        account_snapshot = await mexc_futures_exchange_service.get_account_snapshot()
+        assert account_snapshot.futures_wallet.equity == 1000.0
+        assert account_snapshot.futures_wallet.available_balance == 750.0
+        assert account_snapshot.stop_orders_by_position_id == {"1": first_stop_order}
+        first_position, second_position = account_snapshot.positions
+        assert account_snapshot.get_position("1") == first_position
+        assert (first_position.stop_loss_price, first_position.take_profit_price) == (90.0, 110.0)
+        assert (second_position.stop_loss_price, second_position.take_profit_price) == (None, None)
+        # Every snapshot is newer than the previous one
+        assert (await mexc_futures_exchange_service.get_account_snapshot()).version > account_snapshot.version
+
+
+@pytest.mark.asyncio
+async def should_detect_market_order_fills_with_an_adaptive_poll(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    mexc_futures_exchange_service: MEXCFuturesExchangeService = (
+        application_container.infrastructure_container().adapters_container()._mexc_futures_exchange_service()
+    )
+    metrics_service: MetricsService = application_container.infrastructure_container().metrics_service()
+    metrics_service.clear()
+    position = MagicMock(symbol=faker.random_element(MOCK_SYMBOLS_USDT))
+    order_id, position_id = faker.uuid4(), faker.uuid4()
+    pending_order = {"status": "open", "info": {}}
+    filled_order = {"status": "closed", "info": {"positionId": position_id}}
+    mock_fetch_order = AsyncMock(side_effect=[pending_order, pending_order, filled_order])
+    futures_client = mexc_futures_exchange_service._futures_client
+    with patch.object(futures_client, "fetch_order", mock_fetch_order):
+        started_at = time.perf_counter()
+        assert await mexc_futures_exchange_service._get_filled_order(order_id, position=position) == filled_order
+        # Polled after 50 ms and 100 ms, instead of waiting 2 seconds every time
+        assert time.perf_counter() - started_at < 1.0
+        assert mock_fetch_order.await_count == 3
+    (latency_summary,) = metrics_service.get_latency_summaries()
+    assert (latency_summary.stage, latency_summary.count) == ("order_fill", 1)
+
+    with (
+        patch.object(futures_client, "fetch_order", AsyncMock(return_value=pending_order)),
+        patch.object(mexc_futures_exchange_service._configuration_properties, "order_fill_timeout_seconds", 0.2),
+    ):
+        with pytest.raises(ValueError, match="not filled"):
+            await mexc_futures_exchange_service._get_filled_order(order_id, position=position)
+
+
+@pytest.mark.asyncio
+async def should_build_the_opened_position_from_the_fill_and_reconcile_it_in_the_background(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    mexc_futures_exchange_service: MEXCFuturesExchangeService = (
+        application_container.infrastructure_container().adapters_container()._mexc_futures_exchange_service()
+    )
+    crypto_currency = faker.random_element(await mexc_futures_exchange_service.get_crypto_currencies())
+    symbol_market_config = await mexc_futures_exchange_service.get_symbol_market_config(crypto_currency)
+    position = CreateMarketPositionOrder(
+        symbol=f"{crypto_currency}/USDT:USDT",
+        initial_margin=100.0,
+        leverage=10,
+        open_type=PositionOpenTypeEnum.ISOLATED,
+        position_type=PositionTypeEnum.LONG,
+        stop_loss_price=90.0,
+        take_profit_price=110.0,
+    )
+    symbol_ticker = SymbolTicker(
+        timestamp=faker.unix_time() * 1000, symbol=position.symbol, close=100.0, mark_price=100.0
+    )
+    position_id = str(faker.pyint())
+    filled_order = {
+        "status": "closed",
+        "average": 100.5,
+        "filled": 25.0,
+        "fee": {"cost": 0.04},
+        "info": {"positionId": position_id, "leverage": 10},
+    }
+    mock_get_symbol_ticker = AsyncMock(return_value=symbol_ticker)
+    # Reconciliation failures, such as the composite deadline, are only logged
+    mock_get_open_positions = AsyncMock(side_effect=TimeoutError())
+    with (
+        patch.object(mexc_futures_exchange_service, "get_symbol_ticker", mock_get_symbol_ticker),
+        patch.object(
+            mexc_futures_exchange_service._mexc_remote_service,
+            "place_order",
+            AsyncMock(return_value=MEXCPlaceOrderResponseDto(order_id=faker.uuid4())),
+        ),
+        patch.object(
+            mexc_futures_exchange_service._futures_client, "fetch_order", AsyncMock(return_value=filled_order)
+        ),
+        patch.object(mexc_futures_exchange_service, "get_open_positions", mock_get_open_positions),
+    ):
+        opened_position = await mexc_futures_exchange_service.create_market_position_order(position)
+        # Orders are placed on a fresh ticker
+        mock_get_symbol_ticker.assert_awaited_once_with(symbol=position.symbol)
+        assert opened_position.position_id == position_id
+        assert (opened_position.entry_price, opened_position.contracts) == (100.5, 25.0)
+        assert opened_position.contract_size == symbol_market_config.contract_size
+        assert (opened_position.stop_loss_price, opened_position.take_profit_price) == (90.0, 110.0)
+        assert opened_position.liquidation_price < opened_position.entry_price
+        # Positions are only reloaded to reconcile the opened one, in the background
+        await asyncio.gather(*mexc_futures_exchange_service._position_reconciliation_tasks)
+        mock_get_open_positions.assert_awaited_once()
+        assert not mexc_futures_exchange_service._position_reconciliation_tasks
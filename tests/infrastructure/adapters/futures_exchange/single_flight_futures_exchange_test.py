@@ -0,0 +1,80 @@
+import asyncio
+import logging
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from dependency_injector.containers import Container
+from faker import Faker
+
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.impl.single_flight_futures_exchange import (
+    SingleFlightFuturesExchangeService,
+)
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo import SymbolTicker
+from tests.helpers.constants import MOCK_SYMBOLS_USDT
+from tests.helpers.ohlcv import generate_ohlcv
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def should_share_a_single_exchange_call_between_identical_calls_in_flight(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    futures_exchange_service: SingleFlightFuturesExchangeService = (
+        application_container.infrastructure_container().adapters_container().futures_exchange_service()
+    )
+    first_symbol, second_symbol = faker.random_elements(MOCK_SYMBOLS_USDT, length=2, unique=True)
+    ohlcv = generate_ohlcv(faker, size=10)
+    release_calls = asyncio.Event()
+
+    async def fetch_ohlcv_side_effect(*args, **kwargs):
+        await release_calls.wait()
+        return ohlcv
+
+    async def get_symbol_ticker_side_effect(symbol: str, **kwargs) -> SymbolTicker:
+        await release_calls.wait()
+        raise ValueError(f"Ticker of {symbol} not available")
+
+    mock_fetch_ohlcv = AsyncMock(side_effect=fetch_ohlcv_side_effect)
+    mock_get_symbol_ticker = AsyncMock(side_effect=get_symbol_ticker_side_effect)
+    delegate = futures_exchange_service._futures_exchange_service
+    with (
+        patch.object(delegate, "fetch_ohlcv", mock_fetch_ohlcv),
+        patch.object(delegate, "get_symbol_ticker", mock_get_symbol_ticker),
+        patch.dict(futures_exchange_service._saved_calls, clear=True),
+    ):
+        ohlcv_calls = [
+            asyncio.create_task(futures_exchange_service.fetch_ohlcv(first_symbol, timeframe="15m")),
+            asyncio.create_task(futures_exchange_service.fetch_ohlcv(first_symbol, timeframe="15m")),
+            asyncio.create_task(futures_exchange_service.fetch_ohlcv(first_symbol, timeframe="15m")),
+            # Different arguments lead to different calls
+            asyncio.create_task(futures_exchange_service.fetch_ohlcv(first_symbol, timeframe="1h")),
+            asyncio.create_task(futures_exchange_service.fetch_ohlcv(second_symbol, timeframe="15m")),
+        ]
+        ticker_calls = [asyncio.create_task(futures_exchange_service.get_symbol_ticker(first_symbol)) for _ in range(2)]
+        # A cancelled caller does not cancel the call shared with the rest
+        cancelled_call = asyncio.create_task(futures_exchange_service.fetch_ohlcv(first_symbol, timeframe="15m"))
+        await asyncio.sleep(0)
+        cancelled_call.cancel()
+        release_calls.set()
+
+        results = await asyncio.gather(*ohlcv_calls)
+        assert all(result == ohlcv for result in results)
+        assert results[0] is not results[1]
+        assert mock_fetch_ohlcv.call_count == 3
+        # Errors are propagated to every caller
+        for ticker_call in ticker_calls:
+            with pytest.raises(ValueError):
+                await ticker_call
+        mock_get_symbol_ticker.assert_called_once()
+        assert futures_exchange_service.get_saved_calls() == {"fetch_ohlcv": 3, "get_symbol_ticker": 1}
+
+        # Once completed, the next call goes to the exchange again
+        mock_get_symbol_ticker.side_effect = None
+        mock_get_symbol_ticker.return_value = SymbolTicker(
+            timestamp=int(datetime.now(UTC).timestamp() * 1000), symbol=first_symbol, close=faker.pyfloat()
+        )
+        await futures_exchange_service.get_symbol_ticker(first_symbol)
+        assert mock_get_symbol_ticker.call_count == 2
@@ -0,0 +1,187 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from dependency_injector.containers import Container
+from faker import Faker
+
+from crypto_futures_bot.domain.utils.timeframe_utils import get_candle_open_timestamp
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.base import AbstractFuturesExchangeService
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.impl.streaming_futures_exchange import (
+    StreamingFuturesExchangeService,
+)
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo import SymbolTicker
+from crypto_futures_bot.infrastructure.adapters.market_stream import mexc_market_stream
+from crypto_futures_bot.infrastructure.adapters.market_stream.market_data_store import MarketDataStore
+from crypto_futures_bot.infrastructure.adapters.market_stream.mexc_market_stream import MEXCMarketStreamService
+from tests.helpers.constants import MOCK_SYMBOLS_USDT
+from tests.helpers.fake_mexc_market_stream_server import FakeMEXCMarketStreamServer
+from tests.helpers.ohlcv import generate_ohlcv
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def should_serve_price_reads_from_the_market_stream_and_resubscribe_after_reconnecting(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    configuration_properties = application_container.configuration_properties()
+    symbol = faker.random_element(MOCK_SYMBOLS_USDT)
+    mexc_symbol = symbol.split(":")[0].replace("/", "_")
+    current_candle_timestamp = get_candle_open_timestamp("15m", int(datetime.now(UTC).timestamp() * 1000))
+    ohlcv = generate_ohlcv(faker, size=2, start_timestamp=current_candle_timestamp - 900_000)
+    futures_exchange_service = AsyncMock(spec=AbstractFuturesExchangeService)
+    futures_exchange_service.get_symbol_ticker.return_value = SymbolTicker(timestamp=0, symbol=symbol, close=1.0)
+    futures_exchange_service.fetch_ohlcv.return_value = ohlcv
+
+    fake_server = FakeMEXCMarketStreamServer()
+    await fake_server.start()
+    market_data_store = MarketDataStore()
+    market_stream_service = MEXCMarketStreamService(configuration_properties, market_data_store)
+    streaming_futures_exchange_service = StreamingFuturesExchangeService(
+        configuration_properties, futures_exchange_service, market_data_store, market_stream_service
+    )
+    with (
+        patch.object(configuration_properties, "market_stream_enabled", True),
+        patch.object(configuration_properties, "mexc_market_stream_url", fake_server.url),
+        patch.object(mexc_market_stream, "MARKET_STREAM_RECONNECT_MIN_DELAY_SECONDS", 0.01),
+    ):
+        try:
+            await streaming_futures_exchange_service.post_init()
+            await _wait_until(lambda: market_stream_service.is_connected)
+            # The first reads come from the REST API, subscribing the symbol
+            await streaming_futures_exchange_service.get_symbol_ticker(symbol)
+            await streaming_futures_exchange_service.fetch_ohlcv(symbol, timeframe="15m", limit=2, since=ohlcv[0][0])
+            await _wait_until(lambda: len(fake_server.subscriptions) == 2)
+            assert fake_server.subscriptions == [
+                {"method": "sub.ticker", "param": {"symbol": mexc_symbol}},
+                {"method": "sub.kline", "param": {"symbol": mexc_symbol, "interval": "Min15"}},
+            ]
+
+            await fake_server.push(
+                "push.ticker",
+                {
+                    "symbol": mexc_symbol,
+                    "lastPrice": 10.5,
+                    "bid1": 10.4,
+                    "ask1": 10.6,
+                    "fairPrice": 10.5,
+                    "timestamp": 1,
+                },
+            )
+            for candle in ohlcv:
+                timestamp, open_price, high, low, close, volume = candle
+                await fake_server.push(
+                    "push.kline",
+                    {"symbol": mexc_symbol, "interval": "Min15", "t": timestamp // 1000}
+                    | {"o": open_price, "h": high, "l": low, "c": close, "q": volume},
+                )
+            await _wait_until(
+                lambda: market_data_store.get_ohlcv(
+                    symbol, timeframe="15m", limit=2, since=ohlcv[0][0], max_age_seconds=5
+                )
+                is not None
+            )
+
+            # Following reads come from memory
+            symbol_ticker = await streaming_futures_exchange_service.get_symbol_ticker(symbol, max_age_ms=5_000)
+            streamed_ohlcv = await streaming_futures_exchange_service.fetch_ohlcv(
+                symbol, timeframe="15m", limit=2, since=ohlcv[0][0]
+            )
+            assert symbol_ticker == SymbolTicker(
+                timestamp=1, symbol=symbol, close=10.5, bid=10.4, ask=10.6, mark_price=10.5
+            )
+            assert streamed_ohlcv == ohlcv
+            futures_exchange_service.get_symbol_ticker.assert_called_once()
+            futures_exchange_service.fetch_ohlcv.assert_called_once()
+
+            # After reconnecting, the stored data is discarded and every subscription is sent again
+            await fake_server.drop_connections()
+            await _wait_until(lambda: len(fake_server.subscriptions) == 4)
+            assert fake_server.connections == 2
+            assert fake_server.subscriptions[2:] == fake_server.subscriptions[:2]
+            await streaming_futures_exchange_service.get_symbol_ticker(symbol, max_age_ms=5_000)
+            assert futures_exchange_service.get_symbol_ticker.call_count == 2
+        finally:
+            await market_stream_service.stop()
+            await fake_server.stop()
+
+
+@pytest.mark.asyncio
+async def should_only_serve_streamed_tickers_within_the_requested_max_age(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    configuration_properties = application_container.configuration_properties()
+    symbol = faker.random_element(MOCK_SYMBOLS_USDT)
+    fetched_ticker = SymbolTicker(timestamp=2, symbol=symbol, close=11.0)
+    streamed_ticker = SymbolTicker(timestamp=1, symbol=symbol, close=10.5)
+    futures_exchange_service = AsyncMock(spec=AbstractFuturesExchangeService)
+    futures_exchange_service.get_symbol_ticker.return_value = fetched_ticker
+    futures_exchange_service.get_symbol_tickers.return_value = [fetched_ticker]
+    market_data_store = MarketDataStore()
+    market_stream_service = AsyncMock(spec=MEXCMarketStreamService)
+    streaming_futures_exchange_service = StreamingFuturesExchangeService(
+        configuration_properties, futures_exchange_service, market_data_store, market_stream_service
+    )
+    with (
+        patch.object(configuration_properties, "market_stream_enabled", True),
+        patch.object(configuration_properties, "market_stream_max_age_seconds", 5),
+    ):
+        # XXX: Received 2 seconds ago, so it is still within the market stream max age
+        market_data_store._tickers[symbol] = (time.monotonic() - 2, streamed_ticker)
+        assert await streaming_futures_exchange_service.get_symbol_ticker(symbol, max_age_ms=5_000) == streamed_ticker
+        futures_exchange_service.get_symbol_ticker.assert_not_called()
+
+        # Stale for the requested max age, the ticker is fetched from the exchange
+        assert await streaming_futures_exchange_service.get_symbol_ticker(symbol, max_age_ms=1_000) == fetched_ticker
+        assert await streaming_futures_exchange_service.get_symbol_tickers(symbols=[symbol], max_age_ms=1_000) == [
+            fetched_ticker
+        ]
+        # No max age demands a fresh quote, so the streamed ticker is never served
+        assert await streaming_futures_exchange_service.get_symbol_ticker(symbol) == fetched_ticker
+        assert await streaming_futures_exchange_service.get_symbol_tickers(symbols=[symbol]) == [fetched_ticker]
+        assert futures_exchange_service.get_symbol_ticker.call_count == 2
+        assert futures_exchange_service.get_symbol_tickers.call_count == 2
+
+
+async def _wait_until(predicate: Callable[[], bool], *, timeout: float = 5.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def should_skip_malformed_market_stream_messages_and_keep_consuming(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    configuration_properties = application_container.configuration_properties()
+    symbol = faker.random_element(MOCK_SYMBOLS_USDT)
+    mexc_symbol = symbol.split(":")[0].replace("/", "_")
+
+    fake_server = FakeMEXCMarketStreamServer()
+    await fake_server.start()
+    market_data_store = MarketDataStore()
+    market_stream_service = MEXCMarketStreamService(configuration_properties, market_data_store)
+    with patch.object(configuration_properties, "mexc_market_stream_url", fake_server.url):
+        try:
+            market_stream_service.start()
+            await _wait_until(lambda: market_stream_service.is_connected)
+            await market_stream_service.subscribe_ticker(symbol)
+            # Invalid JSON, a missing field and no data at all
+            await fake_server.push_raw("{not json")
+            await fake_server.push("push.ticker", {"symbol": mexc_symbol, "timestamp": 1})
+            await fake_server.push_raw('{"channel": "push.kline", "data": null}')
+            await fake_server.push("push.ticker", {"symbol": mexc_symbol, "lastPrice": 10.5, "timestamp": 2})
+            await _wait_until(lambda: market_data_store.get_ticker(symbol, max_age_seconds=5) is not None)
+            assert market_data_store.get_ticker(symbol, max_age_seconds=5).close == 10.5
+            assert fake_server.connections == 1
+        finally:
+            await market_stream_service.stop()
+            await fake_server.stop()
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, patch
@@ -7,11 +8,14 @@ import pytest
 from dependency_injector.containers import Container
 from faker import Faker
 
+from crypto_futures_bot.domain.enums import CandleStickEnum
+from crypto_futures_bot.domain.utils.timeframe_utils import get_last_closed_candle_timestamp
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo.account_info import AccountInfo
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo.symbol_ticker import SymbolTicker
 from crypto_futures_bot.infrastructure.services.crypto_technical_analysis_service import CryptoTechnicalAnalysisService
 from crypto_futures_bot.infrastructure.services.tracked_crypto_currency_service import TrackedCryptoCurrencyService
-from tests.helpers.constants import MOCK_CRYPTO_CURRENCIES
+from tests.helpers.constants import MOCK_CRYPTO_CURRENCIES, MOCK_SYMBOLS_USDT
+from tests.helpers.ohlcv import generate_ohlcv
 
 logger = logging.getLogger(__name__)
 
@@ -126,3 +130,97 @@ async def should_get_candlestick_indicators_properly(faker: Faker, test_environm
         indicators = await crypto_technical_analysis_service.get_candlestick_indicators(symbol)
         assert indicators is not None
         assert indicators.symbol == symbol
+
+
+@pytest.mark.asyncio
+async def should_share_the_technical_analysis_within_the_same_closed_candle(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    crypto_technical_analysis_service: CryptoTechnicalAnalysisService = (
+        application_container.infrastructure_container().services_container().crypto_technical_analysis_service()
+    )
+    symbol = faker.random_element(MOCK_SYMBOLS_USDT)
+    # XXX: Up to date candles, where the last one is the forming candle
+    ohlcv = generate_ohlcv(
+        faker, size=100, start_timestamp=get_last_closed_candle_timestamp("15m", datetime.now(UTC)) - 98 * 900_000
+    )
+    mock_get_ohlcv = AsyncMock(return_value=ohlcv)
+    mock_get_ohlcv_by_timeframe = AsyncMock(return_value={"15m": ohlcv})
+
+    with (
+        patch.object(crypto_technical_analysis_service._ohlcv_buffer_service, "get_ohlcv", mock_get_ohlcv),
+        patch.object(
+            crypto_technical_analysis_service._ohlcv_buffer_service,
+            "get_ohlcv_by_timeframe",
+            mock_get_ohlcv_by_timeframe,
+        ),
+        patch.dict(crypto_technical_analysis_service._technical_analysis_cache, clear=True),
+    ):
+        technical_analysis_df_by_timeframe = (
+            await crypto_technical_analysis_service.get_technical_analysis_by_timeframe(symbol, timeframes=["15m"])
+        )
+        mock_get_ohlcv_by_timeframe.assert_called_once()
+        # Other consumers within the same candle reuse the very same frame
+        df = await crypto_technical_analysis_service.get_technical_analysis(symbol)
+        assert df is technical_analysis_df_by_timeframe["15m"]
+        last_candle = await crypto_technical_analysis_service.get_candlestick_indicators(
+            symbol, index=CandleStickEnum.LAST
+        )
+        assert int(last_candle.timestamp.timestamp() * 1000) == ohlcv[-2][0]
+        await crypto_technical_analysis_service.get_technical_analysis_by_timeframe(symbol, timeframes=["15m"])
+        mock_get_ohlcv.assert_not_called()
+        mock_get_ohlcv_by_timeframe.assert_called_once()
+
+        # Expired entries are calculated again
+        with patch.object(
+            crypto_technical_analysis_service._configuration_properties, "technical_analysis_cache_ttl_seconds", 0
+        ):
+            df = await crypto_technical_analysis_service.get_technical_analysis(symbol)
+            assert df is not technical_analysis_df_by_timeframe["15m"]
+            mock_get_ohlcv.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def should_get_the_technical_analysis_of_many_symbols_at_once(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    crypto_technical_analysis_service: CryptoTechnicalAnalysisService = (
+        application_container.infrastructure_container().services_container().crypto_technical_analysis_service()
+    )
+    failing_symbol, slow_symbol, *symbols = faker.random_elements(MOCK_SYMBOLS_USDT, length=5, unique=True)
+    ohlcv_by_symbol = {symbol: generate_ohlcv(faker, size=100) for symbol in symbols}
+    in_flight_calls, max_in_flight_calls = 0, 0
+
+    async def _get_ohlcv(symbol: str, **_) -> list[list]:
+        nonlocal in_flight_calls, max_in_flight_calls
+        if symbol == failing_symbol:
+            raise ValueError(f"No candles for {symbol}")
+        in_flight_calls += 1
+        max_in_flight_calls = max(max_in_flight_calls, in_flight_calls)
+        await asyncio.sleep(10 if symbol == slow_symbol else 0.01)
+        in_flight_calls -= 1
+        return ohlcv_by_symbol[symbol]
+
+    with (
+        patch.object(crypto_technical_analysis_service._ohlcv_buffer_service, "get_ohlcv", AsyncMock(wraps=_get_ohlcv)),
+        patch.object(
+            crypto_technical_analysis_service._configuration_properties, "technical_analysis_max_concurrency", 2
+        ),
+        patch.dict(crypto_technical_analysis_service._technical_analysis_cache, clear=True),
+    ):
+        crypto_technical_analysis_service._incremental_indicators.clear()
+        technical_analysis_by_symbol = await crypto_technical_analysis_service.get_technical_analysis_many(
+            dict.fromkeys([failing_symbol, slow_symbol, *symbols], ["15m"]), timeout=0.5
+        )
+        assert max_in_flight_calls == 2
+        # Symbols which fail or run out of time are mapped to their error, without aborting the rest of them
+        assert list(technical_analysis_by_symbol) == [failing_symbol, slow_symbol, *symbols]
+        assert isinstance(technical_analysis_by_symbol[failing_symbol], ValueError)
+        assert isinstance(technical_analysis_by_symbol[slow_symbol], TimeoutError)
+        for symbol in symbols:
+            df = technical_analysis_by_symbol[symbol]["15m"]
+            assert len(df) == len(CandleStickEnum)
+            expected_df = await crypto_technical_analysis_service.get_technical_analysis(symbol)
+            pd.testing.assert_frame_equal(df, expected_df)
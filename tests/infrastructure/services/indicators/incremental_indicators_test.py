@@ -0,0 +1,93 @@
+import logging
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from dependency_injector.containers import Container
+from faker import Faker
+
+from crypto_futures_bot.domain.enums import CandleStickEnum
+from crypto_futures_bot.infrastructure.services.crypto_technical_analysis_service import CryptoTechnicalAnalysisService
+from crypto_futures_bot.infrastructure.services.indicators import (
+    INDICATOR_COLUMNS,
+    OHLCV_COLUMNS,
+    IncrementalIndicators,
+)
+from crypto_futures_bot.scripts.benchmarks import calculate_indicators_with_ta
+from tests.helpers.constants import MOCK_SYMBOLS_USDT
+from tests.helpers.ohlcv import generate_ohlcv
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def should_match_ta_indicators_when_committing_candles_incrementally(faker: Faker) -> None:
+    ohlcv = generate_ohlcv(faker, size=300)
+    expected_df = calculate_indicators_with_ta(pd.DataFrame(ohlcv, columns=OHLCV_COLUMNS))
+
+    incremental_indicators = IncrementalIndicators()
+    rows = [incremental_indicators.commit(candle) for candle in ohlcv]
+    actual_df = pd.DataFrame(rows, columns=OHLCV_COLUMNS + INDICATOR_COLUMNS)
+
+    for column in INDICATOR_COLUMNS:
+        np.testing.assert_allclose(
+            actual_df[column].to_numpy(), expected_df[column].to_numpy(), rtol=1e-9, atol=1e-9, err_msg=column
+        )
+
+
+@pytest.mark.asyncio
+async def should_not_alter_committed_state_when_previewing_the_forming_candle(faker: Faker) -> None:
+    ohlcv = generate_ohlcv(faker, size=100)
+    *closed_ohlcv, forming_candle = ohlcv
+    restated_forming_candle = [*forming_candle[:4], forming_candle[4] * 1.01, forming_candle[5] * 2]
+
+    incremental_indicators = IncrementalIndicators()
+    for candle in closed_ohlcv:
+        incremental_indicators.commit(candle)
+    committed_rows = incremental_indicators.get_rows()
+
+    first_preview = incremental_indicators.preview(forming_candle)
+    incremental_indicators.preview(restated_forming_candle)
+
+    assert incremental_indicators.last_timestamp == closed_ohlcv[-1][0]
+    assert incremental_indicators.get_rows() == committed_rows
+    assert len(committed_rows) == len(CandleStickEnum) - 1
+    assert incremental_indicators.preview(forming_candle) == first_preview
+    assert incremental_indicators.commit(forming_candle) == first_preview
+
+
+@pytest.mark.asyncio
+async def should_match_ta_pipeline_when_getting_live_technical_analysis(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    crypto_technical_analysis_service: CryptoTechnicalAnalysisService = (
+        application_container.infrastructure_container().services_container().crypto_technical_analysis_service()
+    )
+    symbol = faker.random_element(MOCK_SYMBOLS_USDT)
+    ohlcv = generate_ohlcv(faker, size=262)
+    # XXX: The buffer slides forward two candles between both calls
+    buffered_ohlcv_list = [ohlcv[:260], ohlcv[2:]]
+
+    mock_get_ohlcv = AsyncMock(side_effect=buffered_ohlcv_list)
+    with patch.object(crypto_technical_analysis_service._ohlcv_buffer_service, "get_ohlcv", mock_get_ohlcv):
+        crypto_technical_analysis_service._incremental_indicators.clear()
+        for buffered_ohlcv in buffered_ohlcv_list:
+            df = await crypto_technical_analysis_service.get_technical_analysis(symbol)
+            # Same history as the one streamed into the incremental indicators
+            expected_df = await crypto_technical_analysis_service.get_technical_analysis(
+                symbol, ohlcv=ohlcv[: ohlcv.index(buffered_ohlcv[-1]) + 1]
+            )
+            assert len(df) == len(CandleStickEnum)
+            for index in CandleStickEnum:
+                actual = await crypto_technical_analysis_service.get_candlestick_indicators(
+                    symbol, index=index, technical_analysis_df=df
+                )
+                expected = await crypto_technical_analysis_service.get_candlestick_indicators(
+                    symbol, index=index, technical_analysis_df=expected_df
+                )
+                assert actual.timestamp == expected.timestamp
+                for column in INDICATOR_COLUMNS:
+                    if column != "volume_sma":
+                        assert getattr(actual, column) == pytest.approx(getattr(expected, column), rel=1e-9), column
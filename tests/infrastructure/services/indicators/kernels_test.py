@@ -0,0 +1,47 @@
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+from faker import Faker
+
+from crypto_futures_bot.infrastructure.services.indicators import INDICATOR_COLUMNS, OHLCV_COLUMNS
+from crypto_futures_bot.infrastructure.services.indicators.kernels import ewm
+from crypto_futures_bot.infrastructure.services.indicators.registry import calculate_indicators
+from crypto_futures_bot.scripts.benchmarks import calculate_indicators_with_kernels, calculate_indicators_with_ta
+from tests.helpers.ohlcv import generate_ohlcv
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [20, 60, 5_000])
+async def should_match_ta_indicators_when_calculating_with_kernels(faker: Faker, size: int) -> None:
+    df = pd.DataFrame(generate_ohlcv(faker, size=size), columns=OHLCV_COLUMNS)
+    expected_df = calculate_indicators_with_ta(df)
+
+    actual = calculate_indicators_with_kernels(df)
+
+    for column in INDICATOR_COLUMNS:
+        assert actual[column].dtype == np.float64
+        assert actual[column].flags.c_contiguous
+        np.testing.assert_allclose(actual[column], expected_df[column].to_numpy(), rtol=1e-9, atol=1e-9, err_msg=column)
+
+
+@pytest.mark.asyncio
+async def should_match_pandas_ewm_when_input_has_leading_nan_values(faker: Faker) -> None:
+    values = np.array([np.nan] * 5 + [faker.pyfloat(min_value=-10, max_value=10) for _ in range(3_000)])
+
+    actual = ewm(values, alpha=0.2, min_periods=9)
+
+    expected = pd.Series(values).ewm(alpha=0.2, min_periods=9, adjust=False).mean().to_numpy()
+    np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.asyncio
+async def should_return_nan_indicators_when_there_are_not_enough_candles() -> None:
+    empty = np.array([], dtype=np.float64)
+
+    indicators = calculate_indicators(high=empty, low=empty, close=empty, volume=empty)
+
+    assert all(values.size == 0 for values in indicators.values())
@@ -0,0 +1,56 @@
+import logging
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from faker import Faker
+
+from crypto_futures_bot.infrastructure.services.indicators import (
+    INDICATOR_COLUMNS,
+    OHLCV_COLUMNS,
+    STRATEGY_INDICATOR_COLUMNS,
+    registry,
+)
+from crypto_futures_bot.infrastructure.services.indicators.registry import (
+    calculate_indicators,
+    resolve_indicator_definitions,
+)
+from tests.helpers.ohlcv import generate_ohlcv
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def should_calculate_only_the_requested_indicators_and_their_dependencies(faker: Faker) -> None:
+    df = pd.DataFrame(generate_ohlcv(faker, size=300), columns=OHLCV_COLUMNS)
+    kwargs = {column.lower(): df[column].to_numpy(dtype=np.float64) for column in ["High", "Low", "Close", "Volume"]}
+    expected = calculate_indicators(**kwargs)
+
+    with (
+        patch.object(registry, "rsi", wraps=registry.rsi) as rsi_spy,
+        patch.object(registry, "relative_volume", wraps=registry.relative_volume) as relative_volume_spy,
+    ):
+        # XXX: The definitions look the kernels up in the registry module when they are calculated
+        actual = calculate_indicators(**kwargs, columns=STRATEGY_INDICATOR_COLUMNS)
+        rsi_spy.assert_called_once()
+        relative_volume_spy.assert_not_called()
+
+    # The RSI is calculated, as the Stochastic RSI depends on it
+    assert set(actual) == {"ema50", "macd_line", "macd_signal", "macd_hist", "atr", "rsi"} | {
+        "stoch_rsi",
+        "stoch_rsi_k",
+        "stoch_rsi_d",
+    }
+    assert list(actual) == [column for column in INDICATOR_COLUMNS if column in actual]
+    for column, values in actual.items():
+        np.testing.assert_array_equal(values, expected[column], err_msg=column)
+
+
+@pytest.mark.asyncio
+async def should_resolve_the_indicator_dependencies_first() -> None:
+    indicator_definitions = resolve_indicator_definitions(["stoch_rsi_k", "macd_hist", "stoch_rsi_d"])
+
+    assert [indicator_definition.name for indicator_definition in indicator_definitions] == ["rsi", "stoch_rsi", "macd"]
+    with pytest.raises(ValueError):
+        resolve_indicator_definitions(["unknown"])
@@ -0,0 +1,129 @@
+import logging
+from datetime import UTC, datetime
+
+import pandas as pd
+import pytest
+from faker import Faker
+
+from crypto_futures_bot.domain.enums import CandleStickEnum
+from crypto_futures_bot.domain.vo import SignalParametrizationItem
+from crypto_futures_bot.domain.vo.candlestick_indicators import CandleStickIndicators
+from crypto_futures_bot.infrastructure.services.indicators import (
+    OHLCV_COLUMNS,
+    evaluate_entry_signals,
+    get_entry_signals,
+    stack_candlestick_indicators,
+    stack_signal_parametrization_items,
+)
+from crypto_futures_bot.scripts.benchmarks import calculate_indicators_with_kernels
+from tests.helpers.ohlcv import generate_ohlcv
+
+logger = logging.getLogger(__name__)
+
+
+def _build_candle(
+    faker: Faker,
+    *,
+    index: CandleStickEnum,
+    closing_price: float,
+    ema50: float,
+    stoch_rsi_k: float,
+    stoch_rsi_d: float,
+    macd_hist: float,
+) -> CandleStickIndicators:
+    return CandleStickIndicators(
+        symbol=faker.pystr(),
+        timestamp=datetime.now(UTC),
+        index=index,
+        highest_price=faker.pyfloat(),
+        lowest_price=faker.pyfloat(),
+        opening_price=faker.pyfloat(),
+        closing_price=closing_price,
+        ema50=ema50,
+        macd_line=faker.pyfloat(),
+        macd_signal=faker.pyfloat(),
+        macd_hist=macd_hist,
+        stoch_rsi=faker.pyfloat(),
+        stoch_rsi_k=stoch_rsi_k,
+        stoch_rsi_d=stoch_rsi_d,
+        rsi=faker.pyfloat(),
+        atr=faker.pyfloat(),
+        relative_volume=faker.pyfloat(),
+    )
+
+
+@pytest.mark.asyncio
+async def should_evaluate_entry_signals_of_every_symbol_with_its_own_parametrization(faker: Faker) -> None:
+    long_prev, long_last = (
+        dict(closing_price=110, ema50=95, stoch_rsi_k=0.1, stoch_rsi_d=0.2),
+        dict(closing_price=112, ema50=96, stoch_rsi_k=0.3, stoch_rsi_d=0.2),
+    )
+    short_prev, short_last = (
+        dict(closing_price=90, ema50=95, stoch_rsi_k=0.95, stoch_rsi_d=0.9),
+        dict(closing_price=88, ema50=94, stoch_rsi_k=0.8, stoch_rsi_d=0.85),
+    )
+    # (prev candle, last candle, signal parametrization, expected long entry, expected short entry)
+    scenarios = [
+        (long_prev, {**long_last, "macd_hist": 1}, SignalParametrizationItem(crypto_currency="BTC"), True, False),
+        (short_prev, {**short_last, "macd_hist": -1}, SignalParametrizationItem(crypto_currency="ETH"), False, True),
+        # Same long setup, but not oversold enough for this parametrization
+        (
+            long_prev,
+            {**long_last, "macd_hist": 1},
+            SignalParametrizationItem(crypto_currency="SOL", long_entry_oversold_threshold=0.05),
+            False,
+            False,
+        ),
+        # Same long setup, but the previous candle does not confirm the trend
+        (
+            {**long_prev, "closing_price": 90},
+            {**long_last, "macd_hist": 1},
+            SignalParametrizationItem(crypto_currency="XRP", double_confirm_trend=True),
+            False,
+            False,
+        ),
+        (
+            {**long_prev, "closing_price": 90},
+            {**long_last, "macd_hist": 1},
+            SignalParametrizationItem(crypto_currency="ADA", double_confirm_trend=False),
+            True,
+            False,
+        ),
+    ]
+    prev_candles = [_build_candle(faker, index=CandleStickEnum.PREV, macd_hist=0, **prev) for prev, *_ in scenarios]
+    last_candles = [_build_candle(faker, index=CandleStickEnum.LAST, **last) for _, last, *_ in scenarios]
+
+    long_entry, short_entry = evaluate_entry_signals(
+        stack_candlestick_indicators(prev_candles),
+        stack_candlestick_indicators(last_candles),
+        **stack_signal_parametrization_items([item for _, _, item, *_ in scenarios]),
+    )
+
+    assert long_entry.tolist() == [expected_long for *_, expected_long, _ in scenarios]
+    assert short_entry.tolist() == [expected_short for *_, expected_short in scenarios]
+
+
+@pytest.mark.asyncio
+async def should_get_same_entry_signals_over_a_history_than_candle_by_candle(faker: Faker) -> None:
+    ohlcv = generate_ohlcv(faker, size=500)
+    signal_parametrization_item = SignalParametrizationItem(
+        crypto_currency="BTC", long_entry_oversold_threshold=0.4, short_entry_overbought_threshold=0.6
+    )
+    df = pd.DataFrame(ohlcv, columns=OHLCV_COLUMNS)
+    df = df.assign(**calculate_indicators_with_kernels(df))
+
+    long_entries, short_entries = get_entry_signals(df, signal_parametrization_item=signal_parametrization_item)
+
+    assert len(long_entries) == len(df) and not long_entries[0] and not short_entries[0]
+    for idx in range(1, len(df)):
+        prev_candle, last_candle = (
+            CandleStickIndicators.from_series(symbol="BTC", index=index, series=df.iloc[position])
+            for index, position in [(CandleStickEnum.PREV, idx - 1), (CandleStickEnum.LAST, idx)]
+        )
+        long_entry, short_entry = evaluate_entry_signals(
+            stack_candlestick_indicators([prev_candle]),
+            stack_candlestick_indicators([last_candle]),
+            **stack_signal_parametrization_items([signal_parametrization_item]),
+        )
+        assert long_entries[idx] == long_entry[0]
+        assert short_entries[idx] == short_entry[0]
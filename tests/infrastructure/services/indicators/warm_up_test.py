@@ -0,0 +1,31 @@
+import logging
+
+import pytest
+from faker import Faker
+
+from crypto_futures_bot.infrastructure.services.indicators.warm_up import (
+    get_ohlcv_warm_up_size,
+    get_warm_up_candles,
+    validate_warm_up,
+)
+from tests.helpers.ohlcv import generate_ohlcv
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("tolerance", [1e-3, 1e-4, 1e-6])
+async def should_converge_to_the_long_history_indicators_within_the_warm_up_size(
+    faker: Faker, tolerance: float
+) -> None:
+    ohlcv = generate_ohlcv(faker, size=2_000)
+    warm_up_size = get_ohlcv_warm_up_size(tolerance=tolerance)
+    logger.info(f"Warm-up candles for a tolerance of {tolerance}: {get_warm_up_candles(tolerance=tolerance)}")
+
+    errors = validate_warm_up(ohlcv, warm_up_size=warm_up_size)
+    assert all(error <= tolerance for error in errors.values()), errors
+
+    # A stricter tolerance needs a longer history, while a too short one does not converge
+    assert get_ohlcv_warm_up_size(tolerance=tolerance / 10) > warm_up_size
+    short_history_errors = validate_warm_up(ohlcv, warm_up_size=warm_up_size // 3)
+    assert any(error > tolerance for error in short_history_errors.values()), short_history_errors
@@ -116,7 +116,7 @@ async def should_store_market_signal_when_a_signals_evaluation_result_is_receive
         event_emitter.emit(SIGNALS_EVALUATION_RESULT_EVENT_NAME, signals_evaluation_result)
         await asyncio.sleep(0.1)
 
-        mock_get_trade_now_hints.assert_called_once_with(crypto_currency)
+        mock_get_trade_now_hints.assert_called_once_with(crypto_currency, timeframe=signals_evaluation_result.timeframe)
         market_signal_handler.assert_called_once()
 
         all_signals = await market_signal_service.find_all_market_signals(crypto_currency)
@@ -236,3 +236,106 @@ async def should_find_all_market_signals_properly(faker: Faker, test_environment
     # Find signals for a different timeframe
     other_timeframe_signals = await market_signal_service.find_all_market_signals(crypto_currency, timeframe="1h")
     assert len(other_timeframe_signals) == 0
+
+
+@pytest.mark.asyncio
+async def should_not_store_duplicated_market_signals(faker: Faker, test_environment: tuple[Container, ...]) -> None:
+    application_container, *_ = test_environment
+    market_signal_service: MarketSignalService = (
+        application_container.infrastructure_container().services_container().market_signal_service()
+    )
+    event_emitter: AsyncIOEventEmitter = application_container.infrastructure_container().event_emitter()
+    market_signal_service.configure()
+
+    currency_str = faker.random_element(MOCK_CRYPTO_CURRENCIES)
+    crypto_currency = TrackedCryptoCurrencyItem.from_currency(currency_str)
+    timestamp = datetime.now(UTC)
+    signals_evaluation_result = SignalsEvaluationResult(
+        crypto_currency=crypto_currency, timeframe="1h", timestamp=timestamp, long_entry=False, short_entry=True
+    )
+    mock_get_trade_now_hints = AsyncMock(return_value=_build_trade_now_hints(faker, currency_str))
+
+    market_signal_handler = Mock()
+    event_emitter.add_listener(MARKET_SIGNAL_EVENT_NAME, market_signal_handler)
+
+    with patch.object(market_signal_service._trade_now_service, "get_trade_now_hints", mock_get_trade_now_hints):
+        for _ in range(2):
+            event_emitter.emit(SIGNALS_EVALUATION_RESULT_EVENT_NAME, signals_evaluation_result)
+            await asyncio.sleep(0.1)
+
+        market_signal_handler.assert_called_once()
+        all_signals = await market_signal_service.find_all_market_signals(crypto_currency, timeframe="1h")
+        assert len(all_signals) == 1
+
+    # The index is warmed up again from the database
+    market_signal_service._market_signal_index = None
+    exists = await market_signal_service.exists_market_signal_by_timestamp(
+        timestamp=int(timestamp.timestamp() * 1000),
+        crypto_currency=crypto_currency,
+        position_type=PositionTypeEnum.SHORT,
+        timeframe="1h",
+    )
+    assert exists
+    # Even if the index misses it, the unique constraint prevents it from being stored twice
+    market_signal_service._market_signal_index.clear()
+    with patch.object(market_signal_service._trade_now_service, "get_trade_now_hints", mock_get_trade_now_hints):
+        event_emitter.emit(SIGNALS_EVALUATION_RESULT_EVENT_NAME, signals_evaluation_result)
+        await asyncio.sleep(0.1)
+
+        market_signal_handler.assert_called_once()
+        all_signals = await market_signal_service.find_all_market_signals(crypto_currency, timeframe="1h")
+        assert len(all_signals) == 1
+
+    event_emitter.remove_listener(MARKET_SIGNAL_EVENT_NAME, market_signal_handler)
+
+
+def _build_trade_now_hints(faker: Faker, currency_str: str) -> TradeNowHints:
+    position_hints_long, position_hints_short = (
+        PositionHints(
+            is_long=is_long,
+            is_safe=faker.pybool(),
+            margin=faker.pyfloat(),
+            leverage=faker.pyfloat(),
+            notional_size=faker.pyfloat(),
+            liquidation_price=faker.pyfloat(),
+            entry_price=faker.pyfloat(),
+            break_even_price=faker.pyfloat(),
+            stop_loss_price=faker.pyfloat(),
+            move_sl_to_break_even_price=faker.pyfloat(),
+            move_sl_to_first_target_profit_price=faker.pyfloat(),
+            take_profit_price=faker.pyfloat(),
+            potential_loss=faker.pyfloat(),
+            potential_profit=faker.pyfloat(),
+        )
+        for is_long in [True, False]
+    )
+    symbol_ticker = SymbolTicker(
+        timestamp=int(datetime.now(UTC).timestamp() * 1000), symbol=f"{currency_str}/USDT:USDT", close=faker.pyfloat()
+    )
+    candlestick_indicators = CandleStickIndicators(
+        symbol=f"{currency_str}/USDT:USDT",
+        timestamp=datetime.now(UTC),
+        index=CandleStickEnum.CURRENT,
+        highest_price=faker.pyfloat(),
+        lowest_price=faker.pyfloat(),
+        opening_price=faker.pyfloat(),
+        closing_price=faker.pyfloat(),
+        ema50=faker.pyfloat(),
+        macd_line=faker.pyfloat(),
+        macd_signal=faker.pyfloat(),
+        macd_hist=faker.pyfloat(),
+        stoch_rsi=faker.pyfloat(),
+        stoch_rsi_k=faker.pyfloat(),
+        stoch_rsi_d=faker.pyfloat(),
+        rsi=faker.pyfloat(),
+        atr=faker.pyfloat(),
+        relative_volume=faker.pyfloat(),
+    )
+    return TradeNowHints(
+        ticker=symbol_ticker,
+        candlestick_indicators=candlestick_indicators,
+        stop_loss_percent_value=faker.pyfloat(),
+        take_profit_percent_value=faker.pyfloat(),
+        long=position_hints_long,
+        short=position_hints_short,
+    )
@@ -0,0 +1,51 @@
+import logging
+
+import pytest
+from dependency_injector.containers import Container
+from faker import Faker
+
+from crypto_futures_bot.infrastructure.services.metrics_service import MetricsService
+from tests.helpers.constants import MOCK_SYMBOLS_USDT
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def should_summarize_latency_percentiles_per_stage_and_symbol(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    metrics_service: MetricsService = (
+        application_container.infrastructure_container().services_container().metrics_service()
+    )
+    first_symbol, second_symbol = faker.random_elements(MOCK_SYMBOLS_USDT, length=2, unique=True)
+    metrics_service.clear()
+
+    for elapsed_millis in range(1, 101):
+        metrics_service.record("ohlcv_fetch", elapsed_millis / 1000, symbol=first_symbol)
+    metrics_service.record("ohlcv_fetch", 0.5, symbol=second_symbol)
+    with pytest.raises(ValueError), metrics_service.span("indicators", symbol=first_symbol):
+        raise ValueError("Failed stages are measured as well")
+
+    overall_latency_summaries = metrics_service.get_latency_summaries()
+    assert [latency_summary.stage for latency_summary in overall_latency_summaries] == ["indicators", "ohlcv_fetch"]
+    ohlcv_fetch_latency_summary = overall_latency_summaries[1]
+    assert ohlcv_fetch_latency_summary.symbol is None
+    assert ohlcv_fetch_latency_summary.count == 101
+    assert ohlcv_fetch_latency_summary.max_ms == pytest.approx(500)
+
+    latency_summary_by_symbol = {
+        latency_summary.symbol: latency_summary
+        for latency_summary in metrics_service.get_latency_summaries(by_symbol=True)
+        if latency_summary.stage == "ohlcv_fetch"
+    }
+    first_symbol_latency_summary = latency_summary_by_symbol[first_symbol]
+    assert first_symbol_latency_summary.count == 100
+    assert first_symbol_latency_summary.p50_ms == pytest.approx(50.5)
+    assert first_symbol_latency_summary.p95_ms == pytest.approx(95.05)
+    assert first_symbol_latency_summary.p99_ms == pytest.approx(99.01)
+    assert latency_summary_by_symbol[second_symbol].p50_ms == pytest.approx(500)
+
+    rendered_latency_summaries = metrics_service.render_latency_summaries()
+    logger.info(rendered_latency_summaries)
+    assert f"ohlcv_fetch[{first_symbol}]: count=100" in rendered_latency_summaries
@@ -0,0 +1,177 @@
+import logging
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from dependency_injector.containers import Container
+from faker import Faker
+
+from crypto_futures_bot.constants import OHLCV_WARM_UP_VALIDATION_MULTIPLIER
+from crypto_futures_bot.domain.types import Timeframe
+from crypto_futures_bot.domain.utils.timeframe_utils import (
+    get_candle_open_timestamp,
+    get_timeframe_in_milliseconds,
+    resample_ohlcv,
+)
+from crypto_futures_bot.infrastructure.services.ohlcv_buffer_service import OHLCVBufferService
+from tests.helpers.constants import MOCK_SYMBOLS_USDT
+from tests.helpers.ohlcv import generate_ohlcv
+
+logger = logging.getLogger(__name__)
+
+
+def _generate_candle(faker: Faker, timestamp: int) -> list[Any]:
+    return [
+        timestamp,
+        faker.pyfloat(min_value=100, max_value=200),  # Open
+        faker.pyfloat(min_value=100, max_value=200),  # High
+        faker.pyfloat(min_value=100, max_value=200),  # Low
+        faker.pyfloat(min_value=100, max_value=200),  # Close
+        faker.pyfloat(min_value=1000, max_value=5000),  # Volume
+    ]
+
+
+@pytest.mark.asyncio
+async def should_seed_once_and_update_ohlcv_buffer_incrementally(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    ohlcv_buffer_service: OHLCVBufferService = (
+        application_container.infrastructure_container().services_container().ohlcv_buffer_service()
+    )
+    symbol = faker.random_element(MOCK_SYMBOLS_USDT)
+    timeframe_in_millis = get_timeframe_in_milliseconds("15m")
+    current_candle_timestamp = get_candle_open_timestamp("15m", int(datetime.now(UTC).timestamp() * 1000))
+    buffer_size = ohlcv_buffer_service.buffer_size
+    # Seeded buffer, whose forming candle has been closed in the meantime
+    seed_ohlcv = [
+        _generate_candle(faker, current_candle_timestamp - (buffer_size - i) * timeframe_in_millis)
+        for i in range(buffer_size)
+    ]
+    restated_candle = _generate_candle(faker, seed_ohlcv[-1][0])
+    new_candle = _generate_candle(faker, current_candle_timestamp)
+
+    mock_fetch_ohlcv = AsyncMock(side_effect=[seed_ohlcv, [restated_candle, new_candle]])
+    with patch.object(ohlcv_buffer_service._futures_exchange_service, "fetch_ohlcv", mock_fetch_ohlcv):
+        ohlcv_buffer_service.invalidate(symbol)
+
+        ohlcv = await ohlcv_buffer_service.get_ohlcv(symbol)
+        assert ohlcv == seed_ohlcv
+        mock_fetch_ohlcv.assert_called_once_with(symbol=symbol, timeframe="15m", limit=buffer_size)
+
+        ohlcv = await ohlcv_buffer_service.get_ohlcv(symbol)
+        assert len(ohlcv) == buffer_size
+        assert ohlcv[-2] == restated_candle
+        assert ohlcv[-1] == new_candle
+        assert ohlcv[0] == seed_ohlcv[1]
+        mock_fetch_ohlcv.assert_called_with(symbol=symbol, timeframe="15m", limit=2, since=seed_ohlcv[-1][0])
+
+
+@pytest.mark.asyncio
+async def should_reseed_ohlcv_buffer_when_a_gap_is_detected(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    ohlcv_buffer_service: OHLCVBufferService = (
+        application_container.infrastructure_container().services_container().ohlcv_buffer_service()
+    )
+    symbol = faker.random_element(MOCK_SYMBOLS_USDT)
+    timeframe_in_millis = get_timeframe_in_milliseconds("15m")
+    current_candle_timestamp = get_candle_open_timestamp("15m", int(datetime.now(UTC).timestamp() * 1000))
+    seed_ohlcv = [_generate_candle(faker, current_candle_timestamp - (11 - i) * timeframe_in_millis) for i in range(10)]
+    reseed_ohlcv = [
+        _generate_candle(faker, current_candle_timestamp - (9 - i) * timeframe_in_millis) for i in range(10)
+    ]
+    # Candles returned by the exchange skip the one right after the last stored candle
+    gapped_ohlcv = [_generate_candle(faker, current_candle_timestamp)]
+
+    mock_fetch_ohlcv = AsyncMock(side_effect=[seed_ohlcv, gapped_ohlcv, reseed_ohlcv])
+    with patch.object(ohlcv_buffer_service._futures_exchange_service, "fetch_ohlcv", mock_fetch_ohlcv):
+        ohlcv_buffer_service.invalidate(symbol)
+
+        await ohlcv_buffer_service.get_ohlcv(symbol)
+        ohlcv = await ohlcv_buffer_service.get_ohlcv(symbol)
+
+        assert ohlcv == reseed_ohlcv
+        assert mock_fetch_ohlcv.call_count == 3
+
+
+@pytest.mark.asyncio
+async def should_resample_higher_timeframes_from_a_single_base_stream(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    ohlcv_buffer_service: OHLCVBufferService = (
+        application_container.infrastructure_container().services_container().ohlcv_buffer_service()
+    )
+    symbol = faker.random_element(MOCK_SYMBOLS_USDT)
+    timeframes: list[Timeframe] = ["5m", "15m", "1h"]
+
+    async def fetch_ohlcv_side_effect(
+        symbol: str, *, timeframe: Timeframe, limit: int, since: int | None = None
+    ) -> list[list[Any]]:
+        timeframe_in_millis = get_timeframe_in_milliseconds(timeframe)
+        current_candle_timestamp = get_candle_open_timestamp(timeframe, int(datetime.now(UTC).timestamp() * 1000))
+        start = since if since is not None else current_candle_timestamp - (limit - 1) * timeframe_in_millis
+        return [
+            _generate_candle(faker, timestamp)
+            for timestamp in range(start, current_candle_timestamp + 1, timeframe_in_millis)
+        ][:limit]
+
+    mock_fetch_ohlcv = AsyncMock(side_effect=fetch_ohlcv_side_effect)
+    with patch.object(ohlcv_buffer_service._futures_exchange_service, "fetch_ohlcv", mock_fetch_ohlcv):
+        for timeframe in timeframes:
+            ohlcv_buffer_service.invalidate(symbol, timeframe=timeframe)
+
+        # Every timeframe is seeded once
+        await ohlcv_buffer_service.get_ohlcv_by_timeframe(symbol, timeframes=timeframes)
+        assert mock_fetch_ohlcv.call_count == len(timeframes)
+
+        # After that, a single fetch per symbol, whatever the number of timeframes
+        mock_fetch_ohlcv.reset_mock()
+        ohlcv_by_timeframe = await ohlcv_buffer_service.get_ohlcv_by_timeframe(symbol, timeframes=timeframes)
+        mock_fetch_ohlcv.assert_called_once()
+        assert mock_fetch_ohlcv.call_args.kwargs["timeframe"] == "5m"
+
+        base_ohlcv = ohlcv_by_timeframe["5m"]
+        for timeframe in ["15m", "1h"]:
+            ohlcv = ohlcv_by_timeframe[timeframe]
+            assert len(ohlcv) == ohlcv_buffer_service.buffer_size
+            (expected_forming_candle,) = resample_ohlcv(
+                [candle for candle in base_ohlcv if candle[0] >= ohlcv[-1][0]], timeframe=timeframe
+            )
+            assert ohlcv[-1] == expected_forming_candle
+
+
+@pytest.mark.asyncio
+async def should_validate_the_warm_up_against_a_long_history_when_seeding(
+    faker: Faker, test_environment: tuple[Container, ...], caplog: pytest.LogCaptureFixture
+) -> None:
+    application_container, *_ = test_environment
+    ohlcv_buffer_service: OHLCVBufferService = (
+        application_container.infrastructure_container().services_container().ohlcv_buffer_service()
+    )
+    symbol = faker.random_element(MOCK_SYMBOLS_USDT)
+    buffer_size = ohlcv_buffer_service.buffer_size
+    current_candle_timestamp = get_candle_open_timestamp("15m", int(datetime.now(UTC).timestamp() * 1000))
+    long_ohlcv = generate_ohlcv(faker, size=buffer_size * OHLCV_WARM_UP_VALIDATION_MULTIPLIER, timeframe="15m")
+    # XXX: Up to date candles, where the last one is the forming candle
+    offset = current_candle_timestamp - long_ohlcv[-1][0]
+    long_ohlcv = [[candle[0] + offset, *candle[1:]] for candle in long_ohlcv]
+
+    mock_fetch_ohlcv = AsyncMock(return_value=long_ohlcv)
+    with (
+        patch.object(ohlcv_buffer_service._configuration_properties, "ohlcv_warm_up_validation_enabled", True),
+        patch.object(ohlcv_buffer_service._futures_exchange_service, "fetch_ohlcv", mock_fetch_ohlcv),
+        caplog.at_level(logging.INFO),
+    ):
+        ohlcv_buffer_service.invalidate(symbol)
+        ohlcv = await ohlcv_buffer_service.get_ohlcv(symbol)
+
+        mock_fetch_ohlcv.assert_called_once_with(
+            symbol=symbol, timeframe="15m", limit=buffer_size * OHLCV_WARM_UP_VALIDATION_MULTIPLIER
+        )
+        # Only the minimum history is kept
+        assert ohlcv == long_ohlcv[-buffer_size:]
+        assert f"converged within {buffer_size} candles" in caplog.text
@@ -0,0 +1,66 @@
+import logging
+
+import pytest
+from dependency_injector.containers import Container
+from faker import Faker
+
+from crypto_futures_bot.domain.enums import PushNotificationTypeEnum
+from crypto_futures_bot.domain.vo import SignalParametrizationItem
+from crypto_futures_bot.infrastructure.services.auto_trader_crypto_currency_service import (
+    AutoTraderCryptoCurrencyService,
+)
+from crypto_futures_bot.infrastructure.services.push_notification_service import PushNotificationService
+from crypto_futures_bot.infrastructure.services.risk_management_service import RiskManagementService
+from crypto_futures_bot.infrastructure.services.signal_parametrization_service import SignalParametrizationService
+from crypto_futures_bot.infrastructure.services.signals_run_context_service import SignalsRunContextService
+from crypto_futures_bot.infrastructure.services.tracked_crypto_currency_service import TrackedCryptoCurrencyService
+from tests.helpers.constants import MOCK_CRYPTO_CURRENCIES
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio
+async def should_load_signals_run_context_properly(faker: Faker, test_environment: tuple[Container, ...]) -> None:
+    application_container, *_ = test_environment
+    services_container = application_container.infrastructure_container().services_container()
+    signals_run_context_service: SignalsRunContextService = services_container.signals_run_context_service()
+    tracked_crypto_currency_service: TrackedCryptoCurrencyService = services_container.tracked_crypto_currency_service()
+    signal_parametrization_service: SignalParametrizationService = services_container.signal_parametrization_service()
+    auto_trader_crypto_currency_service: AutoTraderCryptoCurrencyService = (
+        services_container.auto_trader_crypto_currency_service()
+    )
+    risk_management_service: RiskManagementService = services_container.risk_management_service()
+    push_notification_service: PushNotificationService = services_container.push_notification_service()
+
+    crypto_currency, non_parametrized_crypto_currency, *_ = faker.random_sample(MOCK_CRYPTO_CURRENCIES, length=2)
+    await tracked_crypto_currency_service.add(crypto_currency)
+    signal_parametrization_item = SignalParametrizationItem(
+        crypto_currency=crypto_currency,
+        atr_sl_mult=faker.pyfloat(min_value=1, max_value=3, right_digits=1),
+        atr_tp_mult=faker.pyfloat(min_value=1, max_value=5, right_digits=1),
+        double_confirm_trend=faker.pybool(),
+    )
+    await signal_parametrization_service.save_or_update(signal_parametrization_item)
+
+    signals_run_context = await signals_run_context_service.load()
+
+    assert signals_run_context.tracked_crypto_currencies == await tracked_crypto_currency_service.find_all()
+    assert signals_run_context.get_signal_parametrization_item(crypto_currency) == signal_parametrization_item
+    assert signals_run_context.risk_management == await risk_management_service.get()
+    assert signals_run_context.signals_chat_ids == list(
+        await push_notification_service.get_actived_subscription_by_type(
+            notification_type=PushNotificationTypeEnum.SIGNALS
+        )
+    )
+    assert signals_run_context.auto_trader_crypto_currencies == await auto_trader_crypto_currency_service.find_all()
+    assert signals_run_context.num_tracked_crypto_currencies == await tracked_crypto_currency_service.count()
+    assert (
+        signals_run_context.num_auto_trader_enabled_crypto_currencies
+        == await auto_trader_crypto_currency_service.count_enabled()
+    )
+    if non_parametrized_crypto_currency not in signals_run_context.signal_parametrization_items:
+        assert signals_run_context.get_signal_parametrization_item(
+            non_parametrized_crypto_currency
+        ) == SignalParametrizationItem(crypto_currency=non_parametrized_crypto_currency)
+
+    await tracked_crypto_currency_service.remove(crypto_currency)
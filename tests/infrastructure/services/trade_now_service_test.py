@@ -22,8 +22,8 @@ from crypto_futures_bot.domain.vo import (
     TradeNowHints,
 )
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo.account_info import AccountInfo
+from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo.account_snapshot import AccountSnapshot
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo.futures_wallet import FuturesWallet
-from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo.portfolio_balance import PortfolioBalance
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo.position import Position
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo.symbol_market_config import SymbolMarketConfig
 from crypto_futures_bot.infrastructure.adapters.futures_exchange.vo.symbol_ticker import SymbolTicker
@@ -33,6 +33,23 @@ from tests.helpers.constants import MOCK_CRYPTO_CURRENCIES
 logger = logging.getLogger(__name__)
 
 
+def _generate_account_snapshot(faker: Faker) -> AccountSnapshot:
+    return AccountSnapshot(
+        version=1,
+        timestamp=int(datetime.now(UTC).timestamp() * 1000),
+        futures_wallet=FuturesWallet(
+            currency="USDT",
+            equity=faker.pyfloat(),
+            position_margin=faker.pyfloat(),
+            available_balance=faker.pyfloat(),
+            cash_balance=faker.pyfloat(),
+            unrealized_pnl=faker.pyfloat(),
+        ),
+        positions=[],
+        stop_orders_by_position_id={},
+    )
+
+
 @pytest.mark.asyncio
 async def should_get_trade_now_hints_properly(faker: Faker, test_environment: tuple[Container, ...]) -> None:
     application_container, *_ = test_environment
@@ -44,10 +61,9 @@ async def should_get_trade_now_hints_properly(faker: Faker, test_environment: tu
     symbol = f"{currency}/USDT:USDT"
     tracked_currency = TrackedCryptoCurrencyItem.from_currency(currency)
     account_info = AccountInfo(currency_code="USDT")
-    portfolio_balance = PortfolioBalance(spot_balance=1000.0, futures_balance=500.0, currency_code="USDT")
     futures_wallet = FuturesWallet(
         currency="USDT",
-        equity=faker.pyfloat(),
+        equity=500.0,
         position_margin=faker.pyfloat(),
         available_balance=250.0,
         cash_balance=faker.pyfloat(),
@@ -78,15 +94,12 @@ async def should_get_trade_now_hints_properly(faker: Faker, test_environment: tu
         relative_volume=faker.pyfloat(),
     )
 
+    mock_get_portfolio_balance = AsyncMock()
     with (
         patch.object(
             trade_now_service._futures_exchange_service, "get_account_info", AsyncMock(return_value=account_info)
         ),
-        patch.object(
-            trade_now_service._futures_exchange_service,
-            "get_portfolio_balance",
-            AsyncMock(return_value=portfolio_balance),
-        ),
+        patch.object(trade_now_service._futures_exchange_service, "get_portfolio_balance", mock_get_portfolio_balance),
         patch.object(
             trade_now_service._futures_exchange_service, "get_futures_wallet", AsyncMock(return_value=futures_wallet)
         ),
@@ -116,6 +129,96 @@ async def should_get_trade_now_hints_properly(faker: Faker, test_environment: tu
         assert isinstance(hints, TradeNowHints)
         assert hints.long is not None
         assert hints.short is not None
+        # Sizing does not value the spot holdings
+        mock_get_portfolio_balance.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def should_get_trade_now_hints_from_the_candles_of_the_signal_timeframe(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    trade_now_service: TradeNowService = (
+        application_container.infrastructure_container().services_container().trade_now_service()
+    )
+
+    currency = faker.random_element(MOCK_CRYPTO_CURRENCIES)
+    symbol = f"{currency}/USDT:USDT"
+    tracked_currency = TrackedCryptoCurrencyItem.from_currency(currency)
+    futures_wallet = FuturesWallet(
+        currency="USDT",
+        equity=500.0,
+        position_margin=faker.pyfloat(),
+        available_balance=250.0,
+        cash_balance=faker.pyfloat(),
+        unrealized_pnl=faker.pyfloat(),
+    )
+    ticker = SymbolTicker(timestamp=int(datetime.now(UTC).timestamp() * 1000), symbol=symbol, close=100.0)
+    market_config = SymbolMarketConfig(
+        symbol=symbol, price_precision=2, amount_precision=3, contract_size=0.001, max_leverage=300
+    )
+
+    def get_candlestick_indicators_side_effect(symbol: str, *, timeframe: str = "15m") -> CandleStickIndicators:
+        # XXX: ATR of the 1h candles is much wider than the one of the 15m candles
+        return CandleStickIndicators(
+            symbol=symbol,
+            timestamp=datetime.now(UTC),
+            index=CandleStickEnum.LAST,
+            highest_price=faker.pyfloat(),
+            lowest_price=faker.pyfloat(),
+            opening_price=faker.pyfloat(),
+            closing_price=100.0,
+            ema50=faker.pyfloat(),
+            macd_line=faker.pyfloat(),
+            macd_signal=faker.pyfloat(),
+            macd_hist=faker.pyfloat(),
+            stoch_rsi=faker.pyfloat(),
+            stoch_rsi_k=faker.pyfloat(),
+            stoch_rsi_d=faker.pyfloat(),
+            rsi=faker.pyfloat(),
+            atr=4.0 if timeframe == "1h" else 1.0,
+            relative_volume=faker.pyfloat(),
+        )
+
+    mock_get_candlestick_indicators = AsyncMock(side_effect=get_candlestick_indicators_side_effect)
+    with (
+        patch.object(
+            trade_now_service._futures_exchange_service,
+            "get_account_info",
+            AsyncMock(return_value=AccountInfo(currency_code="USDT")),
+        ),
+        patch.object(
+            trade_now_service._futures_exchange_service, "get_futures_wallet", AsyncMock(return_value=futures_wallet)
+        ),
+        patch.object(trade_now_service._futures_exchange_service, "get_symbol_ticker", AsyncMock(return_value=ticker)),
+        patch.object(
+            trade_now_service._futures_exchange_service,
+            "get_symbol_market_config",
+            AsyncMock(return_value=market_config),
+        ),
+        patch.object(
+            trade_now_service._crypto_technical_analysis_service,
+            "get_candlestick_indicators",
+            mock_get_candlestick_indicators,
+        ),
+        patch.object(trade_now_service._tracked_crypto_currency_service, "count", AsyncMock(return_value=1)),
+        patch.object(
+            trade_now_service._auto_trader_crypto_currency_service, "count_enabled", AsyncMock(return_value=0)
+        ),
+        patch.object(trade_now_service._risk_management_service, "get", AsyncMock(return_value=RiskManagementItem())),
+    ):
+        signal_parametrization_item = SignalParametrizationItem(crypto_currency=currency)
+        hourly_hints = await trade_now_service.get_trade_now_hints(
+            tracked_currency, timeframe="1h", signal_parametrization_item=signal_parametrization_item
+        )
+        mock_get_candlestick_indicators.assert_awaited_once_with(symbol=symbol, timeframe="1h")
+        assert hourly_hints.candlestick_indicators.atr == 4.0
+        default_hints = await trade_now_service.get_trade_now_hints(
+            tracked_currency, signal_parametrization_item=signal_parametrization_item
+        )
+        # Stop loss and take profit are derived from the ATR of the signal timeframe
+        assert hourly_hints.stop_loss_percent_value > default_hints.stop_loss_percent_value
+        assert hourly_hints.take_profit_percent_value > default_hints.take_profit_percent_value
 
 
 @pytest.mark.asyncio
@@ -128,6 +231,9 @@ async def should_open_position_successfully(faker: Faker, test_environment: tupl
     currency = faker.random_element(MOCK_CRYPTO_CURRENCIES)
     symbol = f"{currency}/USDT:USDT"
     tracked_currency = TrackedCryptoCurrencyItem.from_currency(currency)
+    market_config = SymbolMarketConfig(
+        symbol=symbol, price_precision=2, amount_precision=3, contract_size=0.001, max_leverage=300
+    )
     position_hints = PositionHints(
         is_long=True,
         is_safe=faker.pybool(),
@@ -187,6 +293,11 @@ async def should_open_position_successfully(faker: Faker, test_environment: tupl
     )
 
     with (
+        patch.object(
+            trade_now_service._futures_exchange_service,
+            "get_account_snapshot",
+            AsyncMock(return_value=_generate_account_snapshot(faker)),
+        ),
         patch.object(
             trade_now_service._orders_analytics_service, "get_open_position_metrics", AsyncMock(return_value=[])
         ),
@@ -196,7 +307,11 @@ async def should_open_position_successfully(faker: Faker, test_environment: tupl
             "create_market_position_order",
             AsyncMock(return_value=opened_position),
         ),
-        patch.object(trade_now_service._orders_analytics_service, "get_metrics_by_position_id", AsyncMock()),
+        patch.object(
+            trade_now_service._futures_exchange_service,
+            "get_symbol_market_config",
+            AsyncMock(return_value=market_config),
+        ),
         patch.object(
             trade_now_service._futures_exchange_service,
             "get_account_info",
@@ -205,6 +320,9 @@ async def should_open_position_successfully(faker: Faker, test_environment: tupl
     ):
         result = await trade_now_service.open_position(tracked_currency, PositionTypeEnum.LONG)
         assert result.result_type == OpenPositionResultTypeEnum.SUCCESS
+        assert result.position_metrics.position == opened_position
+        # Metrics are priced at the fill, not at the ticker read before placing the order
+        assert result.position_metrics.ticker.mark_price == opened_position.entry_price
 
 
 @pytest.mark.asyncio
@@ -239,6 +357,11 @@ async def should_not_open_position_if_already_open(faker: Faker, test_environmen
     existing_metrics = PositionMetrics(position=existing_position, symbol_market_config=market_config, ticker=ticker)
 
     with (
+        patch.object(
+            trade_now_service._futures_exchange_service,
+            "get_account_snapshot",
+            AsyncMock(return_value=_generate_account_snapshot(faker)),
+        ),
         patch.object(
             trade_now_service._orders_analytics_service,
             "get_open_position_metrics",
@@ -310,6 +433,11 @@ async def should_not_open_position_if_no_funds(faker: Faker, test_environment: t
     )
 
     with (
+        patch.object(
+            trade_now_service._futures_exchange_service,
+            "get_account_snapshot",
+            AsyncMock(return_value=_generate_account_snapshot(faker)),
+        ),
         patch.object(
             trade_now_service._orders_analytics_service, "get_open_position_metrics", AsyncMock(return_value=[])
         ),
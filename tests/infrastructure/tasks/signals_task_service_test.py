@@ -1,20 +1,30 @@
 import asyncio
 import logging
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
 import pandas as pd
 import pytest
+from apscheduler.events import (
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_MISSED,
+    EVENT_JOB_SUBMITTED,
+    JobExecutionEvent,
+    JobSubmissionEvent,
+)
 from dependency_injector.containers import Container
 from faker import Faker
 from pyee.asyncio import AsyncIOEventEmitter
 
 from crypto_futures_bot.constants import SIGNALS_EVALUATION_RESULT_EVENT_NAME
-from crypto_futures_bot.domain.enums import CandleStickEnum, PushNotificationTypeEnum
+from crypto_futures_bot.domain.enums import CandleStickEnum
+from crypto_futures_bot.domain.types import Timeframe
 from crypto_futures_bot.domain.vo import (
     CandleStickIndicators,
     PositionHints,
     SignalParametrizationItem,
+    SignalsRunContext,
+    TaskRunStats,
     TrackedCryptoCurrencyItem,
     TradeNowHints,
 )
@@ -106,9 +116,13 @@ async def should_evaluate_signals_and_emit_event_when_entry_signal_is_found(
 
     # Mock services
     mock_get_account_info = AsyncMock(return_value=account_info)
-    mock_find_all_tracked = AsyncMock(return_value=[tracked_currency])
-    mock_find_params = AsyncMock(return_value=signal_params)
-    mock_get_ta = AsyncMock(return_value=ta_df)
+    signals_run_context = SignalsRunContext(
+        tracked_crypto_currencies=[tracked_currency],
+        signal_parametrization_items={currency: signal_params},
+        signals_chat_ids=["chat123"],
+    )
+    mock_load_signals_run_context = AsyncMock(return_value=signals_run_context)
+    mock_get_ta = AsyncMock(return_value={"15m": ta_df})
 
     def get_candle_side_effect(symbol, index, technical_analysis_df=None):
         if index == CandleStickEnum.PREV:
@@ -117,7 +131,6 @@ async def should_evaluate_signals_and_emit_event_when_entry_signal_is_found(
 
     mock_get_candle = AsyncMock(side_effect=get_candle_side_effect)
 
-    mock_get_active_subscriptions = AsyncMock(return_value=["chat123"])
     mock_exists_market_signal = AsyncMock(return_value=False)
     mock_get_symbol_ticker = AsyncMock(return_value=Mock(spec=SymbolTicker))
     mock_get_trade_now_hints = AsyncMock(return_value=trade_now_hints)
@@ -128,16 +141,12 @@ async def should_evaluate_signals_and_emit_event_when_entry_signal_is_found(
 
     with (
         patch.object(signals_task_service._futures_exchange_service, "get_account_info", mock_get_account_info),
-        patch.object(signals_task_service._tracked_crypto_currency_service, "find_all", mock_find_all_tracked),
-        patch.object(signals_task_service._signal_parametrization_service, "find_by_crypto_currency", mock_find_params),
-        patch.object(signals_task_service._crypto_technical_analysis_service, "get_technical_analysis", mock_get_ta),
+        patch.object(signals_task_service._signals_run_context_service, "load", mock_load_signals_run_context),
         patch.object(
-            signals_task_service._crypto_technical_analysis_service, "get_candlestick_indicators", mock_get_candle
+            signals_task_service._crypto_technical_analysis_service, "get_technical_analysis_by_timeframe", mock_get_ta
         ),
         patch.object(
-            signals_task_service._push_notification_service,
-            "get_actived_subscription_by_type",
-            mock_get_active_subscriptions,
+            signals_task_service._crypto_technical_analysis_service, "get_candlestick_indicators", mock_get_candle
         ),
         patch.object(
             signals_task_service._market_signal_service, "exists_market_signal_by_timestamp", mock_exists_market_signal
@@ -159,13 +168,16 @@ async def should_evaluate_signals_and_emit_event_when_entry_signal_is_found(
 
         # Assertions
         mock_get_account_info.assert_called()
-        mock_find_all_tracked.assert_called()
-        mock_find_params.assert_called_with(crypto_currency=currency)
-        mock_get_ta.assert_called_with(symbol=tracked_currency.to_symbol(account_info))
+        mock_load_signals_run_context.assert_called_once()
+        mock_get_ta.assert_called_with(symbol=tracked_currency.to_symbol(account_info), timeframes=["15m"])
         assert mock_get_candle.call_count == 2
-        mock_get_active_subscriptions.assert_called_with(notification_type=PushNotificationTypeEnum.SIGNALS)
         mock_exists_market_signal.assert_called()
-        mock_get_trade_now_hints.assert_called()
+        mock_get_trade_now_hints.assert_any_call(
+            tracked_currency,
+            timeframe="15m",
+            signal_parametrization_item=signal_params,
+            signals_run_context=signals_run_context,
+        )
         mock_send_message.assert_called()
 
         mock_emit.assert_called()
@@ -175,3 +187,297 @@ async def should_evaluate_signals_and_emit_event_when_entry_signal_is_found(
         assert emitted_arg.short_entry is False
 
     event_emitter.remove_listener(SIGNALS_EVALUATION_RESULT_EVENT_NAME, mock_emit)
+
+
+@pytest.mark.asyncio
+async def should_isolate_slow_and_failing_symbols_when_evaluating_signals_concurrently(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    signals_task_service: SignalsTaskService = (
+        application_container.infrastructure_container().tasks_container().signals_task_service()
+    )
+    slow_currency, failing_currency, *healthy_currencies = MOCK_CRYPTO_CURRENCIES
+    account_info = AccountInfo(currency_code="USDT")
+    tracked_currencies = [
+        TrackedCryptoCurrencyItem.from_currency(currency) for currency in [slow_currency, failing_currency]
+    ] + [TrackedCryptoCurrencyItem.from_currency(currency) for currency in healthy_currencies]
+    ta_df = pd.DataFrame({"col1": [1, 2], "col2": [3, 4]})  # Dummy dataframe
+
+    async def get_ta_side_effect(symbol: str, timeframes: list[Timeframe]) -> dict[Timeframe, pd.DataFrame]:
+        if symbol.startswith(f"{slow_currency}/"):
+            await asyncio.sleep(10)
+        elif symbol.startswith(f"{failing_currency}/"):
+            raise ValueError(f"Unexpected error for {symbol}")
+        else:
+            await asyncio.sleep(0.1)
+        return dict.fromkeys(timeframes, ta_df)
+
+    def get_candle_side_effect(symbol, index, technical_analysis_df=None):
+        return CandleStickIndicators(
+            symbol=symbol,
+            timestamp=datetime.now(UTC),
+            index=index,
+            stoch_rsi_k=0.5,
+            stoch_rsi_d=0.5,
+            closing_price=100,
+            ema50=100,
+            macd_hist=0,
+            highest_price=faker.pyfloat(),
+            lowest_price=faker.pyfloat(),
+            opening_price=faker.pyfloat(),
+            macd_line=faker.pyfloat(),
+            macd_signal=faker.pyfloat(),
+            stoch_rsi=faker.pyfloat(),
+            rsi=faker.pyfloat(),
+            atr=faker.pyfloat(),
+            relative_volume=faker.pyfloat(),
+        )
+
+    mock_get_candle = AsyncMock(side_effect=get_candle_side_effect)
+    mock_notify_fatal_error = AsyncMock()
+
+    with (
+        patch.object(signals_task_service._configuration_properties, "signals_symbol_timeout_seconds", 0.5),
+        patch.object(
+            signals_task_service._futures_exchange_service, "get_account_info", AsyncMock(return_value=account_info)
+        ),
+        patch.object(
+            signals_task_service._signals_run_context_service,
+            "load",
+            AsyncMock(return_value=SignalsRunContext(tracked_crypto_currencies=tracked_currencies)),
+        ),
+        patch.object(
+            signals_task_service._crypto_technical_analysis_service,
+            "get_technical_analysis_by_timeframe",
+            AsyncMock(side_effect=get_ta_side_effect),
+        ),
+        patch.object(
+            signals_task_service._crypto_technical_analysis_service, "get_candlestick_indicators", mock_get_candle
+        ),
+        patch.object(signals_task_service, "_notify_fatal_error_via_telegram", mock_notify_fatal_error),
+    ):
+        started_at = asyncio.get_running_loop().time()
+        await signals_task_service._run()
+        elapsed = asyncio.get_running_loop().time() - started_at
+
+        # Slow symbol is cut by the per-symbol timeout, healthy ones run concurrently
+        assert elapsed < 0.5 + 0.1 * len(healthy_currencies)
+        evaluated_symbols = {call.kwargs["symbol"] for call in mock_get_candle.call_args_list}
+        assert evaluated_symbols == {
+            TrackedCryptoCurrencyItem.from_currency(currency).to_symbol(account_info) for currency in healthy_currencies
+        }
+        # Both the timeout and the failure are notified, but they do not abort the cycle
+        assert mock_notify_fatal_error.call_count == 2
+
+
+@pytest.mark.asyncio
+async def should_only_evaluate_signals_once_per_closed_candle_when_running_on_candle_close(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    signals_task_service: SignalsTaskService = (
+        application_container.infrastructure_container().tasks_container().signals_task_service()
+    )
+    evaluated_currency, pending_currency, *_ = MOCK_CRYPTO_CURRENCIES
+    account_info = AccountInfo(currency_code="USDT")
+    tracked_currencies = [
+        TrackedCryptoCurrencyItem.from_currency(currency) for currency in [evaluated_currency, pending_currency]
+    ]
+    ta_df = pd.DataFrame({"col1": [1, 2], "col2": [3, 4]})  # Dummy dataframe
+    last_closed_candle_at = datetime.now(UTC)
+
+    def get_candle_side_effect(symbol, index, technical_analysis_df=None):
+        return CandleStickIndicators(
+            symbol=symbol,
+            timestamp=last_closed_candle_at,
+            index=index,
+            stoch_rsi_k=0.5,
+            stoch_rsi_d=0.5,
+            closing_price=100,
+            ema50=100,
+            macd_hist=0,
+            highest_price=faker.pyfloat(),
+            lowest_price=faker.pyfloat(),
+            opening_price=faker.pyfloat(),
+            macd_line=faker.pyfloat(),
+            macd_signal=faker.pyfloat(),
+            stoch_rsi=faker.pyfloat(),
+            rsi=faker.pyfloat(),
+            atr=faker.pyfloat(),
+            relative_volume=faker.pyfloat(),
+        )
+
+    mock_get_ta = AsyncMock(return_value={"15m": ta_df})
+
+    with (
+        patch.object(signals_task_service._configuration_properties, "signals_run_on_candle_close", True),
+        patch.dict(
+            signals_task_service._last_evaluated_candle_timestamps,
+            # XXX: The latest closed candle has already been evaluated for this crypto currency
+            {(evaluated_currency, "15m"): int(datetime.now(UTC).timestamp() * 1000)},
+            clear=True,
+        ),
+        patch.object(
+            signals_task_service._futures_exchange_service, "get_account_info", AsyncMock(return_value=account_info)
+        ),
+        patch.object(
+            signals_task_service._signals_run_context_service,
+            "load",
+            AsyncMock(return_value=SignalsRunContext(tracked_crypto_currencies=tracked_currencies)),
+        ),
+        patch.object(
+            signals_task_service._crypto_technical_analysis_service, "get_technical_analysis_by_timeframe", mock_get_ta
+        ),
+        patch.object(
+            signals_task_service._crypto_technical_analysis_service,
+            "get_candlestick_indicators",
+            AsyncMock(side_effect=get_candle_side_effect),
+        ),
+    ):
+        await signals_task_service._run()
+
+        mock_get_ta.assert_called_once_with(
+            symbol=TrackedCryptoCurrencyItem.from_currency(pending_currency).to_symbol(account_info), timeframes=["15m"]
+        )
+        assert signals_task_service._last_evaluated_candle_timestamps[(pending_currency, "15m")] == int(
+            last_closed_candle_at.timestamp() * 1000
+        )
+
+        # Same candle is not evaluated twice on the next run
+        mock_get_ta.reset_mock()
+        await signals_task_service._run()
+        mock_get_ta.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def should_count_overruns_and_skipped_fires_of_the_signals_job(test_environment: tuple[Container, ...]) -> None:
+    application_container, *_ = test_environment
+    signals_task_service: SignalsTaskService = (
+        application_container.infrastructure_container().tasks_container().signals_task_service()
+    )
+    job_id = SignalsTaskService.__name__
+    # XXX: The job fires every minute, so a run scheduled 3 minutes ago has overrun the next fire
+    scheduled_run_time = datetime.now(UTC).replace(second=0, microsecond=0) - timedelta(minutes=3)
+
+    with (
+        patch.object(signals_task_service, "_run_stats", TaskRunStats()),
+        patch.object(signals_task_service, "_last_scheduled_run_time", None),
+        patch.object(signals_task_service, "_run", AsyncMock()),
+    ):
+        signals_task_service._on_job_event(
+            JobSubmissionEvent(EVENT_JOB_SUBMITTED, job_id, "default", [scheduled_run_time])
+        )
+        await signals_task_service.run()
+
+        run_stats = signals_task_service.get_run_stats()
+        assert run_stats.runs == 1
+        assert run_stats.overruns == 1
+        assert run_stats.last_run_overran
+        assert run_stats.last_lateness_seconds >= 3 * 60
+
+        # Fire while the previous run was still in progress
+        signals_task_service._on_job_event(
+            JobSubmissionEvent(EVENT_JOB_MAX_INSTANCES, job_id, "default", [scheduled_run_time + timedelta(minutes=1)])
+        )
+        assert run_stats.skipped == 1
+        # One fire in between has been coalesced by the scheduler
+        signals_task_service._on_job_event(
+            JobSubmissionEvent(EVENT_JOB_SUBMITTED, job_id, "default", [scheduled_run_time + timedelta(minutes=3)])
+        )
+        assert run_stats.skipped == 2
+        # Events of any other job are ignored
+        signals_task_service._on_job_event(
+            JobSubmissionEvent(EVENT_JOB_MAX_INSTANCES, "AnotherTaskService", "default", [scheduled_run_time])
+        )
+        assert run_stats.skipped == 2
+        # Missed fires are notified by the scheduler to the listener registered once, at construction time
+        signals_task_service._scheduler._dispatch_event(
+            JobExecutionEvent(EVENT_JOB_MISSED, job_id, "default", scheduled_run_time + timedelta(minutes=4))
+        )
+        assert run_stats.skipped == 3
+
+
+@pytest.mark.asyncio
+async def should_skip_crypto_currencies_evaluated_moments_ago_within_the_coalescing_window(
+    faker: Faker, test_environment: tuple[Container, ...]
+) -> None:
+    application_container, *_ = test_environment
+    signals_task_service: SignalsTaskService = (
+        application_container.infrastructure_container().tasks_container().signals_task_service()
+    )
+    currency = faker.random_element(MOCK_CRYPTO_CURRENCIES)
+    account_info = AccountInfo(currency_code="USDT")
+    ta_df = pd.DataFrame({"col1": [1, 2], "col2": [3, 4]})  # Dummy dataframe
+    # XXX: The candle which has just been closed
+    now = datetime.now(UTC)
+    last_closed_candle_at = now.replace(minute=now.minute - now.minute % 15, second=0, microsecond=0) - timedelta(
+        minutes=15
+    )
+
+    def get_candle_side_effect(symbol, index, technical_analysis_df=None):
+        return CandleStickIndicators(
+            symbol=symbol,
+            timestamp=last_closed_candle_at,
+            index=index,
+            stoch_rsi_k=0.5,
+            stoch_rsi_d=0.5,
+            closing_price=100,
+            ema50=100,
+            macd_hist=0,
+            highest_price=faker.pyfloat(),
+            lowest_price=faker.pyfloat(),
+            opening_price=faker.pyfloat(),
+            macd_line=faker.pyfloat(),
+            macd_signal=faker.pyfloat(),
+            stoch_rsi=faker.pyfloat(),
+            rsi=faker.pyfloat(),
+            atr=faker.pyfloat(),
+            relative_volume=faker.pyfloat(),
+        )
+
+    mock_get_ta = AsyncMock(return_value={"15m": ta_df})
+
+    with (
+        patch.object(signals_task_service._configuration_properties, "signals_coalescing_window_seconds", 60),
+        patch.object(signals_task_service, "_run_stats", TaskRunStats()),
+        patch.dict(signals_task_service._last_evaluated_candle_timestamps, clear=True),
+        patch.dict(signals_task_service._last_evaluated_at, clear=True),
+        patch.object(
+            signals_task_service._futures_exchange_service, "get_account_info", AsyncMock(return_value=account_info)
+        ),
+        patch.object(
+            signals_task_service._signals_run_context_service,
+            "load",
+            AsyncMock(
+                return_value=SignalsRunContext(
+                    tracked_crypto_currencies=[TrackedCryptoCurrencyItem.from_currency(currency)]
+                )
+            ),
+        ),
+        patch.object(
+            signals_task_service._crypto_technical_analysis_service, "get_technical_analysis_by_timeframe", mock_get_ta
+        ),
+        patch.object(
+            signals_task_service._crypto_technical_analysis_service,
+            "get_candlestick_indicators",
+            AsyncMock(side_effect=get_candle_side_effect),
+        ),
+    ):
+        await signals_task_service._run()
+        mock_get_ta.assert_called_once()
+
+        # Same candle evaluated moments ago
+        mock_get_ta.reset_mock()
+        await signals_task_service._run()
+        mock_get_ta.assert_not_called()
+
+        # The window is widened to the duration of the last run, when it overran
+        signals_task_service._configuration_properties.signals_coalescing_window_seconds = 0
+        await signals_task_service._run()
+        mock_get_ta.assert_called_once()
+        signals_task_service._run_stats.last_run_overran = True
+        signals_task_service._run_stats.last_duration_seconds = 60
+        mock_get_ta.reset_mock()
+        await signals_task_service._run()
+        mock_get_ta.assert_not_called()